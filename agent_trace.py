@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+에이전트 턴 단위 추적(trace)과 비용 집계
+
+ComputerUseAgent가 턴마다 모델 호출/액션/스크린샷/페이지 안정화 시간과
+usage_metadata 토큰 수를 이벤트로 남깁니다. 이벤트는 JSONL 파일에 한 줄씩 쓰거나
+hook 함수로 받을 수 있습니다.
+
+요약:
+    python agent_trace.py output/agent_trace.jsonl
+    python agent_trace.py output/agent_trace.jsonl --input-price 1.25 --output-price 10
+"""
+
+import argparse
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+# 단계별 소요 시간 필드 (초)
+PHASES = ('rate_wait', 'model', 'action', 'settle', 'screenshot')
+
+# 100만 토큰당 가격(USD) - Gemini 2.5 Computer Use preview, 프롬프트 200k 토큰 이하 기준
+INPUT_PRICE_PER_MILLION = 1.25
+OUTPUT_PRICE_PER_MILLION = 10.0
+# 다른 모델을 쓰는 이벤트(mode)별 (입력, 출력) 가격 - 텍스트 모드는 Flash-Lite, 최종 답 재요청은 Flash
+MODE_PRICES = {
+    'text': (0.10, 0.40),
+    'finalize': (0.30, 2.50),
+}
+
+
+def usage_tokens(response) -> Dict[str, int]:
+    """GenerateContentResponse.usage_metadata에서 토큰 수 추출 (없는 값은 0)"""
+    usage = getattr(response, 'usage_metadata', None)
+
+    def count(name):
+        return int(getattr(usage, name, None) or 0) if usage is not None else 0
+
+    return {
+        'prompt_tokens': count('prompt_token_count'),
+        'output_tokens': count('candidates_token_count'),
+        'thoughts_tokens': count('thoughts_token_count'),
+        'cached_tokens': count('cached_content_token_count'),
+        'total_tokens': count('total_token_count'),
+    }
+
+
+def token_cost(event: Dict, input_price: float = INPUT_PRICE_PER_MILLION,
+               output_price: float = OUTPUT_PRICE_PER_MILLION) -> float:
+    """이벤트의 토큰 수로 비용(USD) 계산 - 사고(thinking) 토큰은 출력 토큰으로 과금"""
+    if event.get('mode') in MODE_PRICES:
+        input_price, output_price = MODE_PRICES[event['mode']]
+    output_tokens = event.get('output_tokens', 0) + event.get('thoughts_tokens', 0)
+    return (event.get('prompt_tokens', 0) * input_price + output_tokens * output_price) / 1_000_000
+
+
+class TurnTracer:
+    """
+    턴 이벤트 기록기 - 여러 에이전트(스레드)가 공유할 수 있습니다.
+
+    이벤트 종류:
+        turn: 턴 1회 (단계별 시간, 토큰 수, 액션 이름, 스크린샷 크기)
+        task: 작업 1건 종료 (턴 수, 총 시간/토큰, 결과)
+    """
+
+    def __init__(self, path: Optional[str] = None, hook: Optional[Callable[[Dict], None]] = None):
+        """
+        Args:
+            path: 이벤트를 추가할 JSONL 파일 경로 (None이면 파일에 쓰지 않음)
+            hook: 이벤트 dict를 받는 함수 (선택)
+        """
+        self.path = path
+        self.hook = hook
+        self._lock = threading.Lock()
+        self._file = None
+        if path:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self._file = open(path, 'a', encoding='utf-8')
+
+    def new_task_id(self) -> str:
+        return uuid.uuid4().hex[:12]
+
+    def emit(self, event: Dict):
+        """이벤트 1개 기록 (ts 자동 추가)"""
+        event = {'ts': round(time.time(), 3), **event}
+        with self._lock:
+            if self._file:
+                self._file.write(json.dumps(event, ensure_ascii=False) + '\n')
+                self._file.flush()
+        if self.hook:
+            self.hook(event)
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def load_events(path: str) -> List[Dict]:
+    """JSONL 추적 파일 읽기 (깨진 줄은 건너뜀)"""
+    events = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return events
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """최근접 순위(nearest-rank) 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(events: List[Dict], input_price: float = INPUT_PRICE_PER_MILLION,
+              output_price: float = OUTPUT_PRICE_PER_MILLION) -> Dict:
+    """
+    턴/작업 이벤트 집계
+
+    Returns:
+        phases: 단계별 {'p50', 'p95', 'total'} (초)
+        turns / tasks: 이벤트 수
+        tokens: 토큰 합계
+        cost_total / cost_per_company: 비용(USD) - 작업(task) 이벤트의 url 기준
+        companies: url별 {'turns', 'tokens', 'cost', 'result'}
+    """
+    turns = [e for e in events if e.get('type') == 'turn']
+    phases = {}
+    for phase in PHASES:
+        values = [e.get(f'{phase}_s', 0.0) for e in turns]
+        phases[phase] = {
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'total': sum(values),
+        }
+
+    tokens = defaultdict(int)
+    companies = {}
+    turn_task = {}
+    for event in turns:
+        for key in ('prompt_tokens', 'output_tokens', 'thoughts_tokens', 'total_tokens'):
+            tokens[key] += event.get(key, 0)
+        task = companies.setdefault(event.get('url') or event.get('task_id'),
+                                    {'turns': 0, 'tokens': 0, 'cost': 0.0, 'result': '', 'tasks': set()})
+        task['turns'] += 1
+        task['tokens'] += event.get('total_tokens', 0)
+        task['cost'] += token_cost(event, input_price, output_price)
+        task['tasks'].add(event.get('task_id'))
+        turn_task[event.get('task_id')] = task
+
+    task_events = [e for e in events if e.get('type') == 'task']
+    for event in task_events:
+        task = turn_task.get(event.get('task_id'))
+        if task is not None:
+            task['result'] = event.get('result', '')
+
+    for task in companies.values():
+        task['tasks'] = len(task['tasks'])
+
+    cost_total = sum(task['cost'] for task in companies.values())
+    return {
+        'turns': len(turns),
+        'tasks': len(task_events),
+        'phases': phases,
+        'tokens': dict(tokens),
+        'screenshot_bytes': sum(e.get('screenshot_bytes', 0) for e in turns if e.get('screenshot_sent')),
+        'blocked_requests': sum(e.get('blocked_requests', 0) for e in task_events),
+        'max_saved_turns': sum(e.get('max_saved_turns', 0) for e in task_events),
+        'cost_total': cost_total,
+        'cost_per_company': cost_total / len(companies) if companies else 0.0,
+        'turns_per_company': len(turns) / len(companies) if companies else 0.0,
+        'companies': companies,
+    }
+
+
+def print_summary(summary: Dict, top: int = 10):
+    print(f"\n{'='*80}")
+    print(f"📊 에이전트 추적 요약: 턴 {summary['turns']}개, 작업 {summary['tasks']}개, "
+          f"업체 {len(summary['companies'])}개")
+    print(f"{'='*80}")
+    print(f"{'단계':<12} {'p50(s)':>9} {'p95(s)':>9} {'합계(s)':>10}")
+    for phase, stats in summary['phases'].items():
+        print(f"{phase:<12} {stats['p50']:>9.2f} {stats['p95']:>9.2f} {stats['total']:>10.1f}")
+
+    tokens = summary['tokens']
+    print(f"\n토큰: 입력 {tokens.get('prompt_tokens', 0):,}, 출력 {tokens.get('output_tokens', 0):,}, "
+          f"사고 {tokens.get('thoughts_tokens', 0):,} (합계 {tokens.get('total_tokens', 0):,})")
+    print(f"전송 스크린샷: {summary['screenshot_bytes']:,} bytes, 차단한 요청: {summary['blocked_requests']:,}개")
+    print(f"비용: 총 ${summary['cost_total']:.4f}, 업체당 ${summary['cost_per_company']:.4f}, "
+          f"업체당 턴 {summary['turns_per_company']:.1f}, 루프 가드로 최대 절약 턴 {summary['max_saved_turns']}개")
+
+    if summary['companies'] and top:
+        print(f"\n비용 상위 {top}개 업체:")
+        ranked = sorted(summary['companies'].items(), key=lambda item: item[1]['cost'], reverse=True)
+        for url, stats in ranked[:top]:
+            print(f"  ${stats['cost']:.4f}  턴 {stats['turns']:>2}  {stats['result'] or '-':<9} {url}")
+    print(f"{'='*80}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에이전트 추적(JSONL) 요약")
+    parser.add_argument('path', nargs='?', default='output/agent_trace.jsonl')
+    parser.add_argument('--input-price', type=float, default=INPUT_PRICE_PER_MILLION,
+                        help="100만 입력 토큰당 가격(USD)")
+    parser.add_argument('--output-price', type=float, default=OUTPUT_PRICE_PER_MILLION,
+                        help="100만 출력 토큰당 가격(USD)")
+    parser.add_argument('--top', type=int, default=10, help="비용 상위 업체 출력 수")
+    parser.add_argument('--json', action='store_true', help="요약을 JSON으로 출력")
+    args = parser.parse_args()
+
+    summary = summarize(load_events(args.path), args.input_price, args.output_price)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print_summary(summary, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+asyncio 버전 Computer Use 에이전트
+client.aio(비동기 Gemini 클라이언트)와 playwright.async_api를 사용하므로
+여러 세션이 스레드 없이 하나의 이벤트 루프와 하나의 브라우저(AsyncBrowserPool)를 공유합니다.
+
+액션 처리, 프롬프트, 스크린샷 생략 규칙, JSON 결과 형식은 ComputerUseAgent와 같습니다.
+
+사용 예:
+    results = asyncio.run(run_tasks_async([(task, url), ...], concurrency=5))
+"""
+
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+from google.genai.types import Content, Part, FunctionResponse
+from playwright.async_api import async_playwright
+
+from browser_pool import AsyncBrowserPool
+from computer_use_gemini import ComputerUseAgent, BULK_INPUT_CHECK_SCRIPT, SCROLL_KEYS, SEARCH_URL, FINAL_PAGE_CHARS
+from final_answer import build_finalize_contents, finalize_config
+from conversation_history import ScreenshotEncoder
+from loop_guard import PAGE_CONTACTS_SCRIPT, REPEAT_RESULT
+
+
+class AsyncComputerUseAgent(ComputerUseAgent):
+    """
+    ComputerUseAgent의 asyncio 버전
+
+    에이전트 1개는 한 번에 작업 1개를 실행합니다 (페이지/대화 상태를 가짐).
+    동시에 여러 작업을 돌리려면 세션마다 에이전트를 만들고 같은 AsyncBrowserPool을 넘기세요.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, headless: bool = True,
+                 browser_pool: Optional[AsyncBrowserPool] = None, **kwargs):
+        """
+        Args:
+            browser_pool: AsyncBrowserPool - 주어지면 풀의 브라우저에서 새 컨텍스트만 생성
+            나머지 인자는 ComputerUseAgent와 같습니다.
+        """
+        super().__init__(api_key=api_key, headless=headless, browser_pool=browser_pool, **kwargs)
+
+    async def start_browser(self):
+        """브라우저 시작"""
+        if self.browser_pool:
+            # 풀의 브라우저에서 격리된 새 컨텍스트만 생성
+            self._pool_lease = self.browser_pool.page(
+                viewport={"width": self.screen_width, "height": self.screen_height}
+            )
+            self.context, self.page = await self._pool_lease.__aenter__()
+            await self.install_resource_policy()
+            return
+
+        print("🌐 브라우저를 시작합니다...")
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.context = await self.browser.new_context(
+            viewport={"width": self.screen_width, "height": self.screen_height}
+        )
+        await self.install_resource_policy()
+        self.page = await self.context.new_page()
+        print("✅ 브라우저가 시작되었습니다.")
+
+    async def install_resource_policy(self):
+        """현재 컨텍스트에 리소스 차단 라우트 설치 (세션별 통계 초기화)"""
+        self.block_stats = await self.resource_policy.attach_async(self.context) if self.resource_policy else None
+
+    async def close_browser(self):
+        """브라우저 닫기"""
+        if self._pool_lease:
+            # 컨텍스트만 닫고 브라우저는 풀에 남겨둠
+            lease, self._pool_lease = self._pool_lease, None
+            await lease.__aexit__(None, None, None)
+            self.context = None
+            self.page = None
+            return
+
+        if self.browser:
+            print("🌐 브라우저를 닫습니다...")
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        print("✅ 브라우저가 닫혔습니다.")
+
+    async def take_screenshot(self) -> bytes:
+        """현재 화면 스크린샷 찍기"""
+        return (await self.capture_screenshot())[0]
+
+    async def capture_screenshot(self) -> Tuple[bytes, str]:
+        """현재 화면 스크린샷을 설정된 형식으로 찍기 - (바이트, MIME 타입)"""
+        if not self.page:
+            raise ValueError("브라우저가 시작되지 않았습니다.")
+        return await self.screenshot_encoder.capture_async(self.page)
+
+    async def execute_javascript(self, code: str):
+        """자바스크립트 함수 실행하는 custom tool 함수"""
+        return await self.page.evaluate(code)
+
+    async def is_bulk_input_target(self) -> bool:
+        """포커스된 요소가 한 번에 입력 가능한 텍스트 입력란인지 확인"""
+        return await self.page.evaluate(BULK_INPUT_CHECK_SCRIPT)
+
+    async def type_text(self, text: str) -> str:
+        """포커스된 요소에 텍스트 입력 ('bulk' 또는 'keys' 반환)"""
+        if self.text_input_mode == 'bulk':
+            try:
+                if await self.is_bulk_input_target():
+                    await self.page.keyboard.insert_text(text)
+                    return 'bulk'
+            except Exception as e:
+                print(f"  ⚠️ 일괄 입력 불가, 키 입력으로 전환: {e}")
+
+        for char in text:
+            await self.page.keyboard.press(char)
+            await asyncio.sleep(self.keystroke_delay)
+        return 'keys'
+
+    async def read_page_contacts(self) -> Optional[Dict[str, Any]]:
+        """현재 페이지의 보이는 텍스트와 mailto:/tel: 링크 (실패하면 None)"""
+        try:
+            return await self.page.evaluate(PAGE_CONTACTS_SCRIPT, self.loop_guard.dom_max_chars)
+        except Exception:
+            return None
+
+    async def generate(self, model: str, contents, config) -> Tuple[Any, float]:
+        """client.aio 모델 호출 - 공유 스케줄러가 있으면 이벤트 루프를 막지 않고 대기/재시도"""
+        if not self.rate_limiter:
+            return await self.client.aio.models.generate_content(model=model, contents=contents, config=config), 0.0
+        return await self.rate_limiter.call_async(self.client.aio.models.generate_content,
+                                                  model=model, contents=contents, config=config)
+
+    async def read_final_page(self) -> Optional[Dict[str, Any]]:
+        """최종 답 재요청에 쓸 현재 페이지 텍스트와 mailto:/tel: 링크 (실패하면 None)"""
+        try:
+            return await self.page.evaluate(PAGE_CONTACTS_SCRIPT, FINAL_PAGE_CHARS)
+        except Exception:
+            return None
+
+    async def finalize(self, task: str, text_response: Optional[str], outcome: str,
+                       task_id: Optional[str] = None, url: Optional[str] = None,
+                       turns_used: int = 0) -> Tuple[Optional[Dict], str]:
+        """구조화 최종 답 재요청 (1차 스크린샷 포함, 2차 텍스트만 - ComputerUseAgent.finalize와 동일)"""
+        if not self.finalize_model:
+            return self.guard_fallback(outcome)
+
+        page = await self.read_final_page()
+        try:
+            screenshot, mime_type = await self.capture_screenshot()
+        except Exception:
+            screenshot, mime_type = None, ''
+
+        error = self.final_error
+        for attempt, image in enumerate((screenshot, None)):
+            contents = build_finalize_contents(task, text_response, self.page.url, page,
+                                               image, mime_type, error)
+            started = time.perf_counter()
+            try:
+                response, waited = await self.generate(self.finalize_model, contents, finalize_config())
+            except Exception as e:
+                error = f"요청 실패: {e}"
+                print(f"⚠️ 구조화 최종 답 요청 실패: {e}")
+                continue
+            trace = self.turn_trace(task_id, url, turns_used + attempt, started, started + waited, response)
+            answer, error = self.final_answer_from(response, trace, image)
+            if answer:
+                return answer, 'finalized'
+        return self.guard_fallback(outcome)
+
+    async def salvage(self, task: str, text_response: Optional[str], task_id: Optional[str],
+                      url: Optional[str], turns_used: int, model_failed: bool) -> Tuple[Optional[Dict], str]:
+        """오류로 중단된 탐색에서 연락처 건지기 (ComputerUseAgent.salvage와 동일)"""
+        if not self.page_alive():
+            return None, 'error'
+        self.final_error = ''
+        if not model_failed:
+            return await self.finalize(task, text_response, 'error', task_id, url, turns_used)
+        if self.loop_guard and not self.loop_guard.contacts:
+            dom = await self.read_page_contacts()
+            if dom:
+                self.loop_guard.contacts = self.loop_guard.contacts_from_dom(dom, self.page.url)
+        return self.guard_fallback('error')
+
+    async def run_action(self, fname: str, args: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """액션 1개 실행 - (action_result, settled)"""
+        if fname == "open_web_browser":
+            return {"success": True, "message": "브라우저가 이미 열려 있습니다."}, False
+
+        if fname == "click_at":
+            x = self.denormalize_x(args["x"])
+            y = self.denormalize_y(args["y"])
+            await self.page.mouse.click(x, y)
+            return {"success": True, "message": f"좌표 ({x}, {y})에서 클릭했습니다."}, False
+
+        if fname == "type_text_at":
+            x = self.denormalize_x(args["x"])
+            y = self.denormalize_y(args["y"])
+            text = args["text"]
+            press_enter = args.get("press_enter", False)
+            clear_before_typing = args.get("clear_before_typing", True)
+
+            await self.page.mouse.click(x, y)
+            if clear_before_typing:
+                await self.page.keyboard.press("ControlOrMeta+A")
+                await self.page.keyboard.press("Backspace")
+            mode = await self.type_text(text)
+            if press_enter:
+                await self.page.keyboard.press("Enter")
+            return {"success": True, "message": f"좌표 ({x}, {y})에 텍스트를 입력했습니다 ({mode}): {text}"}, False
+
+        if fname == "navigate":
+            url = args["url"]
+            await self.page.goto(url)
+            return {"success": True, "message": f"{url}로 이동했습니다."}, False
+
+        if fname == "search":
+            await self.page.goto(SEARCH_URL)
+            return {"success": True, "message": "Google 검색 페이지로 이동했습니다."}, False
+
+        if fname == "scroll_document":
+            direction = args.get("direction", "down")
+            key = SCROLL_KEYS.get(direction)
+            if key:
+                await self.page.keyboard.press(key)
+            return {"success": True, "message": f"문서를 {direction} 방향으로 스크롤했습니다."}, False
+
+        if fname == "wait_5_seconds":
+            timings = await self.settler.settle_async(self.page, max_wait=5.0)
+            return {"success": True, "message": f"페이지가 안정될 때까지 {timings['total']:.1f}초 대기했습니다."}, True
+
+        if fname == "execute_javascript":
+            await self.execute_javascript(code=args["code"])
+            return {"success": True, "message": f"자바스크립트를 실행했습니다: {args['code']}"}, False
+
+        return {"success": False, "message": f"지원되지 않는 액션: {fname}"}, False
+
+    async def execute_function_calls(self, candidate) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, bool]]:
+        """Function Call 실행"""
+        results = []
+        safety_acknowledgements = {}
+        function_calls = [part.function_call for part in candidate.content.parts
+                          if hasattr(part, 'function_call') and part.function_call]
+
+        for function_call in function_calls:
+            fname = function_call.name
+            args = function_call.args
+            extra_fields = {}
+
+            print(f"  🔧 실행 중: {fname}")
+            print(f"  📋 인자: {args}")
+
+            # 화면 변화 없이 반복되는 액션은 실행하지 않음
+            if self.loop_guard and self.loop_guard.should_block(fname, args):
+                print(f"  🔁 반복 액션 차단: {fname}")
+                results.append((fname, REPEAT_RESULT))
+                continue
+
+            # Safety decision 확인
+            if 'safety_decision' in args:
+                decision = self.get_safety_confirmation(args['safety_decision'])
+                if decision == "TERMINATE":
+                    print("🛑 에이전트 루프를 종료합니다.")
+                    break
+                extra_fields["safety_acknowledgement"] = "true"
+                safety_acknowledgements[fname] = True
+
+            try:
+                action_result, settled = await self.run_action(fname, args)
+                action_result.update(extra_fields)
+
+                # 페이지 안정화 대기 (네트워크 유휴 + DOM 변경 정지)
+                timings = self.settler.last_timings if settled else await self.settler.settle_async(self.page)
+                print(f"  ⏳ 페이지 안정화 {timings['total']:.2f}초 "
+                      f"(network {timings['network']:.2f}s, dom {timings['dom']:.2f}s, visual {timings['visual']:.2f}s)")
+                print(f"  ✅ 액션 완료: {action_result.get('message', '성공')}")
+
+            except Exception as e:
+                print(f"  ❌ 오류 발생 {fname}: {e}")
+                action_result = {"error": str(e)}
+
+            results.append((fname, action_result))
+
+        return results, safety_acknowledgements
+
+    async def get_function_responses(self, results: List[Tuple[str, Dict[str, Any]]],
+                                     safety_acknowledgements: Dict[str, bool] = None) -> List[FunctionResponse]:
+        """Function Response 생성 (스크린샷 규칙은 ComputerUseAgent와 동일)"""
+        screenshot_bytes, mime_type = await self.capture_screenshot()
+        return self.build_function_responses(results, safety_acknowledgements,
+                                             screenshot_bytes, mime_type, self.page.url)
+
+    async def run_task(self, task: str, url: str = None, max_turns: int = 10,
+                       keep_last_screenshots: Optional[int] = None,
+                       screenshot_format: Optional[str] = None,
+                       screenshot_scale: Optional[float] = None) -> Optional[Dict]:
+        """Computer Use 작업 실행 및 JSON 결과 반환 (인자/결과/오류는 ComputerUseAgent.run_task와 같음)"""
+        default_encoder = self.screenshot_encoder
+        if screenshot_format or screenshot_scale:
+            self.screenshot_encoder = ScreenshotEncoder(
+                screenshot_format or default_encoder.image_format,
+                default_encoder.quality,
+                screenshot_scale or default_encoder.scale
+            )
+        if keep_last_screenshots is None:
+            keep_last_screenshots = self.keep_last_screenshots
+
+        task_id = self.tracer.new_task_id() if self.tracer else None
+        task_started = time.perf_counter()
+        turns_used = 0
+        outcome = 'no_answer'
+        text_response = None
+        calling_model = False
+
+        try:
+            await self.start_browser()
+            await self.page.goto(url or SEARCH_URL)
+
+            # 초기 스크린샷 (화면 변화 감지 기준 프레임)
+            screenshot, mime_type = await self.capture_screenshot()
+            history = self.start_history(task, screenshot, mime_type, keep_last_screenshots)
+            contents = history.contents
+            config = self.create_computer_use_config()
+
+            print(f"🎯 작업 시작: {task}")
+
+            for turn in range(max_turns):
+                print(f"\n--- 턴 {turn + 1} ---")
+
+                # 모델에 요청 보내기 - 공유 스케줄러 대기/재시도는 asyncio.sleep (이벤트 루프를 막지 않음)
+                turns_used = turn + 1
+                started = time.perf_counter()
+                calling_model = True
+                response, waited = await self.generate(self.model_name, contents, config)
+                calling_model = False
+                trace = self.turn_trace(task_id, url, turn, started, started + waited, response)
+
+                candidate = response.candidates[0]
+                history.append(candidate.content)
+                response_text = self.response_text(candidate)
+
+                if not self.has_function_calls(candidate):
+                    text_response = response_text
+                    print(f"🎯 작업 완료! 최종 응답: {text_response}")
+                    self._trace(dict(trace, final=True))
+                    break
+
+                settle_before = self.settler.total_wait
+                started = time.perf_counter()
+                results, safety_acknowledgements = await self.execute_function_calls(candidate)
+                settle_s = self.settler.total_wait - settle_before
+
+                captured = time.perf_counter()
+                function_responses = await self.get_function_responses(results, safety_acknowledgements)
+                self.record_action_trace(trace, results, started, captured, settle_s)
+
+                # 루프 가드 - 페이지에 연락처가 보이면 마무리 요청, 반복/정체 시 경고
+                dom = await self.read_page_contacts() if self.needs_dom_check() else None
+                guard_note = self.guard_turn(results, dom)
+
+                parts = [Part(function_response=fr) for fr in function_responses]
+                if guard_note:
+                    parts.append(Part(text=guard_note))
+                history.append(Content(role="user", parts=parts))
+
+                if self.loop_guard and self.loop_guard.stop_reason:
+                    print(f"🛑 루프 가드: 에이전트 루프를 종료합니다 ({self.loop_guard.stop_reason})")
+                    break
+
+                if turn == max_turns - 1:
+                    print("⚠️ 최대 턴 수에 도달했습니다.")
+
+            result, outcome = self.finish_task(text_response, max_turns, turns_used)
+            if result is None:
+                result, outcome = await self.finalize(task, text_response, outcome, task_id, url, turns_used)
+            return result
+
+        except Exception as e:
+            outcome = 'error'
+            print(f"❌ 작업 실행 중 오류 발생: {str(e)}")
+            if turns_used:
+                try:
+                    result, outcome = await self.salvage(task, text_response, task_id, url, turns_used,
+                                                         calling_model)
+                except Exception as salvage_error:
+                    result, outcome = None, 'error'
+                    print(f"⚠️ 연락처 건지기 실패: {salvage_error}")
+                if result and (result.get('contact_email') or result.get('contact_call')):
+                    return result
+                outcome = 'error'
+            raise
+        finally:
+            if task_id:
+                self._trace(self.task_trace(task_id, url, turns_used, task_started, outcome))
+            self.screenshot_encoder = default_encoder
+            await self.close_browser()
+
+
+async def run_tasks_async(jobs: List[Tuple[str, str]], concurrency: int = 5, max_turns: int = 15,
+                          browser_pool: Optional[AsyncBrowserPool] = None,
+                          **agent_kwargs) -> List[Optional[Dict]]:
+    """
+    여러 (task, url) 작업을 하나의 이벤트 루프와 브라우저 풀에서 동시에 실행
+
+    Args:
+        jobs: (task, url) 목록
+        concurrency: 동시에 실행할 세션 수 (세션마다 에이전트 1개, 브라우저 컨텍스트 1개)
+        browser_pool: 공유할 AsyncBrowserPool (없으면 브라우저 1개짜리 풀을 만들고 끝나면 닫음)
+        agent_kwargs: AsyncComputerUseAgent에 전달할 인자 (rate_limiter, tracer 등)
+
+    Returns:
+        jobs 순서대로 run_task 결과 (JSON dict 또는 None - 오류로 끝난 작업도 None)
+    """
+    own_pool = browser_pool is None
+    pool = browser_pool or AsyncBrowserPool(size=1, headless=agent_kwargs.get('headless', True))
+    agents = [AsyncComputerUseAgent(browser_pool=pool, **agent_kwargs)
+              for _ in range(max(1, min(concurrency, len(jobs))))]
+    idle = asyncio.Queue()
+    for agent in agents:
+        idle.put_nowait(agent)
+
+    async def run_one(task: str, url: str) -> Optional[Dict]:
+        agent = await idle.get()
+        try:
+            return await agent.run_task(task=task, url=url, max_turns=max_turns)
+        except Exception:
+            # 한 작업의 오류로 나머지 작업을 멈추지 않음 (오류 내용은 run_task가 출력)
+            return None
+        finally:
+            idle.put_nowait(agent)
+
+    try:
+        return await asyncio.gather(*(run_one(task, url) for task, url in jobs))
+    finally:
+        if own_pool:
+            await pool.close()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Offline end-to-end benchmark for the contact collection agent.
+
+Runs the real ComputerUseAgent (Playwright + Chromium) and process_exhibitors
+against local fixture websites (benchmarks/fixture_server.py) while the Gemini
+client is replaced by a fake that replays scripted function calls
+(benchmarks/fake_gemini.py). No network access or API key is needed, so results
+are repeatable and can be compared before/after a change.
+
+Reports companies/hour, turns/company, seconds/turn, request bytes/turn and
+peak RSS of this process and its children (the browsers).
+
+Usage:
+    python benchmarks/bench_agent.py [--sites 10] [--mode agent|pipeline|async|both]
+                                     [--workers 1] [--concurrency 5] [--latency 0.0] [--json out.json]
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+os.environ.setdefault('GEMINI_API_KEY', 'offline-benchmark')
+
+import computer_use_gemini  # noqa: E402
+import process_exhibitors  # noqa: E402
+import async_computer_use  # noqa: E402
+from browser_pool import BrowserPool  # noqa: E402
+from fake_gemini import FakeGenaiClient  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+
+computer_use_gemini.genai.Client = FakeGenaiClient
+
+
+def peak_rss_mb():
+    """Peak RSS of this process and of the largest finished child (ru_maxrss is KB on Linux)"""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return own, children
+
+
+def summarize(name, companies, found, elapsed, calls):
+    turns = len(calls)
+    bytes_sent = sum(size for _, size, _ in calls)
+    own_rss, child_rss = peak_rss_mb()
+    result = {
+        'mode': name,
+        'companies': companies,
+        'found': found,
+        'seconds': elapsed,
+        'companies_per_hour': companies / elapsed * 3600 if elapsed else 0.0,
+        'turns': turns,
+        'turns_per_company': turns / companies if companies else 0.0,
+        'seconds_per_turn': elapsed / turns if turns else 0.0,
+        'bytes_per_turn': bytes_sent / turns if turns else 0.0,
+        'peak_rss_mb': own_rss,
+        'peak_child_rss_mb': child_rss,
+    }
+    print(f"\n[{name}] {companies} companies ({found} found) in {elapsed:.1f}s")
+    print(f"  companies/hour   {result['companies_per_hour']:.0f}")
+    print(f"  turns/company    {result['turns_per_company']:.2f}")
+    print(f"  seconds/turn     {result['seconds_per_turn']:.2f}")
+    print(f"  bytes sent/turn  {result['bytes_per_turn']:.0f}")
+    print(f"  peak RSS         {own_rss:.0f} MB (children {child_rss:.0f} MB)")
+    return result
+
+
+def bench_agent(server, sites):
+    """Call ComputerUseAgent.run_task directly for every fixture site (one agent and browser reused)"""
+    FakeGenaiClient.configure(sites=server.site_table(), latency=FakeGenaiClient.latency)
+    pool = BrowserPool(size=1, headless=True)
+    agent = computer_use_gemini.ComputerUseAgent(headless=True, browser_pool=pool)
+    found = 0
+    started = time.perf_counter()
+    try:
+        for index in range(sites):
+            url = server.site_url(index)
+            task = process_exhibitors.TASK_TEMPLATE.format(website=url)
+            result = agent.run_task(task=task, url=url, max_turns=15)
+            if result and result.get('contact_email'):
+                found += 1
+    finally:
+        pool.close()
+    return summarize('agent', sites, found, time.perf_counter() - started, list(FakeGenaiClient.calls))
+
+
+def bench_async(server, sites, concurrency):
+    """Run every fixture site through AsyncComputerUseAgent sessions sharing one loop and browser"""
+    FakeGenaiClient.configure(sites=server.site_table(), latency=FakeGenaiClient.latency)
+    jobs = [(process_exhibitors.TASK_TEMPLATE.format(website=server.site_url(index)), server.site_url(index))
+            for index in range(sites)]
+    started = time.perf_counter()
+    results = asyncio.run(async_computer_use.run_tasks_async(jobs, concurrency=concurrency))
+    found = sum(1 for result in results if result and result.get('contact_email'))
+    return summarize('async', sites, found, time.perf_counter() - started, list(FakeGenaiClient.calls))
+
+
+def bench_pipeline(server, sites, workers):
+    """Run process_exhibitors (static tier + agent fallback) on a CSV of fixture sites"""
+    FakeGenaiClient.configure(sites=server.site_table(), latency=FakeGenaiClient.latency)
+    with tempfile.TemporaryDirectory() as tmp:
+        input_csv = os.path.join(tmp, 'exhibitors.csv')
+        with open(input_csv, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(['company_name', 'stand_no', 'description', 'profile_url', 'website'])
+            for index in range(sites):
+                writer.writerow([f'Fixture Company {index}', f'H{index}', '', '', server.site_url(index)])
+
+        started = time.perf_counter()
+        # The domain cache is disabled: every fixture site shares the 127.0.0.1 domain
+        df = process_exhibitors.process_exhibitors(
+            input_csv=input_csv, output_csv=os.path.join(tmp, 'detail.csv'), test_limit=None,
+            workers=workers, requests_per_minute=100000,
+            store_path=os.path.join(tmp, 'results.db'), cache_path=None
+        )
+        elapsed = time.perf_counter() - started
+        found = int((df['contact_email'].fillna('') != '').sum())
+    return summarize('pipeline', sites, found, elapsed, list(FakeGenaiClient.calls))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, default=10)
+    parser.add_argument('--mode', choices=('agent', 'pipeline', 'async', 'both'), default='both')
+    parser.add_argument('--workers', type=int, default=1, help="process_exhibitors workers (pipeline mode)")
+    parser.add_argument('--concurrency', type=int, default=5, help="concurrent sessions (async mode)")
+    parser.add_argument('--latency', type=float, default=0.0, help="simulated model latency per call (seconds)")
+    parser.add_argument('--json', help="write results to this JSON file")
+    args = parser.parse_args()
+
+    FakeGenaiClient.latency = args.latency
+    results = []
+    with FixtureServer(sites=args.sites) as server:
+        print(f"Fixture sites: {server.base_url}/site0/ .. site{args.sites - 1}/")
+        if args.mode in ('agent', 'both'):
+            results.append(bench_agent(server, args.sites))
+        if args.mode in ('pipeline', 'both'):
+            results.append(bench_pipeline(server, args.sites, args.workers))
+        if args.mode == 'async':
+            results.append(bench_async(server, args.sites, args.concurrency))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the exhibitor HTML parsers on saved listing/profile fixtures.
+
+Compares the original BeautifulSoup html.parser backend ('soup') with the fast
+backend ('fast': lxml XPath for listings, targeted scan for profile pages).
+Each backend runs in its own subprocess so peak RSS is measured in isolation.
+Outputs are checked for identity before timing.
+
+Usage:
+    python benchmarks/bench_parser.py [--iterations 20] [--fixtures benchmarks/fixtures]
+"""
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import get_gitex_company  # noqa: E402
+
+BACKENDS = ('soup', 'fast')
+
+
+def load_fixtures(fixture_dir):
+    fixtures = {'listing': [], 'profile': []}
+    for kind in fixtures:
+        for path in sorted(glob.glob(os.path.join(fixture_dir, f'{kind}_*.html'))):
+            with open(path, encoding='utf-8') as f:
+                fixtures[kind].append(f.read())
+    return fixtures
+
+
+def parse(kind, html, backend):
+    if kind == 'listing':
+        return get_gitex_company.parse_exhibitor_data(html, backend=backend)
+    return get_gitex_company.extract_official_website(html, backend=backend)
+
+
+def check_identical(fixtures):
+    """Both backends must produce the same output for every fixture"""
+    mismatches = 0
+    for kind, pages in fixtures.items():
+        for i, html in enumerate(pages, 1):
+            expected = parse(kind, html, 'soup')
+            actual = parse(kind, html, 'fast')
+            if expected != actual:
+                mismatches += 1
+                print(f"[MISMATCH] {kind}_{i}: soup={str(expected)[:120]!r} fast={str(actual)[:120]!r}")
+    return mismatches
+
+
+def run_worker(backend, kind, fixture_dir, iterations):
+    """Time one backend on one fixture kind (runs inside a subprocess)"""
+    pages = load_fixtures(fixture_dir)[kind]
+    # Warm-up (imports, regex compilation)
+    for html in pages:
+        parse(kind, html, backend)
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for html in pages:
+            parse(kind, html, backend)
+    elapsed = time.perf_counter() - started
+    _, peak_python = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = iterations * len(pages)
+    print(json.dumps({
+        'backend': backend,
+        'kind': kind,
+        'pages': count,
+        'seconds': elapsed,
+        'pages_per_sec': count / elapsed if elapsed else 0.0,
+        'peak_python_kb': peak_python / 1024,
+        # ru_maxrss is KB on Linux
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'rss_growth_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', default=os.path.join(ROOT, 'benchmarks', 'fixtures'))
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--worker', nargs=2, metavar=('BACKEND', 'KIND'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker[0], args.worker[1], args.fixtures, args.iterations)
+        return
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures['listing'] and not fixtures['profile']:
+        sys.exit(f"No fixtures in {args.fixtures} - run benchmarks/make_parser_fixtures.py first")
+    if not get_gitex_company.HAS_LXML:
+        print("[WARN] lxml is not installed - the fast listing backend falls back to html.parser")
+
+    mismatches = check_identical(fixtures)
+    print(f"Identity check: {'OK' if not mismatches else f'{mismatches} mismatches'}")
+
+    print(f"\n{'kind':<8} {'backend':<6} {'pages/sec':>10} {'peak py KB':>11} {'peak RSS KB':>12}")
+    results = {}
+    for kind in ('listing', 'profile'):
+        if not fixtures[kind]:
+            continue
+        for backend in BACKENDS:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--worker', backend, kind,
+                 '--fixtures', args.fixtures, '--iterations', str(args.iterations)],
+                check=True, capture_output=True, text=True
+            ).stdout.strip().splitlines()[-1]
+            result = json.loads(output)
+            results[(kind, backend)] = result
+            print(f"{kind:<8} {backend:<6} {result['pages_per_sec']:>10.1f} "
+                  f"{result['peak_python_kb']:>11.0f} {result['peak_rss_kb']:>12}")
+        speedup = results[(kind, 'fast')]['pages_per_sec'] / max(results[(kind, 'soup')]['pages_per_sec'], 1e-9)
+        print(f"{kind:<8} speedup x{speedup:.1f}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Measure CLI start-up and import time per command.
+
+Each case runs in a fresh interpreter (as a user would start it). For every case
+the wall time (median of --runs) is reported together with the import time from
+`python -X importtime` and the slowest top-level imports, so a regression such as
+an eager `import pandas` or `from google import genai` shows up by name.
+
+The 'light' cases (status / --dry-run) must not touch the network. The 'import'
+cases load the modules a real run of that command needs, without running it.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--top 3]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (name, argv after `python`)
+CASES = [
+    ('status', ['cli.py', 'status']),
+    ('crawl --dry-run', ['cli.py', 'crawl', '--dry-run']),
+    ('resolve --dry-run', ['cli.py', 'resolve', '--dry-run']),
+    ('extract --dry-run', ['cli.py', 'extract', '--dry-run']),
+    ('pipeline --dry-run', ['cli.py', 'pipeline', '--dry-run']),
+    ('import crawl/resolve', ['-c', 'import cli, get_gitex_company']),
+    ('import extract (resume)', ['-c', 'import cli, process_exhibitors, pandas']),
+    ('import extract (agents)', ['-c', 'import cli, process_exhibitors, pandas, browser_pool, '
+                                       'text_agent, computer_use_gemini']),
+]
+
+
+def wall_time(argv, runs):
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *argv], cwd=ROOT, check=True, capture_output=True)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def import_profile(argv):
+    """(total import seconds, [(seconds, module)] for top-level imports) from -X importtime"""
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', *argv], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stderr
+    top_level = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = (part for part in line[len('import time:'):].split('|'))
+        if not name.startswith('  '):  # indentation marks nested imports
+            top_level.append((int(cumulative) / 1e6, name.strip()))
+    return sum(seconds for seconds, _ in top_level), sorted(top_level, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=3, help="slowest top-level imports to list")
+    args = parser.parse_args()
+
+    print(f"{'case':<26} {'wall s':>7} {'import s':>9}  slowest imports")
+    for name, argv in CASES:
+        wall = wall_time(argv, args.runs)
+        imports, slowest = import_profile(argv)
+        top = ", ".join(f"{module} {seconds:.2f}" for seconds, module in slowest[:args.top])
+        print(f"{name:<26} {wall:>7.2f} {imports:>9.2f}  {top}")
+
+
+if __name__ == '__main__':
+    main()
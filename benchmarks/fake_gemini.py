@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Offline stand-in for genai.Client that replays recorded function-call scripts.
+
+A script is a list of turns. Each turn is either
+    {"calls": [{"name": "scroll_document", "args": {"direction": "down"}}, ...]}
+or a final answer
+    {"text": "{\"contact_email\": \"{email}\", \"contact_call\": \"{phone}\"}"}
+
+Placeholders {url}, {email} and {phone} are filled from the site the session
+started on (the first URL found in the initial prompt) using the `sites` table
+passed to the client. Every generate_content call records its request size so the
+benchmark can report bytes sent per turn.
+
+Requests with a response_schema (JSON mode) are answered from the prompt text instead
+of a script: the text agent's action schema gets "finish" when the site's email is
+visible in the prompt (else "give_up"), and the final-answer schema gets the contacts.
+"""
+import asyncio
+import json
+import re
+import threading
+import time
+
+from google.genai import types
+
+URL_PATTERN = re.compile(r'https?://[^\s"\'<>]+')
+
+DEFAULT_SCRIPT = [
+    {"calls": [{"name": "scroll_document", "args": {"direction": "down"}}]},
+    {"calls": [{"name": "navigate", "args": {"url": "{url}contact.html"}}]},
+    {"calls": [{"name": "scroll_document", "args": {"direction": "down"}}]},
+    {"text": "{\"contact_email\": \"{email}\", \"contact_call\": \"{phone}\"}"},
+]
+
+
+def content_size(contents):
+    """Approximate request payload size in bytes (text + inline images)"""
+    total = 0
+    for content in contents:
+        for part in content.parts or []:
+            if part.text:
+                total += len(part.text.encode('utf-8'))
+            if part.inline_data and part.inline_data.data:
+                total += len(part.inline_data.data)
+            if part.function_call:
+                total += len(json.dumps(part.function_call.args or {}, ensure_ascii=False).encode('utf-8'))
+            if part.function_response:
+                response = part.function_response
+                total += len(json.dumps(response.response or {}, ensure_ascii=False, default=str).encode('utf-8'))
+                for response_part in response.parts or []:
+                    if response_part.inline_data and response_part.inline_data.data:
+                        total += len(response_part.inline_data.data)
+    return total
+
+
+class FakeModels:
+    def __init__(self, client):
+        self._client = client
+
+    def generate_content(self, model, contents, config=None):
+        return self._client._generate(model, contents, config)
+
+
+class FakeAsyncModels:
+    def __init__(self, client):
+        self._client = client
+
+    async def generate_content(self, model, contents, config=None):
+        if self._client.latency:
+            await asyncio.sleep(self._client.latency)
+        return self._client._generate(model, contents, config, simulate_latency=False)
+
+
+class FakeAio:
+    def __init__(self, client):
+        self.models = FakeAsyncModels(client)
+
+
+class FakeGenaiClient:
+    """Drop-in replacement for genai.Client(api_key=...) used by ComputerUseAgent (and .aio for the async agent)"""
+
+    # Shared configuration (set by the benchmark driver before agents are created)
+    scripts = {}
+    sites = {}
+    latency = 0.0
+
+    # One entry per generate_content call across all clients: (session_url, request_bytes, turn)
+    calls = []
+    _lock = threading.Lock()
+
+    def __init__(self, api_key=None, **kwargs):
+        self.vertexai = False
+        self.models = FakeModels(self)
+        self.aio = FakeAio(self)
+
+    @classmethod
+    def configure(cls, scripts=None, sites=None, latency=0.0):
+        cls.scripts = scripts or {}
+        cls.sites = sites or {}
+        cls.latency = latency
+        with cls._lock:
+            cls.calls = []
+
+    def _script_for(self, url):
+        for prefix, script in self.scripts.items():
+            if prefix != 'default' and url.startswith(prefix):
+                return script
+        return self.scripts.get('default', DEFAULT_SCRIPT)
+
+    def _session_url(self, contents):
+        first_text = " ".join(part.text for part in contents[0].parts if part.text)
+        match = URL_PATTERN.search(first_text)
+        url = match.group().rstrip('.,)') if match else ''
+        if url in self.sites:
+            return url
+        # Sub-pages (e.g. the text agent's current page) belong to the longest matching site
+        prefixes = [site for site in self.sites if url.startswith(site)]
+        return max(prefixes, key=len) if prefixes else url
+
+    def _json_answer(self, contents, config, site):
+        """Answer a JSON-mode request from the prompt text (no script)"""
+        prompt = " ".join(part.text for content in contents for part in content.parts or [] if part.text)
+        email, phone = site.get('email', ''), site.get('phone', '')
+        visible = bool(email) and email in prompt
+        properties = config.response_schema.properties or {}
+        if 'action' in properties:
+            answer = ({'action': 'finish', 'contact_email': email, 'contact_call': phone} if visible
+                      else {'action': 'give_up', 'reason': 'contacts not in page text'})
+        else:
+            answer = {'contact_email': email if visible else '', 'contact_call': phone if visible else '',
+                      'confidence': 0.9 if visible else 0.1, 'source_url': site.get('url', '')}
+        return [types.Part(text=json.dumps(answer))]
+
+    def _generate(self, model, contents, config, simulate_latency=True):
+        if simulate_latency and self.latency:
+            time.sleep(self.latency)
+
+        # The turn number is the number of model replies already in the conversation
+        turn = sum(1 for content in contents if content.role == 'model')
+        url = self._session_url(contents)
+        with self._lock:
+            FakeGenaiClient.calls.append((url, content_size(contents), turn))
+
+        script = self._script_for(url)
+        step = script[min(turn, len(script) - 1)]
+        site = self.sites.get(url, {})
+        values = {'url': url, 'email': site.get('email', ''), 'phone': site.get('phone', '')}
+
+        def fill(value):
+            if isinstance(value, str):
+                for name, replacement in values.items():
+                    value = value.replace('{' + name + '}', replacement)
+                return value
+            if isinstance(value, dict):
+                return {k: fill(v) for k, v in value.items()}
+            return value
+
+        if config is not None and getattr(config, 'response_schema', None) is not None:
+            parts = self._json_answer(contents, config, dict(site, url=url))
+        elif 'calls' in step:
+            parts = [types.Part(function_call=types.FunctionCall(name=call['name'], args=fill(call.get('args', {}))))
+                     for call in step['calls']]
+        else:
+            parts = [types.Part(text=fill(step['text']))]
+
+        prompt_tokens = content_size(contents) // 4
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role='model', parts=parts))],
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=20,
+                total_token_count=prompt_tokens + 20,
+            ),
+        )
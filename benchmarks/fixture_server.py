@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Local HTTP server that serves generated exhibitor fixture websites.
+
+Each site lives under /site<N>/ with index.html and contact.html. Half of the
+sites put their contact details in plain HTML (the static extractor finds them);
+the other half render them with JavaScript so only a browser agent can see them.
+Pages also pull in a slow third-party style script and an autoplay video to
+mimic real sites.
+
+Usage:
+    python benchmarks/fixture_server.py --sites 20 --port 8765
+"""
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>body{{font-family:sans-serif;margin:0}} header,footer{{background:#eee;padding:20px}} .hero{{height:1200px}}</style>
+<script src="/static/slow-tracker.js" async></script>
+</head><body>
+<header><nav><a href="/site{index}/">Home</a> | <a href="/site{index}/contact.html">Contact us</a></nav></header>
+<section class="hero"><h1>{title}</h1><p>We build enterprise solutions for the region.</p>
+<video src="/static/promo.mp4" autoplay muted loop width="640"></video></section>
+{body}
+<footer>{footer}</footer>
+</body></html>"""
+
+
+def site_contacts(index):
+    return {
+        'email': f'partnerships@site{index}.example',
+        'phone': f'+971 4 555 {index:04d}',
+    }
+
+
+def render_page(index, page):
+    contacts = site_contacts(index)
+    dynamic = index % 2 == 1
+    if dynamic:
+        # Contact details only exist after JavaScript runs
+        details = (f"<div id='c'></div><script>document.getElementById('c').innerHTML="
+                   f"'Email: ' + ['{contacts['email'].split('@')[0]}', '{contacts['email'].split('@')[1]}'].join('@')"
+                   f" + ' Tel: {contacts['phone']}';</script>")
+    else:
+        details = (f"<p>Email: <a href='mailto:{contacts['email']}'>{contacts['email']}</a></p>"
+                   f"<p>Tel: <a href='tel:{contacts['phone'].replace(' ', '')}'>{contacts['phone']}</a></p>")
+    body = details if page == 'contact' else "<section><p>Solutions, products and services.</p></section>"
+    footer = f"&copy; Site {index}" + (f" &middot; {details}" if page == 'index' and not dynamic else '')
+    return PAGE.format(title=f"Exhibitor Site {index}", index=index, body=body, footer=footer)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    slow_script_delay = 0.5
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8'):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if path == '/static/promo.mp4':
+            threading.Event().wait(self.slow_script_delay)
+            data = b'\x00' * 512 * 1024
+            self.send_response(200)
+            self.send_header('Content-Type', 'video/mp4')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        if path == '/static/slow-tracker.js':
+            threading.Event().wait(self.slow_script_delay)
+            return self._send(200, "window.__tracked = true;", 'application/javascript')
+
+        parts = [p for p in path.split('/') if p]
+        if not parts or not parts[0].startswith('site') or not parts[0][4:].isdigit():
+            return self._send(404, "<h1>Not found</h1>")
+        index = int(parts[0][4:])
+        page = parts[1] if len(parts) > 1 else 'index.html'
+        if page in ('index.html', ''):
+            return self._send(200, render_page(index, 'index'))
+        if page in ('contact.html', 'contact', 'contact-us'):
+            return self._send(200, render_page(index, 'contact'))
+        return self._send(404, "<h1>Not found</h1>")
+
+
+class FixtureServer:
+    """Runs the fixture server on a background thread"""
+
+    def __init__(self, port=0, sites=20):
+        self.sites = sites
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), FixtureHandler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def site_url(self, index):
+        return f"{self.base_url}/site{index}/"
+
+    def site_table(self):
+        """{site_url: {'email', 'phone'}} for the fake Gemini client"""
+        return {self.site_url(i): site_contacts(i) for i in range(self.sites)}
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve fixture exhibitor websites")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--sites', type=int, default=20)
+    args = parser.parse_args()
+    with FixtureServer(port=args.port, sites=args.sites) as server:
+        print(f"Serving {args.sites} fixture sites at {server.base_url}/site0/ ... (Ctrl+C to stop)")
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Generate listing/profile HTML fixtures for bench_parser.py from output/gitex_exhibitors.csv.
+
+The markup mirrors the GITEX exhibitor pages the crawler parses (listing items,
+stand paragraph, description span, ExbDetails link, li.social_website) and adds
+the noise real pages carry: scripts, navigation, entities and social links.
+
+Usage:
+    python benchmarks/make_parser_fixtures.py
+"""
+import csv
+import html
+import os
+import sys
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+SOURCE_CSV = os.path.join(ROOT, 'output', 'gitex_exhibitors.csv')
+
+LISTING_PAGES = 2
+LISTING_BATCH = 50
+PROFILE_PAGES = 5
+
+NOISE_SCRIPT = "<script>window.dataLayer=window.dataLayer||[];function gtag(){dataLayer.push(arguments);}" \
+               "var s='<li class=\"fake\">';</script>\n"
+
+NAV = "".join(f'<li class="nav-item"><a class="nav-link" href="/gitex-global-2025/page{i}">Menu {i}</a></li>'
+              for i in range(40))
+
+
+def _stable_id(text):
+    return zlib.crc32(text.encode('utf-8'))
+
+
+def listing_item(row):
+    name = html.escape(row['company_name'])
+    stand = html.escape(row['stand_no'])
+    description = html.escape(row['description']).replace('\n', '<br>\n')
+    profile = html.escape(row['profile_url'])
+    return f"""
+<div class="item col-12 list-group-item">
+  <div class="thumbnail card">
+    <div class="img-event"><img class="group list-group-image img-fluid" src="/logo/{_stable_id(name) % 9999}.png" alt="{name}"></div>
+    <div class="caption card-body">
+      <h4 class="group card-title inner list-group-item-heading heading">
+        <a href="{profile}">{name}</a>
+      </h4>
+      <p style="margin-bottom:0;"><i class="fa fa-map-marker"></i> {stand}</p>
+      <p class="group inner list-group-item-text">
+        <span>{description}</span>
+      </p>
+      <div class="row">
+        <a class="btn btn-sm btn-outline" href="{profile}">View Profile</a>
+        <a class="btn btn-sm" href="/gitex-global-2025/Exhibitor/addFavourite?id={_stable_id(name) % 99999}">&#9734; Favourite</a>
+      </div>
+    </div>
+  </div>
+</div>"""
+
+
+def profile_page(row):
+    name = html.escape(row['company_name'])
+    website = html.escape(row['website'] or '')
+    about = html.escape(row['description']).replace('\n', '<br>\n') * 3
+    website_li = (f'<li class="social_website"><a target="_blank" href="{website}">'
+                  f'<i class="fa fa-globe"></i></a></li>') if website else ''
+    products = "".join(f'<div class="product-card"><h5>{name} product {i}</h5><p>{about[:200]}</p></div>'
+                       for i in range(30))
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{name} | GITEX GLOBAL 2025</title>
+{NOISE_SCRIPT * 20}
+<link rel="stylesheet" href="/assets/css/app.css"></head>
+<body>
+<nav><ul class="navbar-nav">{NAV}</ul></nav>
+<section class="exhibitor-profile">
+  <h1>{name}</h1>
+  <ul class="social-links">
+    <li class="social_facebook"><a href="https://facebook.com/{_stable_id(name) % 999}"><i class="fa fa-facebook"></i></a></li>
+    <li class="social_linkedin"><a href="https://linkedin.com/company/{_stable_id(name) % 999}"><i class="fa fa-linkedin"></i></a></li>
+    {website_li}
+  </ul>
+  <div class="about">{about}</div>
+  <div class="products">{products}</div>
+</section>
+<footer>{NAV}</footer>
+{NOISE_SCRIPT * 20}
+</body></html>"""
+
+
+def main():
+    with open(SOURCE_CSV, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    if len(rows) < LISTING_PAGES * LISTING_BATCH:
+        sys.exit(f"Need at least {LISTING_PAGES * LISTING_BATCH} rows in {SOURCE_CSV}")
+
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for page in range(LISTING_PAGES):
+        batch = rows[page * LISTING_BATCH:(page + 1) * LISTING_BATCH]
+        path = os.path.join(FIXTURE_DIR, f'listing_{page + 1}.html')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(listing_item(row) for row in batch))
+        print(f"Wrote {path}")
+
+    for i in range(PROFILE_PAGES):
+        # The last profile has no website link
+        row = dict(rows[i * 7])
+        if i == PROFILE_PAGES - 1:
+            row['website'] = ''
+        path = os.path.join(FIXTURE_DIR, f'profile_{i + 1}.html')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(profile_page(row))
+        print(f"Wrote {path}")
+
+
+if __name__ == '__main__':
+    main()
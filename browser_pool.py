@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+재사용 가능한 Playwright 브라우저 풀
+실행(run) 동안 Chromium을 한 번만 띄우고, 작업마다 격리된 새 컨텍스트/페이지를 제공합니다.
+
+주의: Playwright sync API는 생성한 스레드에서만 사용할 수 있으므로
+풀도 생성한 스레드 안에서만 사용해야 합니다. (스레드마다 풀 하나)
+AsyncBrowserPool은 playwright.async_api 버전으로, 한 이벤트 루프의 여러 세션이 공유합니다.
+"""
+
+import asyncio
+import itertools
+from contextlib import contextmanager, asynccontextmanager
+from typing import Optional, Dict, Any, List
+from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+
+
+class PooledBrowser:
+    """풀에 속한 브라우저 1개와 사용 횟수"""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.tasks = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.browser.is_connected()
+
+
+class BrowserPool:
+    def __init__(self, size: int = 1, headless: bool = True,
+                 max_tasks_per_browser: int = 50,
+                 context_options: Optional[Dict[str, Any]] = None):
+        """
+        브라우저 풀 초기화
+
+        Args:
+            size: 동시에 유지할 브라우저 수
+            headless: headless 모드 여부
+            max_tasks_per_browser: 이 횟수만큼 사용한 브라우저는 재시작 (메모리 누수 방지)
+            context_options: new_context()에 전달할 기본 옵션 (viewport 등)
+        """
+        self.size = size
+        self.headless = headless
+        self.max_tasks_per_browser = max_tasks_per_browser
+        self.context_options = context_options or {}
+
+        self.playwright = None
+        self.browsers: List[Optional[PooledBrowser]] = [None] * size
+        self._next = itertools.cycle(range(size))
+
+        # 통계
+        self.launch_count = 0
+        self.recycle_count = 0
+        self.task_count = 0
+
+    def start(self):
+        """Playwright 시작 (브라우저는 처음 필요할 때 실행)"""
+        if not self.playwright:
+            self.playwright = sync_playwright().start()
+        return self
+
+    def close(self):
+        """모든 브라우저와 Playwright 종료"""
+        for i, pooled in enumerate(self.browsers):
+            if pooled:
+                self._close_browser(pooled)
+                self.browsers[i] = None
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+        print(f"✅ 브라우저 풀 종료 (실행 {self.launch_count}회, 재시작 {self.recycle_count}회, 작업 {self.task_count}개)")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _launch(self) -> PooledBrowser:
+        print("🌐 풀 브라우저를 시작합니다...")
+        browser = self.playwright.chromium.launch(headless=self.headless)
+        self.launch_count += 1
+        return PooledBrowser(browser)
+
+    def _close_browser(self, pooled: PooledBrowser):
+        try:
+            pooled.browser.close()
+        except Exception:
+            pass
+
+    def _get_browser(self, slot: int) -> PooledBrowser:
+        """슬롯의 브라우저를 가져오고, 필요하면 (재)시작"""
+        pooled = self.browsers[slot]
+        if pooled and (not pooled.healthy or pooled.tasks >= self.max_tasks_per_browser):
+            self._close_browser(pooled)
+            self.recycle_count += 1
+            pooled = None
+        if not pooled:
+            pooled = self._launch()
+            self.browsers[slot] = pooled
+        return pooled
+
+    @contextmanager
+    def page(self, **context_options):
+        """
+        격리된 새 컨텍스트와 페이지를 제공합니다.
+
+        사용 예:
+            with pool.page(viewport={...}) as (context, page):
+                page.goto(url)
+        """
+        self.start()
+        slot = next(self._next)
+        pooled = self._get_browser(slot)
+        options = {**self.context_options, **context_options}
+
+        try:
+            context = pooled.browser.new_context(**options)
+        except Exception:
+            # 브라우저가 죽었으면 한 번 재시작 후 재시도
+            self._close_browser(pooled)
+            self.recycle_count += 1
+            self.browsers[slot] = None
+            pooled = self._get_browser(slot)
+            context = pooled.browser.new_context(**options)
+
+        pooled.tasks += 1
+        self.task_count += 1
+        try:
+            yield context, context.new_page()
+        finally:
+            try:
+                context.close()
+            except Exception:
+                # 작업 중 크래시 - 다음 요청 때 재시작되도록 표시
+                pooled.tasks = self.max_tasks_per_browser
+
+    @property
+    def active_browsers(self) -> int:
+        """현재 실행 중인 브라우저 수"""
+        return sum(1 for pooled in self.browsers if pooled and pooled.healthy)
+
+
+class AsyncBrowserPool:
+    """
+    BrowserPool의 asyncio 버전
+
+    같은 이벤트 루프에서 실행되는 여러 에이전트 세션이 브라우저를 공유하고,
+    세션마다 격리된 컨텍스트/페이지를 받습니다.
+    """
+
+    def __init__(self, size: int = 1, headless: bool = True,
+                 max_tasks_per_browser: int = 50,
+                 context_options: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            size: 동시에 유지할 브라우저 수 (보통 1개로 충분 - 세션은 컨텍스트로 격리)
+            headless: headless 모드 여부
+            max_tasks_per_browser: 이 횟수만큼 사용한 브라우저는 재시작 (진행 중인 세션이 끝난 뒤 닫음)
+            context_options: new_context()에 전달할 기본 옵션 (viewport 등)
+        """
+        self.size = size
+        self.headless = headless
+        self.max_tasks_per_browser = max_tasks_per_browser
+        self.context_options = context_options or {}
+
+        self.playwright = None
+        self.browsers: List[Optional[PooledBrowser]] = [None] * size
+        self._next = itertools.cycle(range(size))
+        self._lock = asyncio.Lock()
+        # 재시작 대상이지만 아직 사용 중인 브라우저 -> 열린 컨텍스트 수
+        self._in_use: Dict[int, int] = {}
+        self._retired: List[PooledBrowser] = []
+
+        # 통계
+        self.launch_count = 0
+        self.recycle_count = 0
+        self.task_count = 0
+
+    async def start(self):
+        """Playwright 시작 (브라우저는 처음 필요할 때 실행)"""
+        if not self.playwright:
+            self.playwright = await async_playwright().start()
+        return self
+
+    async def close(self):
+        """모든 브라우저와 Playwright 종료"""
+        for pooled in self._retired:
+            await self._close_browser(pooled)
+        self._retired = []
+        for i, pooled in enumerate(self.browsers):
+            if pooled:
+                await self._close_browser(pooled)
+                self.browsers[i] = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        print(f"✅ 브라우저 풀 종료 (실행 {self.launch_count}회, 재시작 {self.recycle_count}회, 작업 {self.task_count}개)")
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _launch(self) -> PooledBrowser:
+        print("🌐 풀 브라우저를 시작합니다...")
+        browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.launch_count += 1
+        return PooledBrowser(browser)
+
+    async def _close_browser(self, pooled: PooledBrowser):
+        try:
+            await pooled.browser.close()
+        except Exception:
+            pass
+
+    async def _retire(self, pooled: PooledBrowser):
+        """사용 중인 세션이 없으면 바로 닫고, 있으면 마지막 세션이 끝날 때 닫음"""
+        self.recycle_count += 1
+        if self._in_use.get(id(pooled), 0) > 0:
+            self._retired.append(pooled)
+        else:
+            await self._close_browser(pooled)
+
+    async def _get_browser(self, slot: int) -> PooledBrowser:
+        """슬롯의 브라우저를 가져오고, 필요하면 (재)시작 - 동시 실행을 막기 위해 잠금 안에서 호출"""
+        pooled = self.browsers[slot]
+        if pooled and (not pooled.healthy or pooled.tasks >= self.max_tasks_per_browser):
+            self.browsers[slot] = None
+            await self._retire(pooled)
+            pooled = None
+        if not pooled:
+            pooled = await self._launch()
+            self.browsers[slot] = pooled
+        return pooled
+
+    @asynccontextmanager
+    async def page(self, **context_options):
+        """
+        격리된 새 컨텍스트와 페이지를 제공합니다.
+
+        사용 예:
+            async with pool.page(viewport={...}) as (context, page):
+                await page.goto(url)
+        """
+        options = {**self.context_options, **context_options}
+        async with self._lock:
+            await self.start()
+            slot = next(self._next)
+            pooled = await self._get_browser(slot)
+            try:
+                context = await pooled.browser.new_context(**options)
+            except Exception:
+                # 브라우저가 죽었으면 한 번 재시작 후 재시도
+                self.browsers[slot] = None
+                await self._retire(pooled)
+                pooled = await self._get_browser(slot)
+                context = await pooled.browser.new_context(**options)
+            pooled.tasks += 1
+            self.task_count += 1
+            self._in_use[id(pooled)] = self._in_use.get(id(pooled), 0) + 1
+
+        try:
+            yield context, await context.new_page()
+        finally:
+            try:
+                await context.close()
+            except Exception:
+                pooled.tasks = self.max_tasks_per_browser
+            self._in_use[id(pooled)] -= 1
+            if not self._in_use[id(pooled)]:
+                del self._in_use[id(pooled)]
+                if pooled in self._retired:
+                    self._retired.remove(pooled)
+                    await self._close_browser(pooled)
+
+    @property
+    def active_browsers(self) -> int:
+        """현재 실행 중인 브라우저 수"""
+        return sum(1 for pooled in self.browsers if pooled and pooled.healthy)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+GITEX 연락처 수집 명령줄 도구
+
+    python cli.py crawl [--start 0] [--end N] [--no-resolve]    # 참가업체 목록 수집 (목록 끝 자동 감지)
+    python cli.py resolve [--limit N]                           # 웹사이트가 비어 있는 업체의 공식 웹사이트 확인
+    python cli.py extract [--start 0] [--limit N] [--workers 2]  # 연락처 수집 (--queue: 작업 큐 모드)
+    python cli.py pipeline [--resolve-workers 4] [--extract-workers 2]  # 크롤링 -> 웹사이트 -> 연락처 스트리밍
+    python cli.py status                                        # 단계별 진행 상황
+
+pandas, google.genai, playwright 같은 무거운 모듈은 명령이 실제로 처리할 때만 불러오므로
+status와 --dry-run(처리 대상만 계산하고 종료)은 바로 끝납니다.
+명령별 시작/모듈 로딩 시간은 benchmarks/bench_startup.py로 측정합니다.
+"""
+
+import argparse
+import csv
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from result_store import ResultStore
+from url_utils import normalize_company, normalize_website
+
+EXHIBITORS_CSV = "output/gitex_exhibitors.csv"
+DETAIL_CSV = "output/gitex_exhibitors_detail.csv"
+STORE_PATH = "output/gitex_results.db"
+HTTP_CACHE_DIR = "output/http_cache"
+TRACE_PATH = "output/agent_trace.jsonl"
+
+
+def read_rows(csv_path: str) -> List[Dict[str, str]]:
+    """업체 CSV 읽기 (csv 모듈만 사용, 파일이 없으면 빈 목록)"""
+    if not os.path.exists(csv_path):
+        return []
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        return list(csv.DictReader(f))
+
+
+def open_store(store_path: str) -> Optional[ResultStore]:
+    """결과 저장소가 있으면 열기 (상태 확인만으로 새 파일을 만들지 않음)"""
+    return ResultStore(store_path) if os.path.exists(store_path) else None
+
+
+def queue_counts(store_path: str) -> Optional[Dict[str, int]]:
+    """작업 큐(jobs 테이블) 상태별 개수 - 큐를 쓴 적이 없으면 None"""
+    import sqlite3
+
+    if not os.path.exists(store_path):
+        return None
+    with sqlite3.connect(store_path) as conn:
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'").fetchone():
+            return None
+        return dict(conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+
+
+def select_contact_rows(rows: List[Dict[str, str]], start: int = 0,
+                        limit: Optional[int] = None) -> List[Dict[str, str]]:
+    """process_exhibitors와 같은 기준으로 연락처 수집 대상 선택 (웹사이트 있는 업체 중 start부터 limit개)"""
+    selected = [row for row in rows if (row.get('website') or '').strip()][start:]
+    return selected[:limit] if limit else selected
+
+
+def missing_websites(rows: List[Dict[str, str]]) -> int:
+    """프로필 페이지는 있지만 공식 웹사이트가 비어 있는 업체 수 (get_gitex_company.missing_website_rows와 같은 기준)"""
+    return sum(1 for row in rows if row.get('profile_url') and not (row.get('website') or '').strip())
+
+
+def pending_contacts(rows: List[Dict[str, str]], store: Optional[ResultStore]) -> Tuple[int, int]:
+    """(아직 처리하지 않은 업체 수, 이미 처리됐거나 중복이라 건너뛸 업체 수)"""
+    seen = set()
+    pending = 0
+    for row in rows:
+        key = (normalize_company(row['company_name']), normalize_website(row['website']))
+        if key in seen or (store is not None and store.is_done(row['company_name'], row['website'])):
+            continue
+        seen.add(key)
+        pending += 1
+    return pending, len(rows) - pending
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """'번호/개수' 형식 (예: 0/3)"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard는 '번호/개수' 형식이어야 합니다: {value!r}")
+    if not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"shard 번호는 0 이상 개수 미만이어야 합니다: {value!r}")
+    return index, count
+
+
+def cmd_crawl(args) -> int:
+    if args.dry_run:
+        print(f"📋 목록 수집 계획: start={args.start}, end={args.end if args.end is not None else '자동 (목록 끝)'}, "
+              f"페이지당 {args.batch_size}개, 동시 {args.window}페이지, 웹사이트 확인 {'함' if args.resolve else '안 함'}")
+        if args.incremental:
+            stored = {row['profile_url'] for row in read_rows(args.csv) if row.get('profile_url')}
+            print(f"📂 {args.csv}: 이미 저장된 프로필 {len(stored)}개는 건너뜀")
+        return 0
+
+    from get_gitex_company import crawl_exhibitors
+
+    crawl_exhibitors(args.csv, start_index=args.start, end_index=args.end, batch_size=args.batch_size,
+                     listing_window=args.window, listing_retries=args.retries, max_workers=args.workers,
+                     max_per_host=args.max_per_host, min_interval=args.min_interval,
+                     incremental=args.incremental, http_cache_dir=args.http_cache or None,
+                     resolve=args.resolve)
+    return 0
+
+
+def cmd_resolve(args) -> int:
+    if args.dry_run:
+        rows = read_rows(args.csv)
+        missing = missing_websites(rows)
+        if args.limit:
+            missing = min(missing, args.limit)
+        print(f"🌐 웹사이트 확인 대상: {missing}개 (전체 {len(rows)}개)")
+        return 0
+
+    from get_gitex_company import resolve_missing_websites
+
+    resolve_missing_websites(args.csv, limit=args.limit, max_workers=args.workers,
+                             max_per_host=args.max_per_host, min_interval=args.min_interval,
+                             http_cache_dir=args.http_cache or None)
+    return 0
+
+
+def cmd_extract(args) -> int:
+    if args.dry_run:
+        rows = select_contact_rows(read_rows(args.input), args.start, args.limit)
+        store = open_store(args.store)
+        try:
+            pending, skipped = pending_contacts(rows, store)
+        finally:
+            if store is not None:
+                store.close()
+        print(f"🤖 연락처 수집 대상: {pending}개 (선택 {len(rows)}개 중 처리됨/중복 {skipped}개 제외), "
+              f"워커 {args.workers}개" + (" - 작업 큐 모드" if args.queue else ""))
+        jobs = queue_counts(args.store)
+        if args.queue and jobs:
+            print(f"📋 작업 큐: {', '.join(f'{state} {count}' for state, count in sorted(jobs.items()))}")
+        return 0
+
+    from process_exhibitors import process_exhibitors
+
+    process_exhibitors(input_csv=args.input, output_csv=args.output, store_path=args.store,
+                       start_index=args.start, test_limit=args.limit, workers=args.workers,
+                       requests_per_minute=args.rpm, tokens_per_minute=args.tpm,
+                       static_first=args.static, text_first=args.text,
+                       cache_path=args.contact_cache or None, trace_path=args.trace or None,
+                       work_queue=args.queue, lease_seconds=args.lease_seconds,
+                       max_attempts=args.max_attempts, shard=args.shard)
+    return 0
+
+
+def cmd_pipeline(args) -> int:
+    if args.dry_run:
+        rows = read_rows(args.csv)
+        store = open_store(args.store)
+        try:
+            pending, _ = pending_contacts(select_contact_rows(rows), store)
+        finally:
+            if store is not None:
+                store.close()
+        print(f"🔀 파이프라인 계획: start={args.start}, end={args.end if args.end is not None else '자동 (목록 끝)'}, "
+              f"웹사이트 확인 {args.resolve_workers}개, 연락처 추출 {args.extract_workers}개, 큐 크기 {args.queue_size}")
+        print(f"📂 {args.csv}: 기존 업체 {len(rows)}개 (건너뜀), 재개 투입 대상 {pending}개")
+        return 0
+
+    from pipeline import run_pipeline
+
+    run_pipeline(start_index=args.start, end_index=args.end, batch_size=args.batch_size,
+                 listing_window=args.window, listing_retries=args.retries,
+                 exhibitors_csv=args.csv, output_csv=args.output, store_path=args.store,
+                 cache_path=args.contact_cache or None, http_cache_dir=args.http_cache or None,
+                 resolve_workers=args.resolve_workers, extract_workers=args.extract_workers,
+                 queue_size=args.queue_size, requests_per_minute=args.rpm, tokens_per_minute=args.tpm,
+                 static_first=args.static, text_first=args.text,
+                 max_per_host=args.max_per_host, min_interval=args.min_interval,
+                 shutdown_timeout=args.shutdown_timeout, trace_path=args.trace or None)
+    return 0
+
+
+def cmd_status(args) -> int:
+    rows = read_rows(args.csv)
+    with_website = select_contact_rows(rows)
+    print(f"📂 업체 목록: {args.csv} - {len(rows)}개 "
+          f"(웹사이트 있음 {len(with_website)}, 웹사이트 확인 대기 {missing_websites(rows)})")
+
+    store = open_store(args.store)
+    try:
+        if store is None:
+            print(f"📂 결과 저장소: {args.store} 없음")
+        else:
+            print(f"📂 결과 저장소: {args.store} - {len(store)}개 업체 (상태별: {store.counts()})")
+        pending, _ = pending_contacts(with_website, store)
+    finally:
+        if store is not None:
+            store.close()
+    print(f"⏳ 연락처 수집 대기: {pending}개")
+
+    jobs = queue_counts(args.store)
+    if jobs:
+        print(f"📋 작업 큐: {', '.join(f'{state} {count}' for state, count in sorted(jobs.items()))}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="GITEX 참가업체 연락처 수집")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_http_options(command):
+        command.add_argument('--csv', default=EXHIBITORS_CSV, help="업체 목록 CSV")
+        command.add_argument('--workers', type=int, default=8, help="프로필 페이지 동시 요청 수")
+        command.add_argument('--max-per-host', type=int, default=4, help="호스트별 동시 요청 수")
+        command.add_argument('--min-interval', type=float, default=0.2, help="호스트별 요청 시작 간격(초)")
+        command.add_argument('--http-cache', default=HTTP_CACHE_DIR, help="HTTP 캐시 경로 ('' 이면 사용 안 함)")
+        command.add_argument('--dry-run', action='store_true', help="처리 대상만 계산하고 종료 (네트워크 요청 없음)")
+
+    crawl = commands.add_parser('crawl', help="참가업체 목록 수집 (+ 공식 웹사이트 확인)")
+    add_http_options(crawl)
+    crawl.add_argument('--start', type=int, default=0, help="시작 인덱스")
+    crawl.add_argument('--end', type=int, default=None, help="끝 인덱스 (기본: 목록 끝 자동 감지)")
+    crawl.add_argument('--batch-size', type=int, default=50, help="목록 페이지당 업체 수")
+    crawl.add_argument('--window', type=int, default=4, help="동시에 가져올 목록 페이지 수")
+    crawl.add_argument('--retries', type=int, default=3, help="실패한 목록 페이지별 재시도 횟수")
+    crawl.add_argument('--no-resolve', dest='resolve', action='store_false',
+                       help="공식 웹사이트 확인 생략 (나중에 resolve 명령으로 확인)")
+    crawl.add_argument('--full', dest='incremental', action='store_false',
+                       help="이미 저장된 프로필도 다시 저장 (기본: 증분)")
+    crawl.set_defaults(handler=cmd_crawl)
+
+    resolve = commands.add_parser('resolve', help="웹사이트가 비어 있는 업체의 공식 웹사이트 확인")
+    add_http_options(resolve)
+    resolve.add_argument('--limit', type=int, default=None, help="최대 처리 개수")
+    resolve.set_defaults(handler=cmd_resolve)
+
+    extract = commands.add_parser('extract', help="업체 웹사이트에서 연락처 수집")
+    extract.add_argument('--input', default=EXHIBITORS_CSV, help="업체 목록 CSV")
+    extract.add_argument('--output', default=DETAIL_CSV, help="종료 시 내보낼 결과 CSV")
+    extract.add_argument('--store', default=STORE_PATH, help="결과 저장소(SQLite)")
+    extract.add_argument('--start', type=int, default=0, help="웹사이트 있는 업체 중 시작 인덱스")
+    extract.add_argument('--limit', type=int, default=None, help="처리 개수 (기본: 전체)")
+    extract.add_argument('--workers', type=int, default=1, help="동시에 실행할 에이전트 수")
+    extract.add_argument('--rpm', type=float, default=60, help="분당 Gemini 요청 한도 (전체 워커 합산)")
+    extract.add_argument('--tpm', type=float, default=None, help="분당 Gemini 토큰 한도 (전체 워커 합산)")
+    extract.add_argument('--no-static', dest='static', action='store_false', help="정적 HTML 추출 생략")
+    extract.add_argument('--no-text', dest='text', action='store_false', help="텍스트 모드 에이전트 생략")
+    extract.add_argument('--contact-cache', default="output/contact_cache.db",
+                         help="도메인 연락처 캐시 ('' 이면 사용 안 함)")
+    extract.add_argument('--trace', default=TRACE_PATH, help="에이전트 추적 JSONL ('' 이면 기록 안 함)")
+    extract.add_argument('--queue', action='store_true', help="작업 큐 모드 (여러 프로세스가 나눠 처리)")
+    extract.add_argument('--shard', type=parse_shard, default=None, help="작업 큐 분할 '번호/개수' (예: 0/3)")
+    extract.add_argument('--lease-seconds', type=float, default=900, help="작업 큐 임대 유효 시간(초)")
+    extract.add_argument('--max-attempts', type=int, default=3, help="작업 큐 업체별 최대 시도 횟수")
+    extract.add_argument('--dry-run', action='store_true', help="처리 대상만 계산하고 종료")
+    extract.set_defaults(handler=cmd_extract)
+
+    pipeline = commands.add_parser('pipeline', help="크롤링 -> 웹사이트 확인 -> 연락처 추출 스트리밍 파이프라인")
+    pipeline.add_argument('--csv', default=EXHIBITORS_CSV, help="업체 목록 CSV (크롤링/웹사이트 체크포인트)")
+    pipeline.add_argument('--output', default=DETAIL_CSV, help="종료 시 내보낼 결과 CSV")
+    pipeline.add_argument('--store', default=STORE_PATH, help="결과 저장소(SQLite)")
+    pipeline.add_argument('--start', type=int, default=0, help="목록 시작 인덱스")
+    pipeline.add_argument('--end', type=int, default=None, help="목록 끝 인덱스 (기본: 목록 끝 자동 감지)")
+    pipeline.add_argument('--batch-size', type=int, default=50, help="목록 페이지당 업체 수")
+    pipeline.add_argument('--window', type=int, default=4, help="동시에 가져올 목록 페이지 수")
+    pipeline.add_argument('--retries', type=int, default=3, help="실패한 목록 페이지별 재시도 횟수")
+    pipeline.add_argument('--resolve-workers', type=int, default=4, help="웹사이트 확인 동시 실행 수")
+    pipeline.add_argument('--extract-workers', type=int, default=2, help="연락처 추출 동시 실행 수")
+    pipeline.add_argument('--queue-size', type=int, default=20, help="단계 사이 큐 최대 크기")
+    pipeline.add_argument('--max-per-host', type=int, default=4, help="호스트별 동시 요청 수")
+    pipeline.add_argument('--min-interval', type=float, default=0.2, help="호스트별 요청 시작 간격(초)")
+    pipeline.add_argument('--rpm', type=float, default=60, help="분당 Gemini 요청 한도 (전체 워커 합산)")
+    pipeline.add_argument('--tpm', type=float, default=None, help="분당 Gemini 토큰 한도 (전체 워커 합산)")
+    pipeline.add_argument('--no-static', dest='static', action='store_false', help="정적 HTML 추출 생략")
+    pipeline.add_argument('--no-text', dest='text', action='store_false', help="텍스트 모드 에이전트 생략")
+    pipeline.add_argument('--contact-cache', default="output/contact_cache.db",
+                          help="도메인 연락처 캐시 ('' 이면 사용 안 함)")
+    pipeline.add_argument('--http-cache', default=HTTP_CACHE_DIR, help="HTTP 캐시 경로 ('' 이면 사용 안 함)")
+    pipeline.add_argument('--trace', default=TRACE_PATH, help="에이전트 추적 JSONL ('' 이면 기록 안 함)")
+    pipeline.add_argument('--shutdown-timeout', type=float, default=120,
+                          help="Ctrl+C 후 진행 중인 워커를 기다리는 최대 시간(초)")
+    pipeline.add_argument('--dry-run', action='store_true', help="계획만 출력하고 종료 (네트워크 요청 없음)")
+    pipeline.set_defaults(handler=cmd_pipeline)
+
+    status = commands.add_parser('status', help="단계별 진행 상황")
+    status.add_argument('--csv', default=EXHIBITORS_CSV, help="업체 목록 CSV")
+    status.add_argument('--store', default=STORE_PATH, help="결과 저장소(SQLite)")
+    status.set_defaults(handler=cmd_status)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # Windows 콘솔에서 이모지/한글 출력
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
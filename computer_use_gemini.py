@@ -6,21 +6,86 @@ Gemini 2.5 Computer Use 에이전트
 
 import os
 import time
-import re
-import json
 from typing import Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 from google.genai.types import Content, Part, FunctionResponse, FunctionResponsePart
 from playwright.sync_api import sync_playwright
+from conversation_history import ConversationHistory, ScreenshotEncoder, FrameChangeDetector
+from page_settle import PageSettler
+from agent_trace import usage_tokens
+from resource_blocker import ResourceBlockPolicy
+from loop_guard import LoopGuard, PAGE_CONTACTS_SCRIPT, REPEAT_RESULT
+from final_answer import (parse_json_object, validate_final_answer, finalize_config,
+                          build_finalize_contents, read_final_response)
 
 # .env 파일 로드
 load_dotenv()
 
+# 포커스된 요소가 insert_text로 입력 가능한 일반 텍스트 입력란인지 확인
+BULK_INPUT_CHECK_SCRIPT = """
+() => {
+    const el = document.activeElement;
+    if (!el) return false;
+    if (el.isContentEditable) return true;
+    if (el.tagName === 'TEXTAREA') return !el.readOnly && !el.disabled;
+    if (el.tagName !== 'INPUT') return false;
+    const textTypes = ['text', 'search', 'email', 'url', 'tel', 'number', ''];
+    return textTypes.includes((el.getAttribute('type') || '').toLowerCase()) && !el.readOnly && !el.disabled;
+}
+"""
+
+# scroll_document 방향별 키
+SCROLL_KEYS = {"down": "PageDown", "up": "PageUp", "left": "ArrowLeft", "right": "ArrowRight"}
+
+SEARCH_URL = "https://www.google.com"
+
+# 최종 답 재요청 시 보낼 페이지 텍스트 최대 길이
+FINAL_PAGE_CHARS = 8000
+
 class ComputerUseAgent:
-    def __init__(self, api_key: Optional[str] = None, headless: bool = True):
-        """Computer Use 에이전트 초기화"""
+    def __init__(self, api_key: Optional[str] = None, headless: bool = True,
+                 browser_pool=None, rate_limiter=None,
+                 keep_last_screenshots: Optional[int] = 3,
+                 screenshot_format: str = 'png',
+                 screenshot_quality: int = 70,
+                 screenshot_scale: float = 1.0,
+                 screen_change_threshold: Optional[int] = None,
+                 settle_max_wait: float = 5.0,
+                 settle_visual_check: bool = False,
+                 text_input_mode: str = 'bulk',
+                 keystroke_delay: float = 0.05,
+                 tracer=None,
+                 block_resources: bool = True,
+                 resource_policy: Optional[ResourceBlockPolicy] = None,
+                 guard_loops: bool = True,
+                 loop_guard: Optional[LoopGuard] = None,
+                 finalize_model: Optional[str] = 'gemini-2.5-flash'):
+        """
+        Computer Use 에이전트 초기화
+
+        Args:
+            api_key: Gemini API 키 (없으면 GEMINI_API_KEY 환경 변수 사용)
+            headless: headless 모드 여부 (browser_pool 사용 시 풀 설정을 따름)
+            browser_pool: BrowserPool - 주어지면 작업마다 브라우저를 띄우지 않고 풀의 새 컨텍스트 사용
+            rate_limiter: RateLimiter - 여러 에이전트가 공유하는 Gemini 요청 스케줄러 (속도 제한 + 재시도)
+            keep_last_screenshots: 대화 기록에 이미지로 유지할 최근 스크린샷 수 (None이면 전부)
+            screenshot_format: 스크린샷 형식 ('png', 'jpeg', 'webp')
+            screenshot_quality: JPEG/WebP 품질
+            screenshot_scale: 스크린샷 축소 비율 (1.0이면 원본 크기)
+            screen_change_threshold: 화면 변화 판단용 지각 해시 허용 거리 (None이면 바이트 비교만)
+            settle_max_wait: 액션 후 페이지 안정화 최대 대기 시간(초)
+            settle_visual_check: 안정화 판단에 연속 스크린샷 비교도 사용할지 여부
+            text_input_mode: 'bulk'(입력란이면 한 번에 입력) 또는 'keys'(항상 한 글자씩 키 입력)
+            keystroke_delay: 'keys' 방식의 글자 사이 딜레이(초)
+            tracer: TurnTracer - 턴별 시간/토큰 이벤트 기록기 (여러 에이전트가 공유 가능)
+            block_resources: 동영상/추적·광고 호스트 요청 차단 여부 (기본 정책 사용)
+            resource_policy: ResourceBlockPolicy - 직접 지정한 차단 정책 (주면 block_resources 무시)
+            guard_loops: 반복 액션 차단 + DOM 연락처 발견 시 조기 마무리 사용 여부 (기본 설정)
+            loop_guard: LoopGuard - 직접 지정한 루프 가드 (주면 guard_loops 무시)
+            finalize_model: 최종 답이 없거나 형식이 틀렸을 때 구조화 응답으로 다시 물어볼 모델 (None이면 사용 안 함)
+        """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY 설정되지 않았습니다.")
@@ -38,23 +103,78 @@ class ComputerUseAgent:
         self.browser = None
         self.context = None
         self.page = None
+        self.browser_pool = browser_pool
+        self._pool_lease = None
+        self.rate_limiter = rate_limiter
+
+        # 대화 기록/스크린샷 설정 (run_task에서 실행별로 덮어쓸 수 있음)
+        self.keep_last_screenshots = keep_last_screenshots
+        self.screenshot_encoder = ScreenshotEncoder(screenshot_format, screenshot_quality, screenshot_scale)
+        self.frame_detector = FrameChangeDetector(perceptual_threshold=screen_change_threshold)
+
+        # 액션 후 페이지 안정화 (고정 sleep 대신 조용해지는 즉시 반환)
+        self.settler = PageSettler(max_wait=settle_max_wait, visual_check=settle_visual_check)
+
+        # 텍스트 입력 방식
+        self.text_input_mode = text_input_mode
+        self.keystroke_delay = keystroke_delay
+
+        # 리소스 차단 정책 (컨텍스트마다 설치, 세션별 차단 통계)
+        self.resource_policy = resource_policy or (ResourceBlockPolicy() if block_resources else None)
+        self.block_stats = None
+
+        # 루프 가드 (반복 액션 차단, 연락처가 보이면 조기 마무리)
+        self.loop_guard = loop_guard or (LoopGuard() if guard_loops else None)
+        self.max_saved_turns = 0
+        self.total_max_saved_turns = 0
+
+        # 최종 답 검증 실패 시 스키마 고정 재요청
+        self.finalize_model = finalize_model
+        self.final_error = ''
+
+        # 턴 단위 추적 (None이면 기록 안 함)
+        self.tracer = tracer
+        self.last_screenshot_bytes = 0
+        self.last_screenshot_sent = False
 
         # Computer Use 모델 설정
         self.model_name = 'gemini-2.5-computer-use-preview-10-2025'
 
     def start_browser(self):
         """브라우저 시작"""
+        if self.browser_pool:
+            # 풀의 브라우저에서 격리된 새 컨텍스트만 생성
+            self._pool_lease = self.browser_pool.page(
+                viewport={"width": self.screen_width, "height": self.screen_height}
+            )
+            self.context, self.page = self._pool_lease.__enter__()
+            self.install_resource_policy()
+            return
+
         print("🌐 브라우저를 시작합니다...")
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=self.headless)
         self.context = self.browser.new_context(
             viewport={"width": self.screen_width, "height": self.screen_height}
         )
+        self.install_resource_policy()
         self.page = self.context.new_page()
         print("✅ 브라우저가 시작되었습니다.")
 
+    def install_resource_policy(self):
+        """현재 컨텍스트에 리소스 차단 라우트 설치 (세션별 통계 초기화)"""
+        self.block_stats = self.resource_policy.attach(self.context) if self.resource_policy else None
+
     def close_browser(self):
         """브라우저 닫기"""
+        if self._pool_lease:
+            # 컨텍스트만 닫고 브라우저는 풀에 남겨둠
+            lease, self._pool_lease = self._pool_lease, None
+            lease.__exit__(None, None, None)
+            self.context = None
+            self.page = None
+            return
+
         if self.browser:
             print("🌐 브라우저를 닫습니다...")
             self.browser.close()
@@ -64,9 +184,13 @@ class ComputerUseAgent:
 
     def take_screenshot(self) -> bytes:
         """현재 화면 스크린샷 찍기"""
+        return self.capture_screenshot()[0]
+
+    def capture_screenshot(self) -> Tuple[bytes, str]:
+        """현재 화면 스크린샷을 설정된 형식으로 찍기 - (바이트, MIME 타입)"""
         if not self.page:
             raise ValueError("브라우저가 시작되지 않았습니다.")
-        return self.page.screenshot(type="png")
+        return self.screenshot_encoder.capture(self.page)
 
     def denormalize_x(self, x: int) -> int:
         """정규화된 x 좌표를 실제 픽셀 좌표로 변환"""
@@ -80,6 +204,43 @@ class ComputerUseAgent:
         """자바스크립트 함수 실행하는 custom tool 함수"""  
         return self.page.evaluate(code)
 
+    def is_bulk_input_target(self) -> bool:
+        """포커스된 요소가 한 번에 입력 가능한 텍스트 입력란인지 확인"""
+        return self.page.evaluate(BULK_INPUT_CHECK_SCRIPT)
+
+    def type_text(self, text: str) -> str:
+        """
+        포커스된 요소에 텍스트 입력
+
+        text_input_mode가 'bulk'이고 입력란이 허용하면 insert_text로 한 번에 입력하고,
+        실제 키 이벤트가 필요한 요소(키보드 보안, 커스텀 위젯 등)는 한 글자씩 입력합니다.
+
+        Returns:
+            사용한 입력 방식 ('bulk' 또는 'keys')
+        """
+        if self.text_input_mode == 'bulk':
+            try:
+                if self.is_bulk_input_target():
+                    self.page.keyboard.insert_text(text)
+                    return 'bulk'
+            except Exception as e:
+                print(f"  ⚠️ 일괄 입력 불가, 키 입력으로 전환: {e}")
+
+        for char in text:
+            self.page.keyboard.press(char)
+            time.sleep(self.keystroke_delay)  # 짧은 딜레이 추가
+        return 'keys'
+
+    def build_task_prompt(self, task: str) -> str:
+        """첫 요청 프롬프트 (JSON 응답 강제)"""
+        return f"""당신은 유능한 AI 어시스턴트입니다.
+
+작업: {task}
+
+중요: 작업 완료 후 응답은 반드시 순수 JSON 형식만 출력해주세요.
+설명이나 마크다운 코드블록 없이 오직 JSON 객체만 출력하세요.
+예시: {{"contact_email": "example@example.com", "contact_call": "+123456789", "confidence": 0.9, "source_url": "https://example.com/contact"}}"""
+
     def create_computer_use_config(self) -> genai.types.GenerateContentConfig:
         """Computer Use 설정 생성"""
         custom_functions = [
@@ -121,6 +282,12 @@ class ComputerUseAgent:
             print(f"  🔧 실행 중: {fname}")
             print(f"  📋 인자: {args}")
 
+            # 화면 변화 없이 반복되는 액션은 실행하지 않음
+            if self.loop_guard and self.loop_guard.should_block(fname, args):
+                print(f"  🔁 반복 액션 차단: {fname}")
+                results.append((fname, REPEAT_RESULT))
+                continue
+
             # Safety decision 확인
             if 'safety_decision' in args:
                 decision = self.get_safety_confirmation(args['safety_decision'])
@@ -131,80 +298,15 @@ class ComputerUseAgent:
                 safety_acknowledgements[fname] = True
 
             try:
-                if fname == "open_web_browser":
-                    action_result = {"success": True, "message": "브라우저가 이미 열려 있습니다."}
-
-                elif fname == "click_at":
-                    x = self.denormalize_x(args["x"])
-                    y = self.denormalize_y(args["y"])
-                    self.page.mouse.click(x, y)
-                    action_result = {"success": True, "message": f"좌표 ({x}, {y})에서 클릭했습니다."}
-
-                elif fname == "type_text_at":
-                    x = self.denormalize_x(args["x"])
-                    y = self.denormalize_y(args["y"])
-                    text = args["text"]
-                    press_enter = args.get("press_enter", False)
-                    clear_before_typing = args.get("clear_before_typing", True)
-
-                    self.page.mouse.click(x, y)
-                    time.sleep(0.1)
-
-                    # 텍스트 필드 지우기
-                    if clear_before_typing:
-                        self.page.keyboard.press("Meta+A")
-                        self.page.keyboard.press("Backspace")
-
-                    # 텍스트 입력
-                    # self.page.keyboard.type(text)
-                    for char in text:  
-                        self.page.keyboard.press(char)  
-                        time.sleep(0.05)  # 짧은 딜레이 추가
-
-                    if press_enter:
-                        self.page.keyboard.press("Enter")
-
-                    action_result = {"success": True, "message": f"좌표 ({x}, {y})에 텍스트를 입력했습니다: {text}"}
-
-                elif fname == "navigate":
-                    url = args["url"]
-                    self.page.goto(url)
-                    action_result = {"success": True, "message": f"{url}로 이동했습니다."}
-
-                elif fname == "search":
-                    self.page.goto("https://www.google.com")
-                    action_result = {"success": True, "message": "Google 검색 페이지로 이동했습니다."}
-
-                elif fname == "scroll_document":
-                    direction = args.get("direction", "down")
-                    if direction == "down":
-                        self.page.keyboard.press("PageDown")
-                    elif direction == "up":
-                        self.page.keyboard.press("PageUp")
-                    elif direction == "left":
-                        self.page.keyboard.press("ArrowLeft")
-                    elif direction == "right":
-                        self.page.keyboard.press("ArrowRight")
-                    action_result = {"success": True, "message": f"문서를 {direction} 방향으로 스크롤했습니다."}
-
-                elif fname == "wait_5_seconds":
-                    time.sleep(5)
-                    action_result = {"success": True, "message": "5초 대기했습니다."}
-
-                elif fname == "execute_javascript":  
-                    self.execute_javascript(code=args["code"])
-                    action_result = {"success": True, "message": f"자바스크립트를 실행했습니다: {args['code']}"}
-
-                else:
-                    action_result = {"success": False, "message": f"지원되지 않는 액션: {fname}"}
+                action_result, settled = self.run_action(fname, args)
 
                 # Safety acknowledgment 추가
                 action_result.update(extra_fields)
 
-                # 대기 및 로딩
-                print(f"  ⏳ 페이지 로딩 대기 중...")
-                self.page.wait_for_load_state(timeout=5000)
-                time.sleep(1)
+                # 페이지 안정화 대기 (네트워크 유휴 + DOM 변경 정지)
+                timings = self.settler.last_timings if settled else self.settler.settle(self.page)
+                print(f"  ⏳ 페이지 안정화 {timings['total']:.2f}초 "
+                      f"(network {timings['network']:.2f}s, dom {timings['dom']:.2f}s, visual {timings['visual']:.2f}s)")
                 print(f"  ✅ 액션 완료: {action_result.get('message', '성공')}")
 
             except Exception as e:
@@ -215,6 +317,71 @@ class ComputerUseAgent:
 
         return results, safety_acknowledgements
 
+    def run_action(self, fname: str, args: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        액션 1개 실행
+
+        Returns:
+            (action_result, settled) - settled는 액션 안에서 이미 페이지 안정화를 기다렸는지 여부
+        """
+        if fname == "open_web_browser":
+            return {"success": True, "message": "브라우저가 이미 열려 있습니다."}, False
+
+        if fname == "click_at":
+            x = self.denormalize_x(args["x"])
+            y = self.denormalize_y(args["y"])
+            self.page.mouse.click(x, y)
+            return {"success": True, "message": f"좌표 ({x}, {y})에서 클릭했습니다."}, False
+
+        if fname == "type_text_at":
+            x = self.denormalize_x(args["x"])
+            y = self.denormalize_y(args["y"])
+            text = args["text"]
+            press_enter = args.get("press_enter", False)
+            clear_before_typing = args.get("clear_before_typing", True)
+
+            self.page.mouse.click(x, y)
+
+            # 텍스트 필드 지우기 (Linux/Windows는 Control, macOS는 Meta)
+            if clear_before_typing:
+                self.page.keyboard.press("ControlOrMeta+A")
+                self.page.keyboard.press("Backspace")
+
+            # 텍스트 입력 - 입력란이면 한 번에, 아니면 키 이벤트로 한 글자씩
+            mode = self.type_text(text)
+
+            if press_enter:
+                self.page.keyboard.press("Enter")
+
+            return {"success": True, "message": f"좌표 ({x}, {y})에 텍스트를 입력했습니다 ({mode}): {text}"}, False
+
+        if fname == "navigate":
+            url = args["url"]
+            self.page.goto(url)
+            return {"success": True, "message": f"{url}로 이동했습니다."}, False
+
+        if fname == "search":
+            self.page.goto(SEARCH_URL)
+            return {"success": True, "message": "Google 검색 페이지로 이동했습니다."}, False
+
+        if fname == "scroll_document":
+            direction = args.get("direction", "down")
+            key = SCROLL_KEYS.get(direction)
+            if key:
+                self.page.keyboard.press(key)
+            return {"success": True, "message": f"문서를 {direction} 방향으로 스크롤했습니다."}, False
+
+        if fname == "wait_5_seconds":
+            # 최대 5초까지, 페이지가 조용해지면 바로 반환
+            timings = self.settler.settle(self.page, max_wait=5.0)
+            return {"success": True, "message": f"페이지가 안정될 때까지 {timings['total']:.1f}초 대기했습니다."}, True
+
+        if fname == "execute_javascript":
+            self.execute_javascript(code=args["code"])
+            return {"success": True, "message": f"자바스크립트를 실행했습니다: {args['code']}"}, False
+
+        return {"success": False, "message": f"지원되지 않는 액션: {fname}"}, False
+
     def get_safety_confirmation(self, safety_decision: Dict[str, Any]) -> str:
         """Safety 확인 - 자동으로 계속 진행"""
         print(f"⚠️ Safety decision 감지: {safety_decision.get('explanation', '')} -> 자동 승인")
@@ -222,15 +389,32 @@ class ComputerUseAgent:
 
     def get_function_responses(self, results: List[Tuple[str, Dict[str, Any]]],
                              safety_acknowledgements: Dict[str, bool] = None) -> List[FunctionResponse]:
-        """Function Response 생성"""
-        screenshot_bytes = self.page.screenshot(type="png")
-        current_url = self.page.url
+        """
+        Function Response 생성
+
+        스크린샷은 한 턴에 한 번만 (마지막 응답에) 첨부하고,
+        직전 프레임과 같은 화면이면 이미지 대신 "화면 변화 없음"을 알립니다.
+        """
+        screenshot_bytes, mime_type = self.capture_screenshot()
+        return self.build_function_responses(results, safety_acknowledgements,
+                                             screenshot_bytes, mime_type, self.page.url)
+
+    def build_function_responses(self, results: List[Tuple[str, Dict[str, Any]]],
+                                 safety_acknowledgements: Optional[Dict[str, bool]],
+                                 screenshot_bytes: bytes, mime_type: str,
+                                 current_url: str) -> List[FunctionResponse]:
+        """캡처한 스크린샷으로 Function Response 목록 구성 (동기/비동기 에이전트 공용)"""
         function_responses = []
 
         if safety_acknowledgements is None:
             safety_acknowledgements = {}
 
-        for name, result in results:
+        changed = self.frame_detector.is_changed(screenshot_bytes)
+        self.frame_detector.record(len(screenshot_bytes), sent=changed, copies=len(results))
+        self.last_screenshot_bytes = len(screenshot_bytes)
+        self.last_screenshot_sent = changed
+
+        for i, (name, result) in enumerate(results):
             response_data = {"url": current_url}
             response_data.update(result)
 
@@ -238,60 +422,296 @@ class ComputerUseAgent:
             if name in safety_acknowledgements and safety_acknowledgements[name]:
                 response_data["safety_acknowledgement"] = "true"
 
+            parts = None
+            if not changed:
+                response_data["screen_unchanged"] = True
+                response_data["screenshot"] = "화면 변화 없음 - 이전 스크린샷과 동일합니다."
+            elif i == len(results) - 1:
+                parts = [
+                    FunctionResponsePart(
+                        inline_data=types.FunctionResponseBlob(
+                            mime_type=mime_type,
+                            data=screenshot_bytes
+                        )
+                    )
+                ]
+            else:
+                response_data["screenshot"] = "이번 턴의 마지막 응답에 첨부됨"
+
             function_responses.append(
                 FunctionResponse(
                     name=name,
                     response=response_data,
-                    parts=[
-                        FunctionResponsePart(
-                            inline_data=types.FunctionResponseBlob(
-                                mime_type="image/png",
-                                data=screenshot_bytes
-                            )
-                        )
-                    ]
+                    parts=parts
                 )
             )
 
         return function_responses
 
-    def has_function_calls(self, candidate) -> bool:
-        """Function Call이 있는지 확인"""
-        return any(hasattr(part, 'function_call') and part.function_call
-                  for part in candidate.content.parts)
+    def start_history(self, task: str, screenshot: bytes, mime_type: str,
+                      keep_last_screenshots: Optional[int]) -> ConversationHistory:
+        """감지/대기 통계를 초기화하고 첫 요청(프롬프트 + 스크린샷)으로 대화 기록 생성"""
+        self.frame_detector.reset()
+        self.settler.reset()
+        if self.loop_guard:
+            self.loop_guard.reset()
+        self.frame_detector.is_changed(screenshot)
+        self.frame_detector.record(len(screenshot), sent=True)
+
+        # 대화 기록 초기화 (JSON 응답 강제) - 최근 스크린샷만 이미지로 유지
+        history = ConversationHistory(keep_last_screenshots=keep_last_screenshots)
+        history.append(
+            Content(
+                role="user",
+                parts=[
+                    Part(text=self.build_task_prompt(task)),
+                    Part.from_bytes(data=screenshot, mime_type=mime_type)
+                ]
+            )
+        )
+        return history
 
-    def extract_json_from_response(self, text: str) -> Optional[Dict]:
-        """응답 텍스트에서 JSON 추출"""
-        # 1. 마크다운 코드블록 내 JSON 찾기
-        code_block_pattern = r'```(?:json)?\s*\n(.*?)\n```'
-        matches = re.findall(code_block_pattern, text, re.DOTALL)
+    def response_text(self, candidate) -> str:
+        """모델 응답의 텍스트 부분을 이어 붙여 출력하고 반환"""
+        text = " ".join([part.text for part in candidate.content.parts if hasattr(part, 'text') and part.text])
+        if text:
+            print(f"🤖 Gemini 응답: {text[:200]}{'...' if len(text) > 200 else ''}")
+        return text
 
-        for match in matches:
-            try:
-                return json.loads(match.strip())
-            except json.JSONDecodeError:
-                continue
+    def needs_dom_check(self) -> bool:
+        return bool(self.loop_guard and self.loop_guard.check_dom)
 
-        # 2. 인라인 JSON 객체 찾기
-        json_pattern = r'\{[^\{\}]*(?:"[^"]*"[^\{\}]*:[^\{\}]*)+[^\{\}]*\}'
-        matches = re.findall(json_pattern, text, re.DOTALL)
+    def read_page_contacts(self) -> Optional[Dict[str, Any]]:
+        """현재 페이지의 보이는 텍스트와 mailto:/tel: 링크 (실패하면 None)"""
+        try:
+            return self.page.evaluate(PAGE_CONTACTS_SCRIPT, self.loop_guard.dom_max_chars)
+        except Exception:
+            return None
+
+    def guard_turn(self, results: List[Tuple[str, Dict[str, Any]]],
+                   dom: Optional[Dict[str, Any]]) -> Optional[str]:
+        """루프 가드에 이번 턴 결과 전달 - 모델에 보낼 안내 문구 반환"""
+        if not self.loop_guard:
+            return None
+        note = self.loop_guard.after_turn(results, self.last_screenshot_sent, dom, self.page.url)
+        if note:
+            print(f"🛡️ 루프 가드: {note}")
+        return note
+
+    def finish_task(self, text_response: Optional[str], max_turns: int = 0,
+                    turns_used: int = 0) -> Tuple[Optional[Dict], str]:
+        """
+        작업 통계를 출력하고 최종 응답을 JSON으로 읽어 검증
+
+        Returns:
+            (검증된 답 또는 None, outcome) - outcome은 'found', 'bad_json', 'no_answer' 중 하나.
+            None이면 finalize()로 구조화 응답을 다시 요청합니다.
+        """
+        self.final_error = ''
+        guard = self.loop_guard
+        # 상한값 - 가드가 없었다면 max_turns까지 다 썼다고 가정 (실제로는 그 전에 끝났을 수 있음)
+        self.max_saved_turns = max(max_turns - turns_used, 0) if guard and guard.intervened else 0
+        self.total_max_saved_turns += self.max_saved_turns
+        if guard and guard.intervened:
+            print(f"🛡️ 루프 가드: 반복 액션 차단 {guard.blocked_actions}회, 경고 {guard.warnings}회, "
+                  f"마무리 요청 {'예' if guard.finalize_requested else '아니오'}, 최대 절약 턴 {self.max_saved_turns}개")
+
+        detector = self.frame_detector
+        print(f"⏳ 페이지 안정화 대기: 총 {self.settler.total_wait:.1f}초 ({self.settler.settle_count}회)")
+        print(f"🖼️ 스크린샷: 전송 {detector.frames_sent}개 ({detector.bytes_sent:,} bytes), "
+              f"생략 {detector.frames_skipped}개, 절약 {detector.bytes_saved:,} bytes")
+        if self.block_stats:
+            print(f"🚫 리소스 차단: {self.block_stats.summary()}")
+
+        if not text_response:
+            self.final_error = "최종 응답 없음"
+            print("⚠️ 최종 텍스트 응답이 없습니다")
+            return None, 'no_answer'
+
+        print(f"\n🔍 최종 응답 검증 중...")
+        print(f"📝 원본 응답: {text_response}")
+        answer, self.final_error = validate_final_answer(parse_json_object(text_response), self.page.url)
+        if answer:
+            print(f"✅ 최종 답 검증 성공!")
+            print(f"📊 추출된 데이터: {answer}")
+            return answer, 'found'
+        print(f"⚠️ 최종 답 검증 실패 - {self.final_error}")
+        return None, 'bad_json'
+
+    def read_final_page(self) -> Optional[Dict[str, Any]]:
+        """최종 답 재요청에 쓸 현재 페이지 텍스트와 mailto:/tel: 링크 (실패하면 None)"""
+        try:
+            return self.page.evaluate(PAGE_CONTACTS_SCRIPT, FINAL_PAGE_CHARS)
+        except Exception:
+            return None
 
-        for match in matches:
+    def final_answer_from(self, response, trace: Dict[str, Any], screenshot: Optional[bytes]
+                          ) -> Tuple[Optional[Dict], str]:
+        """구조화 최종 답 응답 검증 + 추적 이벤트 기록 - (답 또는 None, 오류 설명)"""
+        trace.update(mode='finalize', final=True, actions=['finalize'],
+                     screenshot_bytes=len(screenshot or b''), screenshot_sent=bool(screenshot))
+        self._trace(trace)
+        answer, error = read_final_response(response, self.page.url)
+        if answer:
+            print(f"✅ 구조화 최종 답 ({'스크린샷 포함' if screenshot else '텍스트만'}): {answer}")
+        else:
+            print(f"⚠️ 구조화 최종 답 검증 실패 - {error}")
+        return answer, error
+
+    def finalize(self, task: str, text_response: Optional[str], outcome: str,
+                 task_id: Optional[str] = None, url: Optional[str] = None,
+                 turns_used: int = 0) -> Tuple[Optional[Dict], str]:
+        """
+        최종 답이 없거나 검증에 실패한 경우 스키마를 고정한 구조화 응답으로 다시 요청
+
+        1차는 마지막 스크린샷 + 페이지 텍스트, 실패하면 이미지 없이 텍스트만 1번 더 요청합니다.
+        둘 다 실패하면 루프 가드가 DOM에서 찾은 연락처를 사용합니다.
+
+        Returns:
+            (답 또는 None, outcome) - 구조화 응답으로 얻으면 outcome은 'finalized'
+        """
+        if not self.finalize_model:
+            return self.guard_fallback(outcome)
+
+        page = self.read_final_page()
+        try:
+            screenshot, mime_type = self.capture_screenshot()
+        except Exception:
+            screenshot, mime_type = None, ''
+
+        error = self.final_error
+        for attempt, image in enumerate((screenshot, None)):
+            contents = build_finalize_contents(task, text_response, self.page.url, page,
+                                               image, mime_type, error)
+            started = time.perf_counter()
             try:
-                return json.loads(match)
-            except json.JSONDecodeError:
+                response, waited = self.generate(self.finalize_model, contents, finalize_config())
+            except Exception as e:
+                error = f"요청 실패: {e}"
+                print(f"⚠️ 구조화 최종 답 요청 실패: {e}")
                 continue
-
-        # 3. 전체 텍스트를 JSON으로 시도
+            trace = self.turn_trace(task_id, url, turns_used + attempt, started, started + waited, response)
+            answer, error = self.final_answer_from(response, trace, image)
+            if answer:
+                return answer, 'finalized'
+        return self.guard_fallback(outcome)
+
+    def page_alive(self) -> bool:
+        """브라우저 페이지가 아직 열려 있는지"""
+        try:
+            return bool(self.page) and not self.page.is_closed()
+        except Exception:
+            return False
+
+    def salvage(self, task: str, text_response: Optional[str], task_id: Optional[str],
+                url: Optional[str], turns_used: int, model_failed: bool) -> Tuple[Optional[Dict], str]:
+        """
+        오류로 중단된 탐색에서 연락처 건지기 (페이지가 살아 있을 때만)
+
+        모델 호출이 실패했으면 다시 요청하지 않고 루프 가드/현재 페이지 DOM의 연락처만 사용하고,
+        그 밖의 오류면 finalize()로 구조화 응답을 요청합니다.
+        연락처가 빈 답은 run_task가 버리고 원래 오류를 다시 발생시킵니다 (중단된 탐색을 '없음'으로 기록하지 않도록).
+        """
+        if not self.page_alive():
+            return None, 'error'
+        self.final_error = ''
+        if not model_failed:
+            return self.finalize(task, text_response, 'error', task_id, url, turns_used)
+        if self.loop_guard and not self.loop_guard.contacts:
+            dom = self.read_page_contacts()
+            if dom:
+                self.loop_guard.contacts = self.loop_guard.contacts_from_dom(dom, self.page.url)
+        return self.guard_fallback('error')
+
+    def guard_fallback(self, outcome: str) -> Tuple[Optional[Dict], str]:
+        """모델 답이 없을 때 루프 가드가 페이지에서 찾은 연락처로 대체"""
+        if self.loop_guard and self.loop_guard.contacts:
+            contacts = dict(self.loop_guard.contacts)
+            print(f"🛡️ 페이지에서 찾은 연락처를 사용합니다: {contacts}")
+            return contacts, 'dom'
+        return None, outcome
+
+    def turn_trace(self, task_id: Optional[str], url: Optional[str], turn: int,
+                   started: float, queued: float, response) -> Dict[str, Any]:
+        """모델 호출 직후의 턴 추적 이벤트 (액션 관련 값은 record_action_trace에서 채움)"""
+        return {'type': 'turn', 'task_id': task_id, 'url': url, 'turn': turn + 1,
+                'rate_wait_s': queued - started, 'model_s': time.perf_counter() - queued,
+                'action_s': 0.0, 'settle_s': 0.0, 'screenshot_s': 0.0,
+                'actions': [], 'screenshot_bytes': 0, 'screenshot_sent': False,
+                **usage_tokens(response)}
+
+    def record_action_trace(self, trace: Dict[str, Any], results: List[Tuple[str, Dict[str, Any]]],
+                            started: float, captured: float, settle_s: float):
+        """액션 실행/스크린샷 시간을 채워 턴 이벤트 기록"""
+        trace.update(action_s=max(captured - started - settle_s, 0.0), settle_s=settle_s,
+                     screenshot_s=time.perf_counter() - captured,
+                     actions=[name for name, _ in results],
+                     screenshot_bytes=self.last_screenshot_bytes,
+                     screenshot_sent=self.last_screenshot_sent)
+        self._trace(trace)
+
+    def task_trace(self, task_id: str, url: Optional[str], turns: int,
+                   started: float, outcome: str) -> Dict[str, Any]:
+        """작업 종료 추적 이벤트"""
+        return {'type': 'task', 'task_id': task_id, 'url': url, 'turns': turns,
+                'seconds': time.perf_counter() - started, 'result': outcome,
+                'blocked_requests': self.block_stats.blocked if self.block_stats else 0,
+                'max_saved_turns': self.max_saved_turns,
+                'guard': (self.loop_guard.stop_reason or ('finalize' if self.loop_guard.finalize_requested else None))
+                if self.loop_guard else None}
+
+    def _trace(self, event: Dict[str, Any]):
+        """추적 이벤트 기록 - 추적 실패가 작업을 멈추지 않도록 예외는 출력만 함"""
+        if not self.tracer:
+            return
         try:
-            return json.loads(text.strip())
-        except json.JSONDecodeError:
-            pass
+            self.tracer.emit(event)
+        except Exception as e:
+            print(f"⚠️ 추적 이벤트 기록 실패: {e}")
 
-        return None
+    def generate(self, model: str, contents, config) -> Tuple[Any, float]:
+        """모델 호출 - 공유 스케줄러가 있으면 속도 제한/재시도 포함. (응답, 대기 시간(초)) 반환"""
+        if not self.rate_limiter:
+            return self.client.models.generate_content(model=model, contents=contents, config=config), 0.0
+        return self.rate_limiter.call(self.client.models.generate_content,
+                                      model=model, contents=contents, config=config)
+
+    def has_function_calls(self, candidate) -> bool:
+        """Function Call이 있는지 확인"""
+        return any(hasattr(part, 'function_call') and part.function_call
+                  for part in candidate.content.parts)
+
+    def run_task(self, task: str, url: str = None, max_turns: int = 10,
+                 keep_last_screenshots: Optional[int] = None,
+                 screenshot_format: Optional[str] = None,
+                 screenshot_scale: Optional[float] = None) -> Optional[Dict]:
+        """
+        Computer Use 작업 실행 및 JSON 결과 반환
+
+        브라우저 실행 실패, 재시도를 다 쓴 Gemini 요청 오류 등은 다시 발생시킵니다 -
+        호출자가 오류로 기록하고 나중에 다시 시도할 수 있도록 (None은 정상 탐색 후 연락처 없음).
+        탐색 도중 오류가 나도 페이지가 살아 있으면 salvage()로 먼저 연락처를 건져 봅니다.
+
+        keep_last_screenshots / screenshot_format / screenshot_scale을 주면
+        이번 실행에만 에이전트 기본 설정 대신 사용합니다.
+        """
+        default_encoder = self.screenshot_encoder
+        if screenshot_format or screenshot_scale:
+            self.screenshot_encoder = ScreenshotEncoder(
+                screenshot_format or default_encoder.image_format,
+                default_encoder.quality,
+                screenshot_scale or default_encoder.scale
+            )
+        if keep_last_screenshots is None:
+            keep_last_screenshots = self.keep_last_screenshots
+
+        task_id = self.tracer.new_task_id() if self.tracer else None
+        task_started = time.perf_counter()
+        turns_used = 0
+        outcome = 'no_answer'
+        text_response = None
+        calling_model = False
 
-    def run_task(self, task: str, url: str = None, max_turns: int = 10) -> Optional[Dict]:
-        """Computer Use 작업 실행 및 JSON 결과 반환"""
         try:
             self.start_browser()
 
@@ -299,99 +719,92 @@ class ComputerUseAgent:
             if url:
                 self.page.goto(url)
             else:
-                self.page.goto("https://www.google.com")
+                self.page.goto(SEARCH_URL)
 
-            # 초기 스크린샷
-            screenshot = self.take_screenshot()
+            # 초기 스크린샷 (화면 변화 감지 기준 프레임)
+            screenshot, mime_type = self.capture_screenshot()
+            history = self.start_history(task, screenshot, mime_type, keep_last_screenshots)
+            contents = history.contents
 
             # Computer Use 설정
             config = self.create_computer_use_config()
 
-            # 대화 기록 초기화 (JSON 응답 강제)
-            contents = [
-                Content(
-                    role="user",
-                    parts=[
-                        Part(text=f"""당신은 유능한 AI 어시스턴트입니다.
-
-작업: {task}
-
-중요: 작업 완료 후 응답은 반드시 순수 JSON 형식만 출력해주세요.
-설명이나 마크다운 코드블록 없이 오직 JSON 객체만 출력하세요.
-예시: {{"contact_email": "example@example.com", "contact_call": "+123456789"}}"""),
-                        Part.from_bytes(data=screenshot, mime_type='image/png')
-                    ]
-                )
-            ]
-
             print(f"🎯 작업 시작: {task}")
 
-            text_response = None
-
             # 에이전트 루프
             for turn in range(max_turns):
                 print(f"\n--- 턴 {turn + 1} ---")
                 print("생각 중...")
 
                 # 모델에 요청 보내기
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=contents,
-                    config=config,
-                )
+                turns_used = turn + 1
+                started = time.perf_counter()
+                calling_model = True
+                response, waited = self.generate(self.model_name, contents, config)
+                calling_model = False
+                trace = self.turn_trace(task_id, url, turn, started, started + waited, response)
 
                 candidate = response.candidates[0]
-                contents.append(candidate.content)
-
-                # Gemini의 응답 텍스트 출력
-                response_text = " ".join([part.text for part in candidate.content.parts if hasattr(part, 'text') and part.text])
-                if response_text:
-                    print(f"🤖 Gemini 응답: {response_text[:200]}{'...' if len(response_text) > 200 else ''}")
+                history.append(candidate.content)
+                response_text = self.response_text(candidate)
 
                 # Function Call이 있는지 확인
                 if not self.has_function_calls(candidate):
                     # 최종 응답
                     text_response = response_text
                     print(f"🎯 작업 완료! 최종 응답: {text_response}")
+                    self._trace(dict(trace, final=True))
                     break
 
                 print("⚡ 액션 실행 중...")
+                settle_before = self.settler.total_wait
+                started = time.perf_counter()
                 results, safety_acknowledgements = self.execute_function_calls(candidate)
+                settle_s = self.settler.total_wait - settle_before
 
                 print("📊 실행 결과 처리 중...")
+                captured = time.perf_counter()
                 function_responses = self.get_function_responses(results, safety_acknowledgements)
+                self.record_action_trace(trace, results, started, captured, settle_s)
 
-                # Function Response를 대화 기록에 추가
-                contents.append(
-                    Content(
-                        role="user",
-                        parts=[Part(function_response=fr) for fr in function_responses]
-                    )
-                )
+                # 루프 가드 - 페이지에 연락처가 보이면 마무리 요청, 반복/정체 시 경고
+                guard_note = self.guard_turn(results, self.read_page_contacts() if self.needs_dom_check() else None)
+
+                # Function Response를 대화 기록에 추가 (오래된 스크린샷은 자동 정리)
+                parts = [Part(function_response=fr) for fr in function_responses]
+                if guard_note:
+                    parts.append(Part(text=guard_note))
+                history.append(Content(role="user", parts=parts))
+
+                if self.loop_guard and self.loop_guard.stop_reason:
+                    print(f"🛑 루프 가드: 에이전트 루프를 종료합니다 ({self.loop_guard.stop_reason})")
+                    break
 
                 if turn == max_turns - 1:
                     print("⚠️ 최대 턴 수에 도달했습니다.")
 
-            # JSON 추출 시도
-            if text_response:
-                print(f"\n🔍 JSON 데이터 추출 시도 중...")
-                print(f"📝 원본 응답: {text_response}")
-                extracted_json = self.extract_json_from_response(text_response)
-                if extracted_json:
-                    print(f"✅ JSON 추출 성공!")
-                    print(f"📊 추출된 데이터: {extracted_json}")
-                    return extracted_json
-                else:
-                    print("⚠️ JSON 추출 실패 - 구조화된 데이터를 찾을 수 없습니다")
-                    return None
-            else:
-                print("⚠️ 최종 텍스트 응답이 없습니다")
-                return None
+            result, outcome = self.finish_task(text_response, max_turns, turns_used)
+            if result is None:
+                result, outcome = self.finalize(task, text_response, outcome, task_id, url, turns_used)
+            return result
 
         except Exception as e:
+            outcome = 'error'
             print(f"❌ 작업 실행 중 오류 발생: {str(e)}")
-            return None
+            if turns_used:
+                try:
+                    result, outcome = self.salvage(task, text_response, task_id, url, turns_used, calling_model)
+                except Exception as salvage_error:
+                    result, outcome = None, 'error'
+                    print(f"⚠️ 연락처 건지기 실패: {salvage_error}")
+                if result and (result.get('contact_email') or result.get('contact_call')):
+                    return result
+                outcome = 'error'
+            raise
         finally:
+            if task_id:
+                self._trace(self.task_trace(task_id, url, turns_used, task_started, outcome))
+            self.screenshot_encoder = default_encoder
             self.close_browser()
 
 def main():
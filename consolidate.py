@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+연락처 결과 통합/정규화/중복 제거
+
+여러 결과 CSV(gitex_exhibitors_detail*.csv)와 결과 저장소(SQLite)를 합쳐
+업체 기본 정보(gitex_exhibitors.csv)에 업체명 + 정규화된 웹사이트 도메인으로 붙이고,
+하나의 중복 없는 데이터셋을 CSV와 Parquet으로 내보냅니다.
+이메일/전화번호/도메인 정규화는 행 단위 파이썬 루프 없이 pandas 문자열 연산(벡터화)으로 처리합니다.
+
+사용:
+    python consolidate.py
+    python consolidate.py --details "output/gitex_exhibitors_detail*.csv" --out output/gitex_contacts
+"""
+
+import argparse
+import glob
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from contact_extractor import EMAIL_PATTERN
+
+MASTER_COLUMNS = ['company_name', 'stand_no', 'description', 'profile_url', 'website']
+DETAIL_COLUMNS = ['company_name', 'website', 'contact_email', 'contact_call']
+CONTACT_COLUMNS = ['contact_email', 'contact_call', 'contact_source']
+OUTPUT_COLUMNS = MASTER_COLUMNS + ['domain'] + CONTACT_COLUMNS + ['contact_match']
+
+# 여러 업체가 양식 예시값을 그대로 넣은 웹사이트 - 도메인 매칭에 쓰지 않음
+PLACEHOLDER_DOMAINS = {
+    'companywebsite.com', 'website.com', 'yourwebsite.com', 'yourcompany.com', 'domain.com',
+    'example.com', 'example.org', 'example.net', 'test.com', 'na', 'n/a', 'none', '-',
+}
+
+# 전화번호 자릿수 범위 (E.164 최대 15자리)
+MIN_PHONE_DIGITS = 7
+MAX_PHONE_DIGITS = 15
+
+# 아랍-인도/페르시아 숫자 -> ASCII
+DIGIT_TABLE = str.maketrans('٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹', '01234567890123456789')
+
+# 내선 번호/두 번째 번호 구분자 (첫 번호만 사용)
+PHONE_SPLIT_PATTERN = r'\s*(?:[;,/|]|\bext\.?|\bx\s*\d|\bor\b)'
+
+
+def text_series(series: pd.Series) -> pd.Series:
+    """NaN/None을 빈 문자열로 바꾼 문자열 Series (앞뒤 공백 제거)"""
+    return series.astype('string').fillna('').str.strip()
+
+
+def normalize_company_series(series: pd.Series) -> pd.Series:
+    """업체명 키 (url_utils.normalize_company와 같은 규칙)"""
+    return text_series(series).str.replace(r'\s+', ' ', regex=True).str.lower()
+
+
+def domain_series(series: pd.Series) -> pd.Series:
+    """웹사이트 -> 도메인 키 (스킴/www./포트/경로 제거, 소문자) - url_utils.normalize_website의 호스트 부분"""
+    host = (text_series(series).str.lower()
+            .str.replace(r'^(?:https?:/*)+', '', regex=True)
+            .str.split(r'[/?#]', n=1, regex=True).str[0]
+            .str.split(':', n=1).str[0]
+            .str.rstrip('.'))
+    return host.str.replace(r'^www\.', '', regex=True)
+
+
+def join_domain_series(domain: pd.Series) -> pd.Series:
+    """매칭용 도메인 키 - 자리표시(PLACEHOLDER_DOMAINS) 도메인은 빈 문자열"""
+    return domain.where(~domain.isin(PLACEHOLDER_DOMAINS), '')
+
+
+def normalize_email_series(series: pd.Series) -> pd.Series:
+    """이메일 정규화 - mailto:/공백 제거, 소문자, 형식에 맞는 첫 주소만 (없음/Not found 등은 빈 문자열)"""
+    lowered = text_series(series).str.lower().str.replace(r'^mailto:', '', regex=True)
+    return lowered.str.extract(f'({EMAIL_PATTERN.pattern})', expand=False).fillna('')
+
+
+def normalize_phone_series(series: pd.Series) -> pd.Series:
+    """
+    전화번호 정규화 - 첫 번호만, 숫자와 국제 접두어 '+'만 남김 (00 국제 접두어는 '+')
+
+    예: "+971 58 121 1973" -> "+971581211973", "0044 20 1234 5678; Ext 250" -> "+442012345678"
+    자릿수가 7~15가 아니면(Not found 등) 빈 문자열.
+    """
+    first = (text_series(series).str.translate(DIGIT_TABLE)
+             .str.split(PHONE_SPLIT_PATTERN, n=1, regex=True).str[0].str.strip())
+    international = first.str.startswith('+') | first.str.startswith('00')
+    digits = first.str.replace(r'\D', '', regex=True)
+    digits = digits.where(~first.str.startswith('00'), digits.str[2:])
+    valid = digits.str.len().between(MIN_PHONE_DIGITS, MAX_PHONE_DIGITS)
+    phone = ('+' + digits).where(international, digits)
+    return phone.where(valid, '')
+
+
+def read_master(path: str) -> pd.DataFrame:
+    """업체 기본 정보 읽기 - 여러 줄 설명은 한 줄로, 업체명+도메인 기준 중복 제거"""
+    master = pd.read_csv(path, dtype='string', keep_default_na=False)
+    for column in MASTER_COLUMNS:
+        if column not in master.columns:
+            master[column] = ''
+        master[column] = text_series(master[column])
+    master['description'] = master['description'].str.replace(r'\s+', ' ', regex=True)
+    master['domain'] = domain_series(master['website'])
+    master['join_domain'] = join_domain_series(master['domain'])
+    master['company_key'] = normalize_company_series(master['company_name'])
+    return master[master['company_key'] != ''].drop_duplicates(['company_key', 'domain'])
+
+
+def read_details(paths: List[str], store_path: Optional[str] = None) -> pd.DataFrame:
+    """결과 CSV들과 결과 저장소를 하나로 합침 (나중 소스일수록 order가 큼)"""
+    frames = []
+    for order, path in enumerate(paths):
+        frame = pd.read_csv(path, dtype='string', keep_default_na=False)
+        frame = frame.reindex(columns=DETAIL_COLUMNS, fill_value='')
+        frame['contact_source'] = os.path.basename(path)
+        frame['order'] = order
+        frames.append(frame)
+    if store_path and os.path.exists(store_path):
+        with sqlite3.connect(store_path) as conn:
+            frame = pd.read_sql_query(
+                "SELECT company_name, website, contact_email, contact_call FROM results", conn, dtype='string'
+            )
+        frame['contact_source'] = os.path.basename(store_path)
+        frame['order'] = len(paths)
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=DETAIL_COLUMNS + ['contact_source', 'order'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def dedupe_details(details: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    정규화 후 (업체명, 도메인)별/업체명별/도메인별로 가장 좋은 행 1개씩만 남김
+
+    이메일 > 전화번호 > 나중 소스 순서로 선택합니다. 자리표시 도메인은 도메인 키로 쓰지 않습니다.
+
+    Returns:
+        ((업체명, 도메인)별 결과, 업체명별 결과, 도메인별 결과)
+    """
+    details = details.copy()
+    details['contact_email'] = normalize_email_series(details['contact_email'])
+    details['contact_call'] = normalize_phone_series(details['contact_call'])
+    details['join_domain'] = join_domain_series(domain_series(details['website']))
+    details['company_key'] = normalize_company_series(details['company_name'])
+    details['score'] = (details['contact_email'] != '').astype(int) * 2 + (details['contact_call'] != '').astype(int)
+    ranked = details.sort_values(['score', 'order'], ascending=False, kind='stable')
+    with_domain = ranked[ranked['join_domain'] != '']
+    by_pair = with_domain.drop_duplicates(['company_key', 'join_domain'])
+    by_company = ranked.drop_duplicates('company_key')
+    by_domain = with_domain.drop_duplicates('join_domain')
+    return by_pair, by_company, by_domain
+
+
+def fill_contacts(merged: pd.DataFrame, rows: pd.Series, table: pd.DataFrame, on: List[str], match: str):
+    """
+    rows 중 아직 연락처가 붙지 않은 행을 table에서 on 기준으로 채움 (table은 on 기준 중복 없음)
+
+    붙은 행의 contact_match에 match를 기록합니다.
+    """
+    rows = rows & merged['contact_source'].isna()
+    fill = merged.loc[rows, on].merge(table[on + CONTACT_COLUMNS], on=on, how='left')
+    merged.loc[rows, CONTACT_COLUMNS] = fill[CONTACT_COLUMNS].values
+    merged.loc[rows & merged['contact_source'].notna(), 'contact_match'] = match
+
+
+def consolidate(master_path: str = "output/gitex_exhibitors.csv",
+                detail_paths: Optional[List[str]] = None,
+                store_path: Optional[str] = "output/gitex_results.db",
+                output_base: str = "output/gitex_contacts") -> pd.DataFrame:
+    """
+    결과 통합 후 {output_base}.csv / {output_base}.parquet 저장
+
+    Args:
+        master_path: 업체 기본 정보 CSV
+        detail_paths: 결과 CSV 목록 (None이면 output/gitex_exhibitors_detail*.csv)
+        store_path: 결과 저장소 SQLite (없거나 None이면 사용 안 함) - 가장 최신 소스로 취급
+        output_base: 출력 파일 경로 (확장자 제외)
+    """
+    started = time.perf_counter()
+    if detail_paths is None:
+        detail_paths = sorted(glob.glob("output/gitex_exhibitors_detail*.csv"))
+
+    master = read_master(master_path)
+    details = read_details(detail_paths, store_path)
+    by_pair, by_company, by_domain = dedupe_details(details)
+
+    # (업체명, 도메인) -> 업체명 -> 도메인 순서로 붙임. 도메인만으로는 자기 결과 행이 없는 업체에만 붙여
+    # 같은 도메인을 쓰는 다른 업체(계열사/표기 변형)의 결과가 모든 행으로 퍼지지 않게 함
+    # contact_match: 'company_domain' / 'company' / 'domain' (도메인만 같은 다른 업체의 결과) / ''
+    merged = master.assign(**{column: pd.NA for column in CONTACT_COLUMNS}, contact_match='')
+    has_own_row = merged['company_key'].isin(by_company['company_key'])
+    fill_contacts(merged, merged['contact_source'].isna(), by_pair, ['company_key', 'join_domain'], 'company_domain')
+    fill_contacts(merged, has_own_row, by_company, ['company_key'], 'company')
+    fill_contacts(merged, ~has_own_row & (merged['join_domain'] != ''), by_domain, ['join_domain'], 'domain')
+    for column in CONTACT_COLUMNS:
+        merged[column] = text_series(merged[column])
+
+    result = merged[OUTPUT_COLUMNS]
+    os.makedirs(os.path.dirname(output_base) or '.', exist_ok=True)
+    result.to_csv(f"{output_base}.csv", index=False, encoding='utf-8-sig')
+    parquet_path = f"{output_base}.parquet"
+    try:
+        result.to_parquet(parquet_path, index=False)
+    except ImportError as e:
+        parquet_path = None
+        print(f"⚠️ Parquet 내보내기 생략 (pyarrow 필요): {str(e).splitlines()[0]}")
+
+    stats = summarize(master, details, result)
+    print(f"\n{'='*80}")
+    print(f"✅ 통합 완료 ({time.perf_counter() - started:.2f}초): {output_base}.csv"
+          + (f", {parquet_path}" if parquet_path else ""))
+    print(f"   - 결과 소스 {len(detail_paths) + (1 if store_path and os.path.exists(store_path) else 0)}개, "
+          f"결과 행 {stats['detail_rows']}개 -> 도메인 {stats['detail_domains']}개")
+    print(f"   - 업체 {stats['companies']}개 중 연락처 연결 {stats['matched']}개 "
+          f"(이메일 {stats['with_email']}개, 전화번호 {stats['with_phone']}개, "
+          f"도메인만 일치 {stats['domain_only']}개)")
+    if stats['placeholder_domains']:
+        print(f"   - 자리표시 웹사이트 업체 {stats['placeholder_domains']}개는 도메인 매칭 제외 (업체명으로만 연결)")
+    print(f"{'='*80}\n")
+    return result
+
+
+def summarize(master: pd.DataFrame, details: pd.DataFrame, result: pd.DataFrame) -> Dict[str, int]:
+    """통합 결과 통계"""
+    return {
+        'detail_rows': len(details),
+        'detail_domains': int(domain_series(details['website']).replace('', pd.NA).nunique()),
+        'companies': len(master),
+        'placeholder_domains': int(master['domain'].isin(PLACEHOLDER_DOMAINS).sum()),
+        'matched': int((result['contact_source'] != '').sum()),
+        'domain_only': int((result['contact_match'] == 'domain').sum()),
+        'with_email': int((result['contact_email'] != '').sum()),
+        'with_phone': int((result['contact_call'] != '').sum()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연락처 결과 통합/정규화/중복 제거 (CSV + Parquet)")
+    parser.add_argument('--master', default="output/gitex_exhibitors.csv", help="업체 기본 정보 CSV")
+    parser.add_argument('--details', nargs='*', help="결과 CSV (glob 가능, 기본: output/gitex_exhibitors_detail*.csv)")
+    parser.add_argument('--store', default="output/gitex_results.db", help="결과 저장소 SQLite ('' 이면 사용 안 함)")
+    parser.add_argument('--out', default="output/gitex_contacts", help="출력 경로 (확장자 제외)")
+    args = parser.parse_args()
+
+    detail_paths = None
+    if args.details:
+        detail_paths = sorted({path for pattern in args.details for path in glob.glob(pattern)})
+    consolidate(args.master, detail_paths, args.store or None, args.out)
+
+
+if __name__ == "__main__":
+    main()
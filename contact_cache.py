@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+도메인 단위 연락처 캐시
+같은 웹사이트(또는 서브도메인/리다이렉트로 연결된 사이트)를 가리키는 업체가 여러 개일 때
+등록 가능 도메인 기준으로 이전 결과를 재사용하여 에이전트 실행을 생략합니다.
+실행 간에도 유지되도록 SQLite 파일에 저장하며 TTL과 LRU 크기 제한을 둡니다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from url_utils import registrable_domain
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contact_cache (
+    domain        TEXT PRIMARY KEY,
+    contact_email TEXT NOT NULL DEFAULT '',
+    contact_call  TEXT NOT NULL DEFAULT '',
+    source        TEXT NOT NULL DEFAULT '',
+    created_at    REAL NOT NULL,
+    last_access   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contact_cache_last_access ON contact_cache (last_access);
+"""
+
+
+class DomainContactCache:
+    def __init__(self, db_path: str = "output/contact_cache.db",
+                 ttl_days: float = 30, max_entries: int = 10000):
+        """
+        Args:
+            db_path: 캐시 SQLite 파일 경로
+            ttl_days: 항목 유효 기간(일)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.db_path = db_path
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+        # 통계 (이번 실행)
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """URL의 도메인에 대한 캐시된 연락처 조회 (만료 항목은 삭제)"""
+        domain = registrable_domain(url)
+        if not domain:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT contact_email, contact_call, source, created_at FROM contact_cache WHERE domain = ?",
+                (domain,)
+            ).fetchone()
+            if row and now - row[3] > self.ttl:
+                self.conn.execute("DELETE FROM contact_cache WHERE domain = ?", (domain,))
+                self.conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.conn.execute("UPDATE contact_cache SET last_access = ? WHERE domain = ?", (now, domain))
+            self.conn.commit()
+            self.hits += 1
+        return {
+            'contact_email': row[0],
+            'contact_call': row[1],
+            'source': row[2],
+            'domain': domain,
+        }
+
+    def put(self, url: str, result: Dict, source: str = ''):
+        """연락처를 찾은 결과만 도메인 기준으로 저장"""
+        domain = registrable_domain(url)
+        contact_email = (result.get('contact_email') or '').strip()
+        contact_call = (result.get('contact_call') or '').strip()
+        if not domain or not (contact_email or contact_call):
+            return
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO contact_cache "
+                "(domain, contact_email, contact_call, source, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (domain, contact_email, contact_call, source, now, now)
+            )
+            # LRU 크기 제한
+            self.conn.execute(
+                "DELETE FROM contact_cache WHERE domain IN ("
+                "SELECT domain FROM contact_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self.conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM contact_cache").fetchone()[0]
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+정적 HTML 연락처 추출기
+Computer Use 에이전트를 띄우기 전에 일반 HTTP 요청만으로 홈페이지와
+문의 페이지에서 이메일/전화번호를 찾는 1차 추출 단계입니다.
+"""
+
+import re
+from typing import Optional, Dict, Iterable, List, Tuple
+from urllib.parse import urljoin, urlparse, unquote
+
+import requests
+from bs4 import BeautifulSoup
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 홈페이지 다음으로 확인할 문의 페이지 후보
+CONTACT_PATHS = ['/contact', '/contact-us', '/contactus', '/about', '/about-us']
+
+# 링크 텍스트/주소에서 문의 페이지를 판별하는 키워드
+CONTACT_KEYWORDS = ('contact', 'about', 'kontakt', 'contacto', 'contato', 'reach', '문의', 'اتصل')
+
+EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,24}')
+PHONE_PATTERN = re.compile(r'(?:\+|00)\d[\d\s().-]{6,20}\d')
+
+# 파트너십 문의로 적합한 이메일 접두어 (앞에 있을수록 우선)
+PREFERRED_EMAIL_PREFIXES = (
+    'partnership', 'partners', 'partner', 'business', 'bd', 'sales',
+    'contact', 'info', 'hello', 'enquiries', 'enquiry', 'inquiries', 'inquiry', 'office',
+)
+
+# 문의용으로 부적합한 이메일 접두어
+EXCLUDED_EMAIL_PREFIXES = (
+    'noreply', 'no-reply', 'donotreply', 'privacy', 'gdpr', 'rgpd', 'dpo',
+    'abuse', 'postmaster', 'webmaster', 'careers', 'jobs', 'hr', 'recruitment',
+)
+
+# 스크립트/이미지 파일명 등 이메일처럼 보이지만 아닌 값
+EXCLUDED_EMAIL_DOMAINS = ('example.com', 'domain.com', 'sentry.io', 'wixpress.com', 'sentry-next.wixpress.com')
+EXCLUDED_EMAIL_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.js', '.css')
+
+
+def decode_cfemail(encoded: str) -> str:
+    """Cloudflare 이메일 난독화(data-cfemail) 해제"""
+    try:
+        key = int(encoded[:2], 16)
+        return ''.join(chr(int(encoded[i:i + 2], 16) ^ key) for i in range(2, len(encoded), 2))
+    except ValueError:
+        return ''
+
+
+def clean_phone(raw: str) -> str:
+    """전화번호 문자열 정리 (공백 정규화)"""
+    phone = unquote(raw).strip()
+    phone = re.sub(r'\s+', ' ', phone)
+    return phone.strip(' .-')
+
+
+def is_valid_email(email: str) -> bool:
+    """문의용 이메일로 사용할 수 있는지 확인"""
+    email = email.lower()
+    local, _, domain = email.partition('@')
+    if not local or not domain:
+        return False
+    if domain.endswith(EXCLUDED_EMAIL_SUFFIXES) or domain in EXCLUDED_EMAIL_DOMAINS:
+        return False
+    return not local.startswith(EXCLUDED_EMAIL_PREFIXES)
+
+
+def extract_contacts(html: str, base_url: str) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+    """
+    HTML에서 이메일/전화번호 후보를 추출합니다.
+
+    Returns:
+        (emails, phones) - 각각 (값, 출처 점수) 튜플 리스트.
+        mailto:/tel: 링크는 본문 텍스트 매치보다 높은 점수를 받습니다.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    emails, phones = contacts_from_links(link['href'] for link in soup.find_all('a', href=True))
+
+    for elem in soup.select('[data-cfemail]'):
+        address = decode_cfemail(elem['data-cfemail'])
+        if EMAIL_PATTERN.fullmatch(address):
+            emails.append((address, 2))
+
+    for tag in soup(['script', 'style', 'noscript']):
+        tag.decompose()
+    text_emails, text_phones = contacts_from_text(soup.get_text(' '))
+    return emails + text_emails, phones + text_phones
+
+
+def contacts_from_links(hrefs: Iterable[str]) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+    """mailto:/tel: 링크에서 (emails, phones) 후보 추출 (출처 점수 2)"""
+    emails = []
+    phones = []
+    for href in hrefs:
+        href = href.strip()
+        lowered = href.lower()
+        if lowered.startswith('mailto:'):
+            address = unquote(href[7:].split('?')[0]).strip()
+            if EMAIL_PATTERN.fullmatch(address):
+                emails.append((address, 2))
+        elif lowered.startswith('tel:'):
+            phone = clean_phone(href[4:])
+            if len(re.sub(r'\D', '', phone)) >= 7:
+                phones.append((phone, 2))
+    return emails, phones
+
+
+def contacts_from_text(text: str) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+    """보이는 텍스트에서 (emails, phones) 후보 추출 (출처 점수 1, 팩스 번호 제외)"""
+    emails = [(match, 1) for match in EMAIL_PATTERN.findall(text)]
+    phones = []
+    for match in PHONE_PATTERN.finditer(text):
+        # 팩스 번호는 제외
+        context = text[max(0, match.start() - 12):match.start()].lower()
+        if 'fax' in context:
+            continue
+        digits = re.sub(r'\D', '', match.group())
+        if 8 <= len(digits) <= 15:
+            phones.append((clean_phone(match.group()), 1))
+    return emails, phones
+
+
+def rank_email(email: str, source_score: int, site_domain: str) -> int:
+    """파트너십 문의 이메일 우선순위 점수"""
+    local, _, domain = email.lower().partition('@')
+    score = source_score * 10
+    for i, prefix in enumerate(PREFERRED_EMAIL_PREFIXES):
+        if local == prefix or local.startswith(prefix):
+            score += 100 - i * 5
+            break
+    # 회사 도메인과 같은 이메일 우선
+    if site_domain and (domain == site_domain or domain.endswith('.' + site_domain) or site_domain.endswith('.' + domain)):
+        score += 50
+    return score
+
+
+def pick_best_email(candidates: List[Tuple[str, int]], website: str) -> str:
+    """후보 중 파트너십 문의 이메일로 가장 적합한 1개 선택"""
+    site_domain = urlparse(website).netloc.lower()
+    if site_domain.startswith('www.'):
+        site_domain = site_domain[4:]
+
+    best = {}
+    for email, source_score in candidates:
+        if not is_valid_email(email):
+            continue
+        key = email.lower()
+        score = rank_email(key, source_score, site_domain)
+        if score > best.get(key, (None, -1))[1]:
+            best[key] = (email, score)
+
+    if not best:
+        return ''
+    # 점수가 같으면 먼저 발견된 이메일 유지 (dict 순서)
+    return max(best.values(), key=lambda item: item[1])[0]
+
+
+def pick_best_phone(candidates: List[Tuple[str, int]]) -> str:
+    """후보 중 대표 전화번호 1개 선택 (tel: 링크, 국가번호 포함 번호 우선)"""
+    best_phone = ''
+    best_score = -1
+    for phone, source_score in candidates:
+        score = source_score * 10 + (5 if phone.startswith('+') else 0)
+        if score > best_score:
+            best_phone, best_score = phone, score
+    return best_phone
+
+
+def find_contact_links(html: str, base_url: str, limit: int = 3) -> List[str]:
+    """홈페이지에서 같은 사이트의 문의/회사소개 페이지 링크 찾기"""
+    soup = BeautifulSoup(html, 'html.parser')
+    site = urlparse(base_url).netloc
+    links = []
+    for link in soup.find_all('a', href=True):
+        label = f"{link['href']} {link.get_text(' ', strip=True)}".lower()
+        if not any(keyword in label for keyword in CONTACT_KEYWORDS):
+            continue
+        url = urljoin(base_url, link['href']).split('#')[0]
+        if urlparse(url).netloc == site and url not in links:
+            links.append(url)
+        if len(links) >= limit:
+            break
+    return links
+
+
+def fetch_html(url: str, session=None, timeout: int = 10) -> Optional[Tuple[str, str]]:
+    """HTML 페이지 가져오기 - (최종 URL, HTML) 또는 None"""
+    try:
+        http = session or requests
+        response = http.get(url, headers=HEADERS, timeout=timeout)
+        content_type = response.headers.get('Content-Type', '')
+        if response.status_code != 200 or 'html' not in content_type:
+            return None
+        return response.url, response.text
+    except requests.RequestException:
+        return None
+
+
+def find_contacts_static(website: str, session=None, max_pages: int = 4,
+                         timeout: int = 10) -> Optional[Dict]:
+    """
+    일반 HTTP 요청만으로 홈페이지와 문의 페이지에서 연락처를 찾습니다.
+
+    Args:
+        website: 회사 웹사이트 URL
+        session: 재사용할 requests.Session (없으면 매 요청 새 연결)
+        max_pages: 홈페이지를 포함해 가져올 최대 페이지 수
+        timeout: 요청당 타임아웃(초)
+
+    Returns:
+        {"contact_email", "contact_call", "source_url"} 또는 아무것도 찾지 못하면 None
+    """
+    fetched = fetch_html(website, session=session, timeout=timeout)
+    if not fetched:
+        return None
+    home_url, home_html = fetched
+
+    # 홈페이지에서 발견한 문의 링크 + 일반적인 문의 경로
+    candidates = find_contact_links(home_html, home_url)
+    for path in CONTACT_PATHS:
+        url = urljoin(home_url, path)
+        if url not in candidates:
+            candidates.append(url)
+
+    pages = [(home_url, home_html)]
+    emails, phones = extract_contacts(home_html, home_url)
+    for url in candidates:
+        # 홈페이지에서 이메일과 전화번호를 모두 찾았으면 추가 요청 생략
+        if len(pages) >= max_pages or (pick_best_email(emails, home_url) and pick_best_phone(phones)):
+            break
+        fetched = fetch_html(url, session=session, timeout=timeout)
+        if not fetched:
+            continue
+        pages.append(fetched)
+        page_emails, page_phones = extract_contacts(fetched[1], fetched[0])
+        emails.extend(page_emails)
+        phones.extend(page_phones)
+
+    contact_email = pick_best_email(emails, home_url)
+    contact_call = pick_best_phone(phones)
+    if not contact_email and not contact_call:
+        return None
+
+    return {
+        'contact_email': contact_email,
+        'contact_call': contact_call,
+        'source_url': home_url,
+    }
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Computer Use 대화 기록 관리
+최근 K개의 스크린샷만 유지하고 오래된 스크린샷은 텍스트 자리표시자로 바꿔
+턴이 늘어나도 요청 크기와 모델 지연이 일정하게 유지되도록 합니다.
+스크린샷 인코딩(PNG/JPEG/WebP)과 축소도 여기서 처리합니다.
+"""
+
+import asyncio
+import hashlib
+import io
+from typing import List, Optional, Tuple
+from google.genai.types import Content, Part
+
+SCREENSHOT_PLACEHOLDER = "[이전 스크린샷 생략]"
+
+SUPPORTED_FORMATS = ('png', 'jpeg', 'webp')
+
+
+class FrameChangeDetector:
+    def __init__(self, perceptual_threshold: Optional[int] = None):
+        """
+        직전 프레임과 비교해 화면이 바뀌었는지 판별합니다.
+
+        Args:
+            perceptual_threshold: 지정하면 바이트 해시가 달라도 16x16 dHash의
+                해밍 거리가 이 값 이하이면 같은 화면으로 간주 (Pillow 필요).
+                None이면 바이트가 완전히 같을 때만 같은 화면으로 판단
+        """
+        self.perceptual_threshold = perceptual_threshold
+        self.reset()
+
+    def reset(self):
+        """직전 프레임과 통계 초기화 (실행마다 호출)"""
+        self._last_digest = None
+        self._last_dhash = None
+        self.frames_sent = 0
+        self.frames_skipped = 0
+        self.bytes_sent = 0
+        self.bytes_saved = 0
+
+    def is_changed(self, image_bytes: bytes) -> bool:
+        """
+        새 프레임이 마지막으로 보낸 프레임과 다르면 True (True일 때만 기준 프레임 갱신)
+
+        생략한 프레임으로 기준을 옮기면 조금씩 바뀌는 화면(지연 로딩, 작은 스크롤)이
+        매번 임계값 아래로 판정되어 모델이 새 화면을 끝내 받지 못하므로, 기준은 보낸 프레임으로 유지합니다.
+        """
+        digest = hashlib.sha1(image_bytes).digest()
+        if digest == self._last_digest:
+            return False
+        dhash = self._dhash(image_bytes) if self.perceptual_threshold is not None else None
+
+        if dhash is not None and self._last_dhash is not None:
+            if bin(dhash ^ self._last_dhash).count('1') <= self.perceptual_threshold:
+                return False
+
+        self._last_digest = digest
+        self._last_dhash = dhash
+        return True
+
+    def record(self, size: int, sent: bool, copies: int = 1):
+        """전송/생략된 프레임 크기 기록 (copies: 기존 방식이었다면 첨부됐을 횟수)"""
+        if sent:
+            self.frames_sent += 1
+            self.bytes_sent += size
+            self.bytes_saved += size * (copies - 1)
+        else:
+            self.frames_skipped += 1
+            self.bytes_saved += size * copies
+
+    @staticmethod
+    def _dhash(image_bytes: bytes) -> Optional[int]:
+        try:
+            from PIL import Image
+        except ImportError:
+            return None
+        image = Image.open(io.BytesIO(image_bytes)).convert('L').resize((17, 16))
+        pixels = list(image.getdata())
+        value = 0
+        for row in range(16):
+            for col in range(16):
+                left = pixels[row * 17 + col]
+                right = pixels[row * 17 + col + 1]
+                value = (value << 1) | (left > right)
+        return value
+
+
+class ScreenshotEncoder:
+    def __init__(self, image_format: str = 'png', quality: int = 70, scale: float = 1.0):
+        """
+        Args:
+            image_format: 'png', 'jpeg', 'webp' 중 하나
+            quality: JPEG/WebP 품질 (1-100)
+            scale: 축소 비율 (예: 0.5면 720x450). 좌표는 0-1000 정규화 값이라 영향 없음
+        """
+        if image_format not in SUPPORTED_FORMATS:
+            raise ValueError(f"지원하지 않는 스크린샷 형식: {image_format}")
+        self.image_format = image_format
+        self.quality = quality
+        self.scale = scale
+
+    @property
+    def mime_type(self) -> str:
+        return f"image/{self.image_format}"
+
+    @property
+    def needs_pillow(self) -> bool:
+        """Playwright만으로 인코딩할 수 없는 설정인지 (WebP 또는 축소)"""
+        return self.image_format == 'webp' or self.scale != 1.0
+
+    def capture(self, page) -> Tuple[bytes, str]:
+        """페이지 스크린샷을 설정대로 인코딩하여 (바이트, MIME 타입) 반환"""
+        if not self.needs_pillow:
+            if self.image_format == 'jpeg':
+                return page.screenshot(type="jpeg", quality=self.quality), self.mime_type
+            return page.screenshot(type="png"), self.mime_type
+        return self.encode(page.screenshot(type="png"))
+
+    async def capture_async(self, page) -> Tuple[bytes, str]:
+        """capture()의 asyncio 버전 - Pillow 변환은 이벤트 루프를 막지 않도록 스레드에서 실행"""
+        if not self.needs_pillow:
+            if self.image_format == 'jpeg':
+                return await page.screenshot(type="jpeg", quality=self.quality), self.mime_type
+            return await page.screenshot(type="png"), self.mime_type
+        return await asyncio.to_thread(self.encode, await page.screenshot(type="png"))
+
+    def encode(self, png_bytes: bytes) -> Tuple[bytes, str]:
+        """PNG 바이트를 설정된 형식/크기로 변환 (Pillow 필요)"""
+        try:
+            from PIL import Image
+        except ImportError:
+            print("⚠️ Pillow가 설치되지 않아 원본 PNG 스크린샷을 사용합니다. (pip install Pillow)")
+            return png_bytes, "image/png"
+
+        image = Image.open(io.BytesIO(png_bytes))
+        if self.scale != 1.0:
+            size = (max(1, int(image.width * self.scale)), max(1, int(image.height * self.scale)))
+            image = image.resize(size, Image.LANCZOS)
+        if self.image_format == 'png':
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG', optimize=True)
+            return buffer.getvalue(), self.mime_type
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, format=self.image_format.upper(), quality=self.quality)
+        return buffer.getvalue(), self.mime_type
+
+
+class ConversationHistory:
+    def __init__(self, keep_last_screenshots: Optional[int] = 3):
+        """
+        Args:
+            keep_last_screenshots: 이미지를 유지할 최근 스크린샷 수 (None이면 모두 유지)
+        """
+        self.keep_last_screenshots = keep_last_screenshots
+        self.contents: List[Content] = []
+        self.pruned_count = 0
+
+    def append(self, content: Content):
+        """대화 기록에 추가하고 오래된 스크린샷 정리"""
+        self.contents.append(content)
+        self.prune()
+
+    def prune(self):
+        """최근 K개를 제외한 스크린샷을 텍스트 자리표시자로 교체"""
+        if self.keep_last_screenshots is None:
+            return
+
+        seen = 0
+        for content in reversed(self.contents):
+            if content.role != "user" or not content.parts:
+                continue
+            for i in range(len(content.parts) - 1, -1, -1):
+                part = content.parts[i]
+                if part.function_response and part.function_response.parts:
+                    seen += 1
+                    if seen > self.keep_last_screenshots:
+                        part.function_response.parts = None
+                        response = dict(part.function_response.response or {})
+                        response["screenshot"] = SCREENSHOT_PLACEHOLDER
+                        part.function_response.response = response
+                        self.pruned_count += 1
+                elif part.inline_data and (part.inline_data.mime_type or '').startswith('image/'):
+                    seen += 1
+                    if seen > self.keep_last_screenshots:
+                        content.parts[i] = Part(text=SCREENSHOT_PLACEHOLDER)
+                        self.pruned_count += 1
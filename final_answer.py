@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+에이전트 최종 답(연락처) 스키마와 검증
+
+에이전트의 마지막 텍스트가 형식에 맞는 JSON이면 그대로 쓰고, 아니면
+JSON 스키마를 고정한 구조화 응답(response_schema)으로 최종 답만 다시 요청합니다.
+1차 요청은 마지막 스크린샷 + 페이지 텍스트, 검증 실패 시 2차 요청은 이미지 없이 텍스트만 보냅니다.
+"""
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from google.genai import types
+
+from contact_extractor import EMAIL_PATTERN
+
+# 최종 답 필드
+FINAL_FIELDS = ('contact_email', 'contact_call', 'confidence', 'source_url')
+
+FINAL_ANSWER_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        'contact_email': types.Schema(type=types.Type.STRING,
+                                      description="파트너십/영업 문의 이메일 (없으면 빈 문자열)"),
+        'contact_call': types.Schema(type=types.Type.STRING,
+                                     description="대표 전화번호 (없으면 빈 문자열)"),
+        'confidence': types.Schema(type=types.Type.NUMBER, minimum=0, maximum=1,
+                                   description="값이 실제 페이지에 보였는지에 대한 확신 (0~1)"),
+        'source_url': types.Schema(type=types.Type.STRING,
+                                   description="연락처를 확인한 페이지 URL"),
+    },
+    required=list(FINAL_FIELDS),
+    property_ordering=list(FINAL_FIELDS),
+)
+
+FINALIZE_PROMPT = """다음 작업을 수행한 브라우저 에이전트의 탐색이 끝났습니다.
+
+작업: {task}
+
+에이전트의 마지막 응답: {answer}
+현재 페이지: {url}
+
+[현재 페이지 텍스트]
+{text}
+
+[mailto:/tel: 링크]
+{links}
+
+위 정보(와 스크린샷)에 실제로 보이는 값만 사용해 최종 연락처를 JSON으로 답하세요.
+찾을 수 없는 값은 빈 문자열로 두고 confidence를 낮게 주세요."""
+
+RETRY_NOTE = "\n\n이전 답은 형식이 잘못되었습니다 ({error}). 스키마에 맞게 다시 답하세요."
+
+# 전화번호로 인정할 최소 숫자 개수
+MIN_PHONE_DIGITS = 7
+
+
+def parse_json_object(text: Optional[str]) -> Optional[Any]:
+    """텍스트 전체를 JSON으로 읽기 - 앞뒤 ``` 코드블록 표시만 허용 (본문 속 JSON 탐색은 하지 않음)"""
+    if not text:
+        return None
+    text = text.strip()
+    if text.startswith('```'):
+        text = text.split('\n', 1)[1] if '\n' in text else ''
+        text = text.rsplit('```', 1)[0]
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
+
+def validate_final_answer(data: Any, page_url: str = '') -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    최종 답 검증 및 정리
+
+    confidence/source_url이 없는 답(에이전트가 직접 쓴 JSON)은 confidence None, 현재 페이지 URL로 채웁니다.
+
+    Returns:
+        (정리된 답, '') 또는 (None, 오류 설명)
+    """
+    if not isinstance(data, dict):
+        return None, "JSON 객체가 아닙니다"
+    if 'contact_email' not in data and 'contact_call' not in data:
+        return None, "contact_email/contact_call 필드가 없습니다"
+
+    email = data.get('contact_email') or ''
+    phone = data.get('contact_call') or ''
+    if not isinstance(email, str) or not isinstance(phone, str):
+        return None, "contact_email/contact_call은 문자열이어야 합니다"
+    email = email.strip()
+    if email.lower().startswith('mailto:'):
+        email = email[7:].split('?', 1)[0]
+    phone = phone.strip()
+    if email and not EMAIL_PATTERN.fullmatch(email):
+        return None, f"contact_email 형식 오류: {email!r}"
+    if phone and sum(char.isdigit() for char in phone) < MIN_PHONE_DIGITS:
+        return None, f"contact_call 형식 오류: {phone!r}"
+
+    confidence = data.get('confidence')
+    if confidence is not None:
+        if isinstance(confidence, bool) or not isinstance(confidence, (int, float)) or not 0 <= confidence <= 1:
+            return None, f"confidence는 0~1 사이 숫자여야 합니다: {confidence!r}"
+        confidence = float(confidence)
+
+    source_url = data.get('source_url') or ''
+    if not isinstance(source_url, str) or not source_url.startswith(('http://', 'https://')):
+        source_url = page_url
+
+    return {'contact_email': email, 'contact_call': phone,
+            'confidence': confidence, 'source_url': source_url}, ''
+
+
+def finalize_config() -> types.GenerateContentConfig:
+    """구조화 최종 답 요청 설정 (도구 없음, JSON 스키마 고정)"""
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=FINAL_ANSWER_SCHEMA,
+        temperature=0.0,
+    )
+
+
+def build_finalize_contents(task: str, answer: Optional[str], url: str, page: Optional[Dict[str, Any]],
+                            screenshot: Optional[bytes] = None, mime_type: str = 'image/png',
+                            error: str = '', max_chars: int = 8000) -> list:
+    """
+    최종 답 요청 내용 (대화 기록 없이 1회성)
+
+    Args:
+        page: PAGE_CONTACTS_SCRIPT 결과 {'text', 'links'} (없으면 None)
+        screenshot: 마지막 화면 (None이면 텍스트만 전송 - 재요청용)
+        error: 직전 답의 검증 오류 (재요청 시 모델에 알려줌)
+    """
+    page = page if isinstance(page, dict) else {}
+    prompt = FINALIZE_PROMPT.format(
+        task=task,
+        answer=(answer or '(없음)')[:2000],
+        url=url or '(알 수 없음)',
+        text=(page.get('text') or '(없음)')[:max_chars],
+        links=", ".join(page.get('links') or []) or '(없음)',
+    )
+    if error:
+        prompt += RETRY_NOTE.format(error=error)
+    parts = [types.Part(text=prompt)]
+    if screenshot:
+        parts.append(types.Part.from_bytes(data=screenshot, mime_type=mime_type))
+    return [types.Content(role="user", parts=parts)]
+
+
+def read_final_response(response, page_url: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """구조화 응답 검증 - response.parsed(스키마 적용 결과)가 없으면 텍스트를 직접 읽음"""
+    data = getattr(response, 'parsed', None)
+    if data is None:
+        data = parse_json_object(getattr(response, 'text', None))
+    return validate_final_answer(data, page_url)
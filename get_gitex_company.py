@@ -2,46 +2,365 @@
 import requests
 from bs4 import BeautifulSoup
 import csv
+import html as html_lib
+import re
 import time
 import os
-
-def crawl_gitex_exhibitors(start, limit):
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from http_cache import HttpCache
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# 'fast' uses lxml / a targeted scan when available, 'soup' is the original html.parser path
+PARSER_BACKEND = 'fast'
+
+FIELDNAMES = ['company_name', 'stand_no', 'description', 'profile_url', 'website']
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+def create_session(pool_size=10):
+    """Create a keep-alive session shared by all profile page requests"""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class HostThrottle:
+    """Per-host concurrency cap plus a minimum interval between request starts"""
+
+    def __init__(self, max_per_host=4, min_interval=0.2):
+        self.max_per_host = max_per_host
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_slot = {}
+
+    @contextmanager
+    def slot(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.BoundedSemaphore(self.max_per_host))
+        with semaphore:
+            # Reserve the next start time for this host (politeness budget)
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_slot.get(host, now))
+                self._next_slot[host] = start_at + self.min_interval
+            delay = start_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            yield
+
+def crawl_gitex_exhibitors(start, limit, session=None, cache=None, timeout=30):
+    """Fetch one listing page (raises on HTTP errors so an error page is never mistaken for the end of the list)"""
     url = "https://exhibitors.gitex.com/gitex-global-2025/Exhibitor/fetchExhibitors"
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    headers = HEADERS
+
+    if cache:
+        html = cache.fetch(url, method='POST', fields={'limit': limit, 'start': start},
+                           session=session, headers=headers, timeout=timeout, raise_for_status=True)
+        print(f"Response length: {len(html)} (cache: {cache.summary()})")
+        return html
 
     files = {
         'limit': (None, str(limit)),
         'start': (None, str(start))
     }
 
-    response = requests.post(url, files=files, headers=headers)
+    http = session or requests
+    response = http.post(url, files=files, headers=headers, timeout=timeout)
     print(f"Response status: {response.status_code}")
     print(f"Response length: {len(response.text)}")
+    response.raise_for_status()
     return response.text
 
-def get_official_website(profile_url):
+class ListingCrawler:
+    """Fetch listing pages concurrently until the end of the exhibitor list is reached.
+
+    Up to `window` pages are in flight at once. The first empty or short page marks the
+    end of the list: no page past it is requested and in-flight ones are discarded.
+    An empty page is only taken as the end once a re-fetch is empty too and no later page
+    had exhibitors; an empty page followed by a non-empty one is retried like an error.
+    A failed page is retried on its own (exponential backoff); after max_retries it is
+    recorded in failed_pages and the crawl continues with the other pages. If `window`
+    pages in a row fail for good (site down), no new pages are scheduled.
+    """
+
+    def __init__(self, batch_size=50, window=4, max_retries=3, retry_delay=2.0,
+                 session=None, cache=None, timeout=30):
+        self.batch_size = batch_size
+        self.window = window
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.session = session
+        self.cache = cache
+        self.timeout = timeout
+        self.end_index = None
+        self.pages_fetched = 0
+        self.retry_count = 0
+        self.failed_pages = []
+        self._failed_in_row = 0
+
+    def _fetch(self, start, delay):
+        if delay > 0:
+            time.sleep(delay)
+        html = crawl_gitex_exhibitors(start, self.batch_size, session=self.session,
+                                      cache=self.cache, timeout=self.timeout)
+        return parse_exhibitor_data(html)
+
+    def pages(self, start=0, end=None):
+        """Yield (page_start, exhibitors) in completion order as each listing page lands.
+
+        end: optional upper bound for page starts (None = until the list runs out)
+        """
+        next_start = start
+        pending = {}
+        executor = ThreadPoolExecutor(max_workers=self.window)
+        last_nonempty = None  # highest page start that had exhibitors
+        suspected_end = None  # empty page waiting for its confirming re-fetch
+        held_empty = []  # empty pages past suspected_end, re-fetched if it was not the end
+
+        def submit(page_start, attempt, confirm=False):
+            delay = self.retry_delay * 2 ** (attempt - 1) if attempt else (self.retry_delay if confirm else 0)
+            pending[executor.submit(self._fetch, page_start, delay)] = (page_start, attempt, confirm)
+
+        def retry(page_start, attempt, error):
+            if attempt < self.max_retries:
+                self.retry_count += 1
+                print(f"[RETRY] Listing page start={page_start} failed ({error}) - "
+                      f"retry {attempt + 1}/{self.max_retries}")
+                submit(page_start, attempt + 1)
+            else:
+                self.failed_pages.append(page_start)
+                self._failed_in_row += 1
+                print(f"[ERROR] Listing page start={page_start} failed after "
+                      f"{self.max_retries} retries: {error}")
+
+        try:
+            while True:
+                bounds = [bound for bound in (end, self.end_index, suspected_end) if bound is not None]
+                limit = min(bounds) if bounds else None
+                while (len(pending) < self.window and self._failed_in_row < self.window
+                       and (limit is None or next_start < limit)):
+                    submit(next_start, 0)
+                    next_start += self.batch_size
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: pending[f][0]):
+                    page_start, attempt, confirm = pending.pop(future)
+                    past_end = self.end_index is not None and page_start >= self.end_index
+                    try:
+                        exhibitors = future.result()
+                    except Exception as e:
+                        if not past_end:
+                            retry(page_start, attempt, e)
+                        continue
+                    if past_end and not exhibitors:
+                        continue  # past the end of the list
+
+                    self.pages_fetched += 1
+                    self._failed_in_row = 0
+                    later_nonempty = last_nonempty is not None and last_nonempty > page_start
+                    if not exhibitors:
+                        if later_nonempty:
+                            retry(page_start, attempt, "empty page before a non-empty one")
+                        elif suspected_end is not None and page_start > suspected_end:
+                            held_empty.append(page_start)
+                        elif not confirm:
+                            suspected_end = page_start
+                            print(f"[INFO] Empty listing page at {page_start} - fetching it again to confirm the end")
+                            submit(page_start, attempt, confirm=True)
+                        else:
+                            suspected_end = None
+                            if self.end_index is None or page_start < self.end_index:
+                                self.end_index = page_start
+                                print(f"[INFO] End of listing at {page_start} (empty page confirmed)")
+                        continue
+
+                    last_nonempty = page_start if last_nonempty is None else max(last_nonempty, page_start)
+                    if suspected_end is not None and page_start >= suspected_end:
+                        print(f"[INFO] Empty listing page at {suspected_end} was transient - continuing")
+                        suspected_end = None
+                        for held in held_empty:
+                            submit(held, 0)
+                        held_empty.clear()
+                    if past_end:
+                        print(f"[WARN] Listing page start={page_start} has exhibitors past the end at {self.end_index}")
+                    elif len(exhibitors) < self.batch_size and not later_nonempty:
+                        page_end = page_start + len(exhibitors)
+                        if self.end_index is None or page_end < self.end_index:
+                            self.end_index = page_end
+                            print(f"[INFO] End of listing at {page_end} ({len(exhibitors)} on the last page)")
+                    yield page_start, exhibitors
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def summary(self):
+        failed = ", ".join(str(page) for page in sorted(self.failed_pages)) or "none"
+        return (f"pages={self.pages_fetched}, retries={self.retry_count}, "
+                f"end={self.end_index if self.end_index is not None else 'not reached'}, failed={failed}")
+
+def get_official_website(profile_url, session=None, cache=None):
     """Fetch official website from profile page"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(profile_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        website_elem = soup.find('li', class_='social_website')
-        if website_elem:
-            link = website_elem.find('a')
-            if link and 'href' in link.attrs:
-                return link['href']
-        return ""
+        if cache:
+            html = cache.fetch(profile_url, session=session, headers=HEADERS, timeout=10)
+        else:
+            http = session or requests
+            html = http.get(profile_url, headers=HEADERS, timeout=10).text
+        return extract_official_website(html)
     except Exception as e:
         print(f"Error fetching website for {profile_url}: {e}")
         return ""
 
-def parse_exhibitor_data(html):
+def extract_official_website(html, backend=None):
+    """Extract the official website link from a profile page"""
+    if (backend or PARSER_BACKEND) == 'fast':
+        return _extract_official_website_fast(html)
+    return _extract_official_website_soup(html)
+
+def _extract_official_website_soup(html):
+    soup = BeautifulSoup(html, 'html.parser')
+
+    website_elem = soup.find('li', class_='social_website')
+    if website_elem:
+        link = website_elem.find('a')
+        if link and 'href' in link.attrs:
+            return link['href']
+    return ""
+
+_WEBSITE_CLASS = r"(?-i:(?<![\w-])social_website(?![\w-]))"
+_WEBSITE_LI_RE = re.compile(
+    rf"""<li\b[^>]*?\sclass\s*=\s*(?:"[^"]*{_WEBSITE_CLASS}[^"]*"|'[^']*{_WEBSITE_CLASS}[^']*'|social_website(?=[\s/>]))[^>]*>""",
+    re.IGNORECASE
+)
+_LI_END_RE = re.compile(r'</li\s*>|<li\b', re.IGNORECASE)
+_A_TAG_RE = re.compile(r'<a\b[^>]*>', re.IGNORECASE)
+_HREF_RE = re.compile(r"""\shref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+
+def _extract_official_website_fast(html):
+    """Targeted scan: only the li.social_website element is examined, no tree is built"""
+    match = _WEBSITE_LI_RE.search(html)
+    if not match:
+        return ""
+    end = _LI_END_RE.search(html, match.end())
+    segment = html[match.end():end.start() if end else len(html)]
+    link = _A_TAG_RE.search(segment)
+    if not link:
+        return ""
+    href = _HREF_RE.search(link.group())
+    if not href:
+        return ""
+    value = next(group for group in href.groups() if group is not None)
+    return html_lib.unescape(value)
+
+def resolve_official_websites(profile_urls, session=None, max_workers=8,
+                              max_per_host=4, min_interval=0.2, cache=None):
+    """Resolve official websites for a batch of profile pages in parallel.
+
+    Results are returned in the same order as profile_urls; empty URLs map to "".
+    """
+    own_session = session is None
+    session = session or create_session(pool_size=max_workers)
+    throttle = HostThrottle(max_per_host=max_per_host, min_interval=min_interval)
+
+    def resolve(profile_url):
+        if not profile_url:
+            return ""
+        with throttle.slot(profile_url):
+            return get_official_website(profile_url, session=session, cache=cache)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(resolve, profile_urls))
+    finally:
+        if own_session:
+            session.close()
+
+def init_csv(csv_filename):
+    """Create the exhibitor CSV with a header if it does not exist (returns True if created)"""
+    if os.path.exists(csv_filename):
+        return False
+    with open(csv_filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+        writer.writeheader()
+    return True
+
+def append_exhibitor(csv_filename, exhibitor):
+    """Append one exhibitor row to the CSV"""
+    with open(csv_filename, 'a', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES, extrasaction='ignore')
+        writer.writerow(exhibitor)
+
+def load_existing_profile_urls(csv_filename):
+    """Return the set of profile_urls already stored in the output CSV"""
+    if not os.path.exists(csv_filename):
+        return set()
+    with open(csv_filename, newline='', encoding='utf-8-sig') as csvfile:
+        return {row['profile_url'] for row in csv.DictReader(csvfile) if row.get('profile_url')}
+
+def parse_exhibitor_data(html, backend=None):
+    """Parse a listing page into exhibitor dicts"""
+    if (backend or PARSER_BACKEND) == 'fast' and HAS_LXML:
+        return _parse_exhibitor_data_lxml(html)
+    return _parse_exhibitor_data_soup(html)
+
+def _xpath_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def _parse_exhibitor_data_lxml(html):
+    """lxml (C-backed) parser with XPath lookups mirroring the BeautifulSoup selectors"""
+    exhibitors = []
+    if not html or not html.strip():
+        return exhibitors
+    tree = lxml.html.fromstring(html)
+
+    for item in tree.xpath('//div[normalize-space(@class)="item col-12 list-group-item"]'):
+        try:
+            heading = item.xpath(f'.//h4[{_xpath_class("heading")}]')
+            company_name = heading[0].text_content().strip() if heading else ""
+
+            stand_info = item.xpath('.//p[@style="margin-bottom:0;"]')
+            stand_no = stand_info[0].text_content().strip() if stand_info else ""
+
+            description_elem = item.xpath(f'.//p[{_xpath_class("list-group-item-text")}]')
+            description = ""
+            if description_elem:
+                span = description_elem[0].xpath('.//span')
+                description = span[0].text_content().strip() if span else ""
+
+            profile_link = item.xpath('.//a[contains(@href, "ExbDetails")]')
+            profile_url = profile_link[0].get('href') if profile_link else ""
+
+            exhibitors.append({
+                'company_name': company_name,
+                'stand_no': stand_no,
+                'description': description,
+                'profile_url': profile_url
+            })
+
+        except Exception as e:
+            print(f"Parsing error: {e}")
+            continue
+
+    return exhibitors
+
+def _parse_exhibitor_data_soup(html):
     soup = BeautifulSoup(html, 'html.parser')
     exhibitors = []
 
@@ -79,93 +398,186 @@ def parse_exhibitor_data(html):
 
     return exhibitors
 
-def main():
-    import sys
-    import io
-
-    # Fix encoding for Windows console
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-    # ========== Configuration ==========
-    START_INDEX = 1000        # Starting index
-    END_INDEX = 1500       # Ending index (up to 1000)
-    BATCH_SIZE = 50        # How many to fetch per request (50 is recommended)
-    # ===================================
-
-    csv_filename = 'output/gitex_exhibitors.csv'
-    fieldnames = ['company_name', 'stand_no', 'description', 'profile_url', 'website']
-
+def crawl_exhibitors(csv_filename='output/gitex_exhibitors.csv', start_index=0, end_index=None,
+                     batch_size=50, listing_window=4, listing_retries=3, max_workers=8,
+                     max_per_host=4, min_interval=0.2, incremental=True,
+                     http_cache_dir='output/http_cache', resolve=True):
+    """Crawl the exhibitor list into csv_filename (returns the number of rows written).
+
+    end_index: None = until the end of the list is detected
+    incremental: skip profile_urls already stored in the CSV (stored rows without a website are
+                 re-resolved in place when resolve is on, so a failed profile fetch is retried)
+    http_cache_dir: on-disk HTTP cache (None to disable)
+    resolve: fetch each profile page for the official website (False leaves it empty for resolve_missing_websites)
+    """
     print(f"\n{'='*60}")
     print(f"[CONFIGURATION]")
-    print(f"  Start Index: {START_INDEX}")
-    print(f"  End Index: {END_INDEX}")
-    print(f"  Batch Size: {BATCH_SIZE}")
-    print(f"  Expected Total: ~{(END_INDEX - START_INDEX) // BATCH_SIZE * BATCH_SIZE} records")
+    print(f"  Start Index: {start_index}")
+    print(f"  End Index: {end_index if end_index is not None else 'auto (end of list)'}")
+    print(f"  Batch Size: {batch_size} ({listing_window} pages in flight, {listing_retries} retries/page)")
+    print(f"  Workers: {max_workers} (max {max_per_host}/host, {min_interval}s interval)")
+    print(f"  Resolve Websites: {resolve}")
+    print(f"  Incremental: {incremental}")
+    print(f"  HTTP Cache: {http_cache_dir or 'disabled'}")
     print(f"{'='*60}")
 
     # Initialize CSV file with header
-    file_exists = os.path.exists(csv_filename)
-    if not file_exists:
-        with open(csv_filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+    if init_csv(csv_filename):
         print(f"[INFO] Created new CSV file: {csv_filename}")
     else:
         print(f"[INFO] Appending to existing CSV file: {csv_filename}")
 
     total_count = 0
+    skipped_count = 0
+    session = create_session(pool_size=max_workers + listing_window)
+    cache = HttpCache(http_cache_dir) if http_cache_dir else None
+    crawler = ListingCrawler(batch_size=batch_size, window=listing_window, max_retries=listing_retries,
+                             session=session, cache=cache)
+
+    # Incremental sync: profiles already in the CSV are not appended again; the ones stored without
+    # a website (failed profile fetch) are collected and re-resolved in place after the listing
+    stored_rows = load_exhibitor_rows(csv_filename) if incremental else []
+    existing_urls = {row['profile_url'] for row in stored_rows if row.get('profile_url')}
+    unresolved_urls = {row['profile_url'] for row in missing_website_rows(stored_rows)}
+    retry_urls = set()
+    if incremental:
+        print(f"[INFO] {len(existing_urls)} profiles already stored - they will be skipped "
+              f"({len(unresolved_urls)} without a website are retried)")
+
+    try:
+        # Listing pages are fetched concurrently and handled as each one lands (completion order)
+        for start, exhibitors in crawler.pages(start_index, end_index):
+            print(f"\n{'='*60}")
+            print(f"[STEP 1/2] Collected exhibitors list (start={start})")
+            print(f"{'='*60}")
+            print(f"\n[INFO] Parsed {len(exhibitors)} exhibitors from response")
+
+            if incremental:
+                new_exhibitors = [e for e in exhibitors
+                                  if not e['profile_url'] or e['profile_url'] not in existing_urls]
+                skipped_count += len(exhibitors) - len(new_exhibitors)
+                retry_urls.update(e['profile_url'] for e in exhibitors if e['profile_url'] in unresolved_urls)
+                print(f"[INFO] {len(exhibitors) - len(new_exhibitors)} already stored, {len(new_exhibitors)} new")
+                exhibitors = new_exhibitors
+                existing_urls.update(e['profile_url'] for e in exhibitors if e['profile_url'])
+            print(f"[STEP 2/2] {'Fetching official websites and saving' if resolve else 'Saving'} to CSV...")
+            print(f"{'='*60}")
+
+            # Resolve the whole batch in parallel, then write rows in listing order
+            websites = [""] * len(exhibitors)
+            if resolve:
+                batch_started = time.time()
+                websites = resolve_official_websites(
+                    [exhibitor['profile_url'] for exhibitor in exhibitors],
+                    session=session,
+                    max_workers=max_workers,
+                    max_per_host=max_per_host,
+                    min_interval=min_interval,
+                    cache=cache
+                )
+                print(f"[INFO] Resolved {len(websites)} profile pages in {time.time() - batch_started:.1f}s")
+
+            for idx, (exhibitor, website) in enumerate(zip(exhibitors, websites), 1):
+                print(f"\n[{idx}/{len(exhibitors)}] Processing: {exhibitor['company_name']}")
+                print(f"    Stand: {exhibitor['stand_no']}")
 
-    for start in range(START_INDEX, END_INDEX, BATCH_SIZE):
-        print(f"\n{'='*60}")
-        print(f"[STEP 1/2] Collecting exhibitors list (start={start})")
-        print(f"{'='*60}")
-        html = crawl_gitex_exhibitors(start, BATCH_SIZE)
-
-        exhibitors = parse_exhibitor_data(html)
-        print(f"\n[INFO] Parsed {len(exhibitors)} exhibitors from response")
-        print(f"[STEP 2/2] Fetching official website and saving to CSV...")
-        print(f"{'='*60}")
-
-        for idx, exhibitor in enumerate(exhibitors, 1):
-            print(f"\n[{idx}/{len(exhibitors)}] Processing: {exhibitor['company_name']}")
-            print(f"    Stand: {exhibitor['stand_no']}")
-
-            # Fetch official website from profile page
-            if exhibitor['profile_url']:
-                print(f"    Fetching website from profile page...")
-                website = get_official_website(exhibitor['profile_url'])
                 exhibitor['website'] = website
-                if website:
+                if not exhibitor['profile_url']:
+                    print(f"    ✗ No profile URL available")
+                elif website:
                     print(f"    ✓ Website found: {website}")
-                else:
+                elif resolve:
                     print(f"    ✗ Website not found")
-                time.sleep(0.3)  # Be polite to the server
-            else:
-                exhibitor['website'] = ""
-                print(f"    ✗ No profile URL available")
 
-            # Save to CSV immediately
-            with open(csv_filename, 'a', newline='', encoding='utf-8-sig') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writerow({
-                    'company_name': exhibitor['company_name'],
-                    'stand_no': exhibitor['stand_no'],
-                    'description': exhibitor['description'],
-                    'profile_url': exhibitor['profile_url'],
-                    'website': exhibitor['website']
-                })
+                # Save to CSV immediately
+                append_exhibitor(csv_filename, exhibitor)
+
+                total_count += 1
+                print(f"    💾 Saved to CSV (Total: {total_count} records)")
 
-            total_count += 1
-            print(f"    💾 Saved to CSV (Total: {total_count} records)")
+            print(f"\n[PROGRESS] Total saved so far: {total_count} exhibitors")
+    finally:
+        session.close()
 
-        print(f"\n[PROGRESS] Total saved so far: {total_count} exhibitors")
+    retried = 0
+    if resolve and retry_urls:
+        print(f"\n[INFO] Retrying {len(retry_urls)} stored profiles that have no website yet")
+        retried = resolve_missing_websites(csv_filename, max_workers=max_workers, max_per_host=max_per_host,
+                                           min_interval=min_interval, http_cache_dir=http_cache_dir,
+                                           profile_urls=retry_urls)
 
     print(f"\n{'='*60}")
     print(f"[SUCCESS] All data saved successfully!")
     print(f"{'='*60}")
     print(f"File: {csv_filename}")
     print(f"Total records: {total_count}")
-    print(f"Fields: company_name, stand_no, description, profile_url, website")
+    print(f"Skipped (already stored): {skipped_count}")
+    if resolve and retry_urls:
+        print(f"Retried stored profiles without a website: {len(retry_urls)} ({retried} found)")
+    print(f"Listing: {crawler.summary()}")
+    if crawler.failed_pages:
+        print(f"[WARN] Listing pages that failed: {sorted(crawler.failed_pages)} - rerun to fill them in "
+              f"(incremental mode skips what is already stored)")
+    if cache:
+        print(f"HTTP cache: {cache.summary()}")
+    print(f"Fields: {', '.join(FIELDNAMES)}")
+    return total_count
+
+def load_exhibitor_rows(csv_filename):
+    """Read every row of the exhibitor CSV (empty list if it does not exist)"""
+    if not os.path.exists(csv_filename):
+        return []
+    with open(csv_filename, newline='', encoding='utf-8-sig') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+def missing_website_rows(rows):
+    """Rows that have a profile page but no official website yet"""
+    return [row for row in rows if row.get('profile_url') and not (row.get('website') or '').strip()]
+
+def resolve_missing_websites(csv_filename='output/gitex_exhibitors.csv', limit=None, max_workers=8,
+                             max_per_host=4, min_interval=0.2, http_cache_dir='output/http_cache',
+                             profile_urls=None):
+    """Fill in official websites for rows that have a profile_url but no website (returns how many were found).
+
+    profile_urls: only retry these profile pages (None = every row missing a website)
+    The CSV is rewritten atomically once the batch is resolved.
+    """
+    rows = load_exhibitor_rows(csv_filename)
+    targets = missing_website_rows(rows)
+    if profile_urls is not None:
+        targets = [row for row in targets if row['profile_url'] in profile_urls]
+    if limit:
+        targets = targets[:limit]
+    print(f"[INFO] {len(targets)} of {len(rows)} exhibitors need an official website")
+    if not targets:
+        return 0
+
+    cache = HttpCache(http_cache_dir) if http_cache_dir else None
+    started = time.time()
+    websites = resolve_official_websites([row['profile_url'] for row in targets], max_workers=max_workers,
+                                         max_per_host=max_per_host, min_interval=min_interval, cache=cache)
+    found = 0
+    for row, website in zip(targets, websites):
+        if website:
+            row['website'] = website
+            found += 1
+    print(f"[INFO] Resolved {len(targets)} profile pages in {time.time() - started:.1f}s - {found} websites found")
+
+    tmp_path = f"{csv_filename}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, csv_filename)
+    if cache:
+        print(f"HTTP cache: {cache.summary()}")
+    return found
+
+def main():
+    """Same as `python cli.py crawl` (options: python cli.py crawl --help)"""
+    import sys
+    from cli import main as cli_main
+    return cli_main(['crawl', *sys.argv[1:]])
 
 if __name__ == "__main__":
     main()
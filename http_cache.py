@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk HTTP cache with conditional requests (ETag / Last-Modified).
+
+Each cached response is stored as <key>.body plus <key>.json metadata, where the key
+is a hash of the method, URL and form fields. A repeat fetch sends If-None-Match /
+If-Modified-Since and reuses the stored body on 304 Not Modified.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+
+class HttpCache:
+    def __init__(self, cache_dir='output/http_cache', max_age=None):
+        """
+        cache_dir: directory for cached bodies and metadata
+        max_age: seconds during which a cached entry is used without revalidation
+                 (None = always revalidate with a conditional request)
+        """
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        # Serializes body+metadata writes so concurrent fetches of one URL never pair mismatched files
+        self._write_lock = threading.Lock()
+        self.stats = {'fresh': 0, 'not_modified': 0, 'fetched': 0, 'bytes_saved': 0}
+
+    def _key(self, method, url, fields):
+        raw = json.dumps([method.upper(), url, sorted((fields or {}).items())])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        return (os.path.join(self.cache_dir, key + '.json'),
+                os.path.join(self.cache_dir, key + '.body'))
+
+    def _load(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, encoding='utf-8') as f:
+                return meta, f.read()
+        except (OSError, ValueError):
+            return None, None
+
+    def _store(self, key, url, response):
+        meta_path, body_path = self._paths(key)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+        }
+        # Write body first so a crash never leaves metadata pointing at a missing body.
+        # Temp files are unique per write, so other processes sharing the directory cannot collide.
+        with self._write_lock:
+            self._replace(body_path, lambda f: f.write(response.text))
+            self._replace(meta_path, lambda f: json.dump(meta, f))
+
+    def _replace(self, path, write):
+        """Atomically replace path with the output of write(file)"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def fetch(self, url, method='GET', fields=None, session=None, headers=None, timeout=30,
+              raise_for_status=False):
+        """
+        Fetch a page through the cache and return its text.
+
+        fields: form fields for POST requests (sent as multipart, part of the cache key)
+        raise_for_status: raise requests.HTTPError for 4xx/5xx responses instead of returning the error page
+        """
+        http = session or requests
+        key = self._key(method, url, fields)
+        meta, body = self._load(key)
+
+        if meta and self.max_age is not None and time.time() - meta['fetched_at'] < self.max_age:
+            self._count('fresh')
+            self._count('bytes_saved', len(body))
+            return body
+
+        request_headers = dict(headers or {})
+        if meta:
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        files = {name: (None, str(value)) for name, value in fields.items()} if fields else None
+        response = http.request(method, url, files=files, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and body is not None:
+            self._count('not_modified')
+            self._count('bytes_saved', len(body))
+            return body
+
+        self._count('fetched')
+        if raise_for_status:
+            response.raise_for_status()
+        # Only successful responses are cached
+        if response.status_code == 200:
+            self._store(key, url, response)
+        return response.text
+
+    def summary(self):
+        s = self.stats
+        return (f"fresh={s['fresh']}, not_modified={s['not_modified']}, "
+                f"fetched={s['fetched']}, bytes_saved={s['bytes_saved']:,}")
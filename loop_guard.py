@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+에이전트 루프 가드
+- 화면 변화 없이 같은 액션(같은 좌표 클릭, 같은 방향 스크롤 등)이 반복되면 실행하지 않고 막습니다.
+- 화면이 여러 턴 연속으로 바뀌지 않으면 다른 방법을 쓰거나 마무리하라고 모델에 알립니다.
+- 액션마다 현재 페이지 DOM에서 이메일/전화번호를 확인하고, 보이면 바로 최종 JSON을 요청합니다.
+- 경고 후에도 모델이 계속 탐색하면 루프를 멈추고 DOM에서 찾은 연락처를 결과로 사용합니다.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from contact_extractor import contacts_from_links, contacts_from_text, pick_best_email, pick_best_phone
+
+# 보이는 텍스트와 mailto:/tel: 링크만 가져옴 (전체 HTML보다 훨씬 작음)
+PAGE_CONTACTS_SCRIPT = """
+(maxChars) => ({
+    text: (document.body ? document.body.innerText : '').slice(0, maxChars),
+    links: Array.from(document.querySelectorAll('a[href^="mailto:" i], a[href^="tel:" i]'))
+        .map(a => a.getAttribute('href'))
+})
+"""
+
+FINALIZE_MESSAGE = ("현재 페이지에서 연락처를 찾았습니다 (이메일: {email}, 전화번호: {phone}). "
+                    "더 이상 탐색하지 말고 지금 바로 최종 JSON만 출력하세요.")
+UNCHANGED_MESSAGE = ("최근 {count}번의 액션 동안 화면이 바뀌지 않았습니다. 같은 액션을 반복하지 말고 "
+                     "다른 방법을 시도하거나, 찾은 정보로 최종 JSON을 출력하세요.")
+REPEAT_RESULT = {"success": False,
+                 "message": "같은 액션이 화면 변화 없이 반복되어 실행하지 않았습니다. 다른 액션을 선택하거나 최종 JSON을 출력하세요."}
+
+
+class LoopGuard:
+    def __init__(self, max_repeats: int = 2, max_identical: int = 5, max_unchanged: int = 3,
+                 max_strikes: int = 2, check_dom: bool = True, require_phone: bool = False,
+                 dom_max_chars: int = 200000):
+        """
+        Args:
+            max_repeats: 화면 변화 없이 같은 액션을 이 횟수만큼 연속 실행하면 이후 같은 액션은 막음
+            max_identical: 화면이 바뀌더라도 같은 액션을 이 횟수만큼 연속 실행하면 막음 (무한 스크롤 등)
+            max_unchanged: 이 턴 수만큼 연속으로 화면이 안 바뀌면 모델에 경고
+            max_strikes: 막힘/화면 정체 턴이 이 횟수만큼 연속되거나 (화면이 바뀐 정상 턴이면 다시 셈),
+                마무리 요청 후에도 이 횟수만큼 액션을 호출하면 루프 중단
+            check_dom: 액션 후 DOM에서 이메일/전화번호 확인 여부
+            require_phone: True면 이메일과 전화번호가 모두 보여야 마무리 요청 (기본은 이메일만)
+            dom_max_chars: DOM 텍스트 확인 최대 길이
+        """
+        self.max_repeats = max_repeats
+        self.max_identical = max_identical
+        self.max_unchanged = max_unchanged
+        self.max_strikes = max_strikes
+        self.check_dom = check_dom
+        self.require_phone = require_phone
+        self.dom_max_chars = dom_max_chars
+        self.reset()
+
+    def reset(self):
+        """작업마다 호출"""
+        self.last_signature = None
+        self.identical_count = 0
+        self.unchanged_count = 0
+        self.last_screen_changed = True
+        self.strikes = 0  # 연속 막힘/정체 턴 수
+        self.ignored_finalize = 0  # 마무리 요청 후 액션을 호출한 턴 수
+        self.finalize_requested = False
+        self.stop_reason: Optional[str] = None
+        self.contacts: Optional[Dict[str, str]] = None
+
+        # 통계
+        self.blocked_actions = 0
+        self.warnings = 0
+
+    @staticmethod
+    def signature(fname: str, args: Dict[str, Any]) -> str:
+        """액션 비교용 키 (이름 + 인자, safety_decision 제외)"""
+        args = {key: value for key, value in (args or {}).items() if key != 'safety_decision'}
+        return fname + json.dumps(args, sort_keys=True, ensure_ascii=False, default=str)
+
+    def should_block(self, fname: str, args: Dict[str, Any]) -> bool:
+        """액션 실행 직전 호출 - True면 실행하지 않고 REPEAT_RESULT를 응답"""
+        signature = self.signature(fname, args)
+        if signature == self.last_signature:
+            self.identical_count += 1
+        else:
+            self.last_signature = signature
+            self.identical_count = 1
+
+        repeated_without_effect = self.identical_count > self.max_repeats and not self.last_screen_changed
+        if repeated_without_effect or self.identical_count > self.max_identical:
+            self.blocked_actions += 1
+            return True
+        return False
+
+    def contacts_from_dom(self, dom: Dict[str, Any], url: str) -> Optional[Dict[str, str]]:
+        """PAGE_CONTACTS_SCRIPT 결과에서 연락처 선택 - 조건을 만족하지 않으면 None"""
+        emails, phones = contacts_from_links(dom.get('links') or [])
+        text_emails, text_phones = contacts_from_text(dom.get('text') or '')
+        email = pick_best_email(emails + text_emails, url)
+        phone = pick_best_phone(phones + text_phones)
+        if not email or (self.require_phone and not phone):
+            return None
+        return {'contact_email': email, 'contact_call': phone}
+
+    def after_turn(self, results: List[Tuple[str, Dict[str, Any]]], screen_changed: bool,
+                   dom: Optional[Dict[str, Any]], url: str) -> Optional[str]:
+        """
+        액션 실행 + 스크린샷 후 호출
+
+        Returns:
+            함수 응답과 함께 모델에 보낼 안내 문구 (없으면 None).
+            루프를 멈춰야 하면 stop_reason이 설정됩니다.
+        """
+        self.last_screen_changed = screen_changed
+        self.unchanged_count = 0 if screen_changed else self.unchanged_count + 1
+        blocked = any(result is REPEAT_RESULT for _, result in results)
+
+        if isinstance(dom, dict):
+            contacts = self.contacts_from_dom(dom, url)
+            if contacts:
+                self.contacts = contacts
+
+        # 막히거나 화면이 계속 그대로인 턴만 연속으로 셈 - 화면이 바뀐 정상 턴이면 처음부터
+        if blocked or self.unchanged_count >= self.max_unchanged:
+            self.strikes += 1
+        elif screen_changed:
+            self.strikes = 0
+        # 연락처를 이미 찾아 마무리를 요청했는데 계속 액션을 호출한 경우
+        if self.finalize_requested:
+            self.ignored_finalize += 1
+        if self.ignored_finalize >= self.max_strikes:
+            self.stop_reason = 'ignored_finalize'
+            return None
+        if self.strikes >= self.max_strikes:
+            self.stop_reason = 'stuck'
+            return None
+
+        if self.contacts:
+            self.finalize_requested = True
+            return FINALIZE_MESSAGE.format(email=self.contacts['contact_email'],
+                                           phone=self.contacts['contact_call'] or '없음')
+        if self.unchanged_count >= self.max_unchanged:
+            self.warnings += 1
+            return UNCHANGED_MESSAGE.format(count=self.unchanged_count)
+        return None
+
+    @property
+    def intervened(self) -> bool:
+        """가드가 실행을 막거나 모델에 안내했는지 여부 (최대 절약 턴 계산 기준)"""
+        return bool(self.finalize_requested or self.stop_reason or self.blocked_actions or self.warnings)
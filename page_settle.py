@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+이벤트 기반 페이지 안정화 대기
+고정 sleep 대신 네트워크 유휴, DOM 변경 정지, 화면 안정 상태를 확인하고
+페이지가 조용해지는 즉시 반환합니다.
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Dict
+
+# 지정한 시간(quietMs) 동안 DOM 변경이 없으면 resolve, 최대 maxMs 후에는 무조건 resolve
+DOM_QUIET_SCRIPT = """
+([quietMs, maxMs]) => new Promise(resolve => {
+    const started = performance.now();
+    let timer = null;
+    const finish = () => { observer.disconnect(); clearTimeout(timer); clearTimeout(cap); resolve(performance.now() - started); };
+    const observer = new MutationObserver(() => { clearTimeout(timer); timer = setTimeout(finish, quietMs); });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setTimeout(finish, quietMs);
+    const cap = setTimeout(finish, maxMs);
+})
+"""
+
+
+class PageSettler:
+    def __init__(self, max_wait: float = 5.0, network_idle_timeout: float = 2.0,
+                 dom_quiet_ms: int = 300, visual_check: bool = False,
+                 visual_interval: float = 0.25):
+        """
+        Args:
+            max_wait: 액션 1회당 최대 대기 시간(초)
+            network_idle_timeout: networkidle 대기 상한(초) - 이후에는 DOM/화면 기준으로 판단
+            dom_quiet_ms: 이 시간 동안 DOM 변경이 없으면 조용한 것으로 판단
+            visual_check: 연속 스크린샷이 같아질 때까지 추가로 확인할지 여부
+            visual_interval: 화면 안정 확인 간격(초)
+        """
+        self.max_wait = max_wait
+        self.network_idle_timeout = network_idle_timeout
+        self.dom_quiet_ms = dom_quiet_ms
+        self.visual_check = visual_check
+        self.visual_interval = visual_interval
+
+        self.reset()
+
+    def reset(self):
+        """대기 통계 초기화 (실행마다 호출)"""
+        self.total_wait = 0.0
+        self.settle_count = 0
+        self.last_timings = {"network": 0.0, "dom": 0.0, "visual": 0.0, "total": 0.0}
+
+    def settle(self, page, max_wait: float = None) -> Dict[str, float]:
+        """
+        페이지가 조용해질 때까지 대기하고 단계별 대기 시간(초)을 반환합니다.
+        """
+        cap = self.max_wait if max_wait is None else max_wait
+        started = time.monotonic()
+        timings = {}
+
+        def remaining() -> float:
+            return max(0.0, cap - (time.monotonic() - started))
+
+        # 1) 문서 로드 완료 + 네트워크 유휴
+        phase_start = time.monotonic()
+        try:
+            # timeout=0은 Playwright에서 무제한을 뜻하므로 최소 1ms
+            page.wait_for_load_state("load", timeout=max(1.0, remaining() * 1000))
+            page.wait_for_load_state("networkidle",
+                                     timeout=max(1.0, min(self.network_idle_timeout, remaining()) * 1000))
+        except Exception:
+            # 롱폴링/분석 스크립트 때문에 유휴 상태가 오지 않는 사이트가 많음 - 다음 단계로 진행
+            pass
+        timings["network"] = time.monotonic() - phase_start
+
+        # 2) DOM 변경 정지
+        phase_start = time.monotonic()
+        if remaining() > 0:
+            try:
+                page.evaluate(DOM_QUIET_SCRIPT, [self.dom_quiet_ms, int(remaining() * 1000)])
+            except Exception:
+                # 평가 중 페이지 이동 등 - 무시
+                pass
+        timings["dom"] = time.monotonic() - phase_start
+
+        # 3) (선택) 화면 안정 - 연속 스크린샷 비교
+        phase_start = time.monotonic()
+        if self.visual_check:
+            previous = None
+            while remaining() > 0:
+                try:
+                    digest = hashlib.sha1(page.screenshot(type="jpeg", quality=30)).digest()
+                except Exception:
+                    break
+                if digest == previous:
+                    break
+                previous = digest
+                time.sleep(min(self.visual_interval, remaining()))
+        timings["visual"] = time.monotonic() - phase_start
+
+        return self._finish(timings, started)
+
+    async def settle_async(self, page, max_wait: float = None) -> Dict[str, float]:
+        """
+        settle()의 asyncio 버전 (playwright.async_api 페이지용) - 판단 기준은 동일합니다.
+        """
+        cap = self.max_wait if max_wait is None else max_wait
+        started = time.monotonic()
+        timings = {}
+
+        def remaining() -> float:
+            return max(0.0, cap - (time.monotonic() - started))
+
+        phase_start = time.monotonic()
+        try:
+            await page.wait_for_load_state("load", timeout=max(1.0, remaining() * 1000))
+            await page.wait_for_load_state("networkidle",
+                                           timeout=max(1.0, min(self.network_idle_timeout, remaining()) * 1000))
+        except Exception:
+            pass
+        timings["network"] = time.monotonic() - phase_start
+
+        phase_start = time.monotonic()
+        if remaining() > 0:
+            try:
+                await page.evaluate(DOM_QUIET_SCRIPT, [self.dom_quiet_ms, int(remaining() * 1000)])
+            except Exception:
+                pass
+        timings["dom"] = time.monotonic() - phase_start
+
+        phase_start = time.monotonic()
+        if self.visual_check:
+            previous = None
+            while remaining() > 0:
+                try:
+                    digest = hashlib.sha1(await page.screenshot(type="jpeg", quality=30)).digest()
+                except Exception:
+                    break
+                if digest == previous:
+                    break
+                previous = digest
+                await asyncio.sleep(min(self.visual_interval, remaining()))
+        timings["visual"] = time.monotonic() - phase_start
+
+        return self._finish(timings, started)
+
+    def _finish(self, timings: Dict[str, float], started: float) -> Dict[str, float]:
+        """총 대기 시간 기록 및 통계 갱신"""
+        timings["total"] = time.monotonic() - started
+        self.total_wait += timings["total"]
+        self.settle_count += 1
+        self.last_timings = timings
+        return timings
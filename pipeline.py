@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+GITEX 수집 스트리밍 파이프라인
+크롤링 -> 공식 웹사이트 확인 -> 연락처 추출 3단계를 크기 제한 큐로 연결하여
+앞 단계의 결과가 도착하는 즉시 다음 단계가 처리합니다.
+
+- 단계별 동시 실행 수를 따로 설정할 수 있습니다.
+- 큐가 가득 차면 앞 단계가 대기하므로(backpressure) 크롤러가 느린 에이전트보다 멀리 앞서가지 않습니다.
+- 각 단계는 디스크에 체크포인트를 남기므로 중단 후 재실행하면 이어서 처리합니다.
+  (크롤링/웹사이트: output/gitex_exhibitors.csv, 연락처: 결과 저장소 SQLite)
+- Ctrl+C를 누르면 모든 단계에 중단을 알리고, 진행 중인 업체를 마무리한 뒤 저장/종료합니다.
+
+실행: python cli.py pipeline (옵션: python cli.py pipeline --help)
+"""
+
+import csv
+import queue
+import threading
+import time
+
+from get_gitex_company import (
+    ListingCrawler, get_official_website, create_session, HostThrottle,
+    init_csv, append_exhibitor, load_existing_profile_urls
+)
+from http_cache import HttpCache
+from process_exhibitors import ContactWorker, ProgressTracker
+from rate_limiter import RateLimiter
+from result_store import ResultStore
+from url_utils import normalize_company, normalize_website
+from contact_cache import DomainContactCache
+from agent_trace import TurnTracer
+
+# 단계 종료 신호
+STOP = object()
+
+
+class StageCounter:
+    """단계별 처리 건수 (상태 출력용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {}
+
+    def add(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + amount
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self.counts.get(name, 0)
+
+
+def run_pipeline(start_index: int = 0,
+                 end_index: int = None,
+                 batch_size: int = 50,
+                 listing_window: int = 4,
+                 listing_retries: int = 3,
+                 exhibitors_csv: str = "output/gitex_exhibitors.csv",
+                 output_csv: str = "output/gitex_exhibitors_detail.csv",
+                 store_path: str = "output/gitex_results.db",
+                 cache_path: str = "output/contact_cache.db",
+                 http_cache_dir: str = "output/http_cache",
+                 resolve_workers: int = 4,
+                 extract_workers: int = 2,
+                 queue_size: int = 20,
+                 requests_per_minute: float = 60,
+                 tokens_per_minute: float = None,
+                 static_first: bool = True,
+                 text_first: bool = True,
+                 max_per_host: int = 4,
+                 min_interval: float = 0.2,
+                 status_interval: float = 30,
+                 shutdown_timeout: float = 120,
+                 trace_path: str = None):
+    """
+    스트리밍 파이프라인 실행
+
+    Args:
+        start_index / end_index / batch_size: 목록 크롤링 범위 (end_index가 None이면 빈/짧은 페이지에서 자동 종료)
+        listing_window: 동시에 가져올 목록 페이지 수
+        listing_retries: 실패한 목록 페이지별 재시도 횟수 (해당 페이지만 다시 요청)
+        exhibitors_csv: 크롤링/웹사이트 단계 체크포인트 (업체 기본 정보 CSV)
+        output_csv: 종료 시 결과 저장소에서 내보낼 연락처 CSV
+        store_path: 연락처 단계 체크포인트 (결과 저장소)
+        cache_path: 도메인 연락처 캐시 경로 (None이면 사용 안 함)
+        http_cache_dir: 목록/프로필 페이지 HTTP 캐시 경로 (None이면 사용 안 함)
+        resolve_workers: 웹사이트 확인 단계 동시 실행 수
+        extract_workers: 연락처 추출 단계 동시 실행 수 (워커마다 브라우저 풀 1개)
+        queue_size: 단계 사이 큐의 최대 크기 (backpressure 기준)
+        requests_per_minute: 모든 에이전트가 공유하는 분당 Gemini 요청 한도
+        tokens_per_minute: 모든 에이전트가 공유하는 분당 Gemini 토큰 한도 (None이면 제한 없음)
+        static_first: 에이전트 전에 정적 HTML 추출을 시도할지 여부
+        text_first: 비전 에이전트 전에 텍스트 모드 에이전트를 시도할지 여부
+        max_per_host / min_interval: 프로필 페이지 요청 예의(politeness) 설정
+        status_interval: 상태 출력 간격(초)
+        shutdown_timeout: 중단 요청 후 진행 중인 워커를 기다리는 최대 시간(초)
+        trace_path: 에이전트 턴별 추적 이벤트(JSONL) 경로 (None이면 기록 안 함)
+    """
+    init_csv(exhibitors_csv)
+    store = ResultStore(store_path)
+    contact_cache = DomainContactCache(cache_path) if cache_path else None
+    http_cache = HttpCache(http_cache_dir) if http_cache_dir else None
+    rate_limiter = RateLimiter(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute)
+    session = create_session(pool_size=resolve_workers + listing_window)
+    crawler = ListingCrawler(batch_size=batch_size, window=listing_window, max_retries=listing_retries,
+                             session=session, cache=http_cache)
+    throttle = HostThrottle(max_per_host=max_per_host, min_interval=min_interval)
+    tracer = TurnTracer(trace_path) if trace_path else None
+
+    resolve_queue = queue.Queue(maxsize=queue_size)
+    extract_queue = queue.Queue(maxsize=queue_size)
+    csv_lock = threading.Lock()
+    # 추출 단계에 넣은 업체 (재개 투입과 웹사이트 확인 단계가 같은 업체를 두 번 넣지 않도록)
+    queued_keys = set()
+    queued_lock = threading.Lock()
+    counter = StageCounter()
+    progress = ProgressTracker(total=None)
+    # 중단 요청 - 모든 단계가 확인하고 새 작업을 가져가지 않음
+    stop = threading.Event()
+
+    # 이미 크롤링된 프로필 (체크포인트) - 크롤링 단계에서는 건너뛰고 추출 단계에만 재투입
+    known_profiles = load_existing_profile_urls(exhibitors_csv)
+    print(f"📂 기존 업체 {len(known_profiles)}개, 처리 완료 연락처 {len(store)}개")
+
+    def put(target: queue.Queue, item) -> bool:
+        """큐가 가득 차면 대기 (backpressure) - 중단 요청이 오면 넣지 않고 False"""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def queue_extract(company_name: str, website: str) -> bool:
+        """처리되지 않았고 아직 넣지 않은 업체만 추출 단계로 전달 - 넣었으면 True"""
+        key = (normalize_company(company_name), normalize_website(website))
+        with queued_lock:
+            if key in queued_keys or store.is_done(company_name, website):
+                return False
+            queued_keys.add(key)
+        return put(extract_queue, (company_name, website))
+
+    def seed_from_checkpoint():
+        """재개: 웹사이트는 있지만 연락처를 아직 수집하지 않은 기존 업체를 추출 단계로 투입"""
+        with open(exhibitors_csv, newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                if stop.is_set():
+                    return
+                website = (row.get('website') or '').strip()
+                if website and queue_extract(row['company_name'], website):
+                    counter.add('seeded')
+
+    def crawl_stage():
+        """1단계: 목록 페이지를 동시에 가져와, 도착하는 페이지마다 새 업체를 웹사이트 확인 단계로 전달"""
+        try:
+            for _, exhibitors in crawler.pages(start_index, end_index):
+                counter.add('listing_pages')
+                for exhibitor in exhibitors:
+                    if exhibitor['profile_url'] and exhibitor['profile_url'] in known_profiles:
+                        continue
+                    if not put(resolve_queue, exhibitor):
+                        return
+                    known_profiles.add(exhibitor['profile_url'])
+                    counter.add('crawled')
+            print(f"🏁 목록 크롤링 종료 ({crawler.summary()})")
+        finally:
+            for _ in range(resolve_workers):
+                put(resolve_queue, STOP)
+
+    def resolve_stage():
+        """2단계: 프로필 페이지에서 공식 웹사이트 확인 -> CSV 체크포인트 -> 추출 단계로 전달"""
+        while True:
+            exhibitor = resolve_queue.get()
+            if exhibitor is STOP or stop.is_set():
+                break
+            website = ""
+            if exhibitor['profile_url']:
+                with throttle.slot(exhibitor['profile_url']):
+                    website = get_official_website(exhibitor['profile_url'], session=session, cache=http_cache)
+            exhibitor['website'] = website
+            with csv_lock:
+                append_exhibitor(exhibitors_csv, exhibitor)
+            counter.add('resolved')
+            if website:
+                queue_extract(exhibitor['company_name'], website)
+
+    def extract_stage(worker_id: int):
+        """3단계: 연락처 수집 -> 결과 저장소 체크포인트"""
+        contact_worker = ContactWorker(store, rate_limiter, cache=contact_cache, static_first=static_first,
+                                       tracer=tracer, text_first=text_first)
+        try:
+            while True:
+                item = extract_queue.get()
+                if item is STOP or stop.is_set():
+                    break
+                company_name, website = item
+                if store.is_done(company_name, website):
+                    continue  # 다른 프로세스가 그사이 처리함
+                status = contact_worker.process(company_name, website, label=f"추출 {worker_id}")
+                progress.record(status, company_name)
+        finally:
+            contact_worker.close()
+
+    upstream = [threading.Thread(target=seed_from_checkpoint, name="seed", daemon=True),
+                threading.Thread(target=crawl_stage, name="crawl", daemon=True)]
+    upstream += [threading.Thread(target=resolve_stage, name=f"resolve-{i + 1}", daemon=True)
+                 for i in range(resolve_workers)]
+    extractors = [threading.Thread(target=extract_stage, args=(i + 1,), name=f"extract-{i + 1}", daemon=True)
+                  for i in range(extract_workers)]
+
+    def close_extract_stage():
+        """앞 단계가 모두 끝나면 추출 워커에 종료 신호 전달"""
+        for thread in upstream:
+            thread.join()
+        for _ in range(extract_workers):
+            put(extract_queue, STOP)
+
+    def shutdown():
+        """중단: 중단 표시 -> 대기 중인 항목 버림 -> 워커마다 STOP 전달 -> 진행 중인 업체가 끝날 때까지 대기"""
+        stop.set()
+        for target, workers in ((resolve_queue, resolve_workers), (extract_queue, extract_workers)):
+            while True:
+                try:
+                    target.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in range(workers):
+                try:
+                    target.put_nowait(STOP)
+                except queue.Full:
+                    break  # 큐에 남은 항목을 가져가도 중단 표시를 보고 종료함
+        deadline = time.monotonic() + shutdown_timeout
+        for thread in extractors + upstream:
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+        running = [thread.name for thread in extractors + upstream if thread.is_alive()]
+        if running:
+            print(f"⚠️ {shutdown_timeout:.0f}초 안에 끝나지 않은 워커: {', '.join(running)} - 해당 업체는 재실행 시 다시 처리")
+
+    closer = threading.Thread(target=close_extract_stage, name="close-extract", daemon=True)
+    for thread in upstream + extractors + [closer]:
+        thread.start()
+
+    try:
+        while any(thread.is_alive() for thread in extractors):
+            for thread in extractors:
+                thread.join(timeout=status_interval)
+                if thread.is_alive():
+                    break
+            print(f"📊 [파이프라인] 목록 {counter.get('listing_pages')}페이지, 크롤링 {counter.get('crawled')}, "
+                  f"웹사이트 확인 {counter.get('resolved')}, 재개 투입 {counter.get('seeded')}, "
+                  f"연락처 처리 {progress.done} | 큐: 확인 대기 {resolve_queue.qsize()}, "
+                  f"추출 대기 {extract_queue.qsize()}")
+    except KeyboardInterrupt:
+        print("\n🛑 중단 요청 - 진행 중인 업체를 마무리하고 저장합니다 (재실행 시 이어서 처리)")
+        shutdown()
+    finally:
+        exported = store.export_csv(output_csv)
+        store.close()
+        if contact_cache is not None:
+            contact_cache.close()
+        if tracer is not None:
+            tracer.close()
+        session.close()
+
+    print(f"\n{'='*80}")
+    print(f"✅ 파이프라인 완료! 업체: {exhibitors_csv}, 연락처: {output_csv} ({exported}개)")
+    print(f"   - 연락처 처리: {progress.done}개 (성공 {progress.success_count}, 실패 {progress.fail_count}, "
+          f"정적 {progress.static_count}, 캐시 {progress.cache_count}, 텍스트 {progress.text_count})")
+    print(f"   - Gemini 스케줄러: {rate_limiter.summary()}")
+    print(f"   - 목록: {crawler.summary()}")
+    if crawler.failed_pages:
+        print(f"   ⚠️ 실패한 목록 페이지 {sorted(crawler.failed_pages)} - 재실행하면 빠진 업체만 추가됩니다")
+    if http_cache:
+        print(f"   - HTTP 캐시: {http_cache.summary()}")
+    if trace_path:
+        print(f"   - 에이전트 추적: {trace_path} (요약: python agent_trace.py {trace_path})")
+    print(f"{'='*80}\n")
+
+
+if __name__ == "__main__":
+    import sys
+    from cli import main
+
+    # python cli.py pipeline 과 같음 - 예: python pipeline.py --resolve-workers 4 --extract-workers 2
+    sys.exit(main(['pipeline', *sys.argv[1:]]))
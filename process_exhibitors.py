@@ -4,25 +4,289 @@ GITEX 참가 업체 연락처 정보 수집 스크립트
 CSV에서 업체 정보를 읽어 Computer Use Agent로 연락처 정보를 수집합니다.
 """
 
-import pandas as pd
 import os
-from computer_use_gemini import ComputerUseAgent
+from contact_extractor import find_contacts_static
+from contact_cache import DomainContactCache
+from agent_trace import TurnTracer, summarize as summarize_trace
+from rate_limiter import RateLimiter
+from result_store import ResultStore, STATUS_ERROR
+from work_queue import WorkQueue, STATE_FAILED, STATE_PENDING, default_worker_id
+from url_utils import normalize_company, normalize_website
 from pathlib import Path
+import queue
+import requests
+import threading
 import time
+from typing import TYPE_CHECKING, Optional, Tuple
+
+# pandas / google.genai / playwright는 실제로 처리할 업체가 있을 때만 불러옴 (재개/상태 확인 시 빠른 시작)
+if TYPE_CHECKING:
+    from computer_use_gemini import ComputerUseAgent
+    from text_agent import TextContactAgent
+
+TASK_TEMPLATE = "{website} 페이지에서 회사 파트너십 문의 이메일로 판단할 수 있는 이메일(contact_email) 1개와 대표 전화번호(contact_call) 1개를 찾아서 json 형식으로 주세요"
+
+
+class ProgressTracker:
+    """여러 워커가 공유하는 진행 상황/처리량 집계"""
+
+    def __init__(self, total: Optional[int]):
+        self.total = total
+        self.done = 0
+        self.success_count = 0
+        self.fail_count = 0
+        self.static_count = 0
+        self.cache_count = 0
+        self.text_count = 0
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def record(self, status: str, company_name: str):
+        """처리 결과 1건 반영 후 진행 상황 출력 (status: cache/static/text/agent/failed)"""
+        with self._lock:
+            self.done += 1
+            if status == 'failed':
+                self.fail_count += 1
+            else:
+                self.success_count += 1
+            if status == 'static':
+                self.static_count += 1
+            elif status == 'cache':
+                self.cache_count += 1
+            elif status == 'text':
+                self.text_count += 1
+            elapsed = time.time() - self.started
+            per_hour = self.done / elapsed * 3600 if elapsed > 0 else 0.0
+            print(f"📈 진행: {self.done}/{self.total if self.total is not None else '?'} ({company_name}) | "
+                  f"처리량 {per_hour:.1f}개/시간 | 경과 {elapsed / 60:.1f}분")
+
+
+def collect_contacts(company_name: str, website: str, get_agent, session=None,
+                     static_first: bool = True, cache: DomainContactCache = None,
+                     get_text_agent=None):
+    """
+    업체 1개의 연락처를 수집합니다.
+
+    Args:
+        get_agent: ComputerUseAgent를 돌려주는 함수 (필요할 때만 생성하기 위함)
+        cache: 도메인 단위 연락처 캐시 (있으면 가장 먼저 확인)
+        get_text_agent: TextContactAgent를 돌려주는 함수 (있으면 비전 에이전트 전에 텍스트 모드 시도)
+
+    Returns:
+        (record, status) - status는 'cache', 'static', 'text', 'agent', 'failed' 중 하나
+    """
+    record = {
+        'company_name': company_name,
+        'website': website,
+        'contact_email': '',
+        'contact_call': ''
+    }
+    result = None
+    status = 'agent'
+
+    # 0차: 같은 도메인의 이전 결과 재사용
+    if cache is not None:
+        result = cache.get(website)
+        if result:
+            status = 'cache'
+            print(f"♻️ 도메인 캐시 적중 ({result['domain']}) - 에이전트 생략 ({company_name})")
+
+    # 1차: 정적 HTML에서 연락처 찾기 (브라우저/모델 호출 없음)
+    if not result and static_first:
+        result = find_contacts_static(website, session=session)
+        if result:
+            status = 'static'
+            print(f"⚡ 정적 HTML에서 연락처 발견 - 에이전트 생략 ({company_name})")
+            # 리다이렉트된 최종 사이트 도메인으로도 캐시
+            if cache is not None and result.get('source_url'):
+                cache.put(result['source_url'], result, source=status)
+
+    task = TASK_TEMPLATE.format(website=website)
+
+    # 2차: 페이지 텍스트/링크만 보는 저렴한 텍스트 모드 에이전트
+    if not result and get_text_agent is not None:
+        result = get_text_agent().run_task(task=task, url=website)
+        if result:
+            status = 'text'
+        else:
+            print(f"🔁 텍스트 모드 실패 - 비전 에이전트로 전환 ({company_name})")
+
+    # 3차: 그래도 없으면 Computer Use Agent(스크린샷) 실행
+    if not result:
+        status = 'agent'
+        result = get_agent().run_task(task=task, url=website, max_turns=15)
+
+    if result and isinstance(result, dict):
+        record['contact_email'] = result.get('contact_email', '')
+        record['contact_call'] = result.get('contact_call', '')
+        if cache is not None and status != 'cache':
+            cache.put(website, result, source=status)
+        print(f"✅ 성공: {company_name}")
+        print(f"   이메일: {record['contact_email']}")
+        print(f"   전화번호: {record['contact_call']}")
+        return record, status
+
+    print(f"⚠️ JSON 추출 실패: {company_name}")
+    return record, 'failed'
+
+
+class ContactWorker:
+    """
+    워커 스레드 1개가 소유하는 연락처 수집 자원 (HTTP 세션, 브라우저 풀, 에이전트)
+
+    Playwright sync API는 스레드에 묶여 있으므로 생성한 스레드에서만 사용하고 닫아야 합니다.
+    """
+
+    def __init__(self, store: ResultStore, rate_limiter: RateLimiter,
+                 cache: DomainContactCache = None, static_first: bool = True,
+                 browsers_per_worker: int = 1, max_tasks_per_browser: int = 50,
+                 tracer: TurnTracer = None, text_first: bool = True):
+        self.store = store
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.static_first = static_first
+        self.tracer = tracer
+        self.text_first = text_first
+
+        # 정적 HTML 추출에 재사용할 HTTP 세션
+        self.session = requests.Session() if static_first else None
+
+        # 브라우저 풀 (브라우저 실행 비용은 워커당 1회) - 에이전트도 재사용
+        from browser_pool import BrowserPool
+        self.browser_pool = BrowserPool(size=browsers_per_worker, headless=True,
+                                        max_tasks_per_browser=max_tasks_per_browser)
+        self.agent = None
+        self.text_agent = None
+
+    def get_agent(self) -> 'ComputerUseAgent':
+        """에이전트는 처음 필요할 때 한 번만 생성"""
+        if self.agent is None:
+            from computer_use_gemini import ComputerUseAgent
+            self.agent = ComputerUseAgent(headless=True, browser_pool=self.browser_pool,
+                                          rate_limiter=self.rate_limiter, tracer=self.tracer)
+        return self.agent
+
+    def get_text_agent(self) -> 'TextContactAgent':
+        """텍스트 모드 에이전트 - 비전 에이전트와 브라우저 풀/속도 제한기/추적기를 공유"""
+        if self.text_agent is None:
+            from text_agent import TextContactAgent
+            self.text_agent = TextContactAgent(headless=True, browser_pool=self.browser_pool,
+                                               rate_limiter=self.rate_limiter, tracer=self.tracer)
+        return self.text_agent
+
+    def collect(self, company_name: str, website: str, label: str = ""):
+        """업체 1개의 연락처 수집 (저장하지 않음) - (record, status)"""
+        print(f"\n{'='*80}")
+        print(f"[{label}] 처리 중: {company_name}")
+        print(f"Website: {website}")
+        print(f"{'='*80}\n")
+        return collect_contacts(company_name, website, self.get_agent,
+                                session=self.session, static_first=self.static_first,
+                                cache=self.cache,
+                                get_text_agent=self.get_text_agent if self.text_first else None)
+
+    def process(self, company_name: str, website: str, label: str = "") -> str:
+        """업체 1개를 처리하고 결과를 저장소에 즉시 upsert - 처리 status 반환"""
+        try:
+            record, status = self.collect(company_name, website, label)
+            self.store.upsert(record['company_name'], record['website'],
+                              record['contact_email'], record['contact_call'], source=status)
+            print(f"💾 {self.store.db_path}에 저장 완료")
+        except Exception as e:
+            print(f"❌ 오류 발생 ({company_name}): {str(e)}")
+            status = 'failed'
+            # 오류 발생 시에도 저장 (상태 컬럼으로 구분)
+            self.store.upsert(company_name, website, status=STATUS_ERROR, source='error', error=str(e))
+            print(f"💾 {self.store.db_path}에 저장 완료 (오류)")
+        return status
+
+    def process_job(self, job: dict, work_queue: WorkQueue, label: str = "") -> Optional[str]:
+        """
+        작업 큐에서 임대한 업체 1개 처리 - 임대를 가지고 있을 때만 결과 저장
+
+        에이전트가 다시 발생시킨 오류(재시도를 다 쓴 Gemini 요청, 브라우저 실행 실패)는 빈 결과로
+        complete()하지 않고 fail()로 넘겨 max_attempts까지 다시 대기열에 넣습니다.
+
+        Returns:
+            처리 status (오류로 다시 대기열에 넣었으면 'retry', 시도 횟수를 다 썼으면 'failed',
+            임대를 잃어 결과를 버렸으면 None)
+        """
+        company_name, website = job['company_name'], job['website']
+        try:
+            with work_queue.keep_alive(job):
+                record, status = self.collect(company_name, website, label)
+        except Exception as e:
+            print(f"❌ 오류 발생 ({company_name}): {str(e)}")
+            state = work_queue.fail(job, f"{type(e).__name__}: {e}")
+            if state == STATE_PENDING:
+                print(f"🔁 다시 시도할 작업으로 반납 (시도 {job['attempts']}/{work_queue.max_attempts})")
+                return 'retry'
+            if state == STATE_FAILED:
+                return 'failed'
+            print(f"⚠️ 임대가 만료되어 다른 워커가 가져간 작업입니다 - 오류를 기록하지 않습니다 ({company_name})")
+            return None
+
+        if work_queue.complete(job, record['contact_email'], record['contact_call'], source=status):
+            print(f"💾 {work_queue.db_path}에 저장 완료")
+            return status
+        print(f"⚠️ 임대가 만료되어 다른 워커가 가져간 작업입니다 - 결과를 저장하지 않습니다 ({company_name})")
+        return None
+
+    def close(self):
+        if self.browser_pool.playwright:
+            self.browser_pool.close()
+        if self.session:
+            self.session.close()
+
 
 def process_exhibitors(input_csv: str = "output/gitex_exhibitors.csv",
                        output_csv: str = "output/gitex_exhibitors_detail.csv",
                        test_limit: int = 5,
-                       start_index: int = 0):
+                       start_index: int = 0,
+                       static_first: bool = True,
+                       text_first: bool = True,
+                       workers: int = 1,
+                       requests_per_minute: float = 60,
+                       tokens_per_minute: Optional[float] = None,
+                       browsers_per_worker: int = 1,
+                       max_tasks_per_browser: int = 50,
+                       store_path: str = "output/gitex_results.db",
+                       cache_path: str = "output/contact_cache.db",
+                       cache_ttl_days: float = 30,
+                       cache_max_entries: int = 10000,
+                       trace_path: Optional[str] = None,
+                       work_queue: bool = False,
+                       lease_seconds: float = 900,
+                       max_attempts: int = 3,
+                       shard: Optional[Tuple[int, int]] = None):
     """
     업체 정보를 처리하여 연락처 정보를 수집합니다.
 
     Args:
         input_csv: 입력 CSV 파일 경로
-        output_csv: 출력 CSV 파일 경로
+        output_csv: 출력 CSV 파일 경로 (실행 종료 시 결과 저장소에서 내보냄)
         test_limit: 테스트용 처리 개수 제한 (None이면 전체 처리)
         start_index: 시작할 업체 인덱스 (0부터 시작)
+        static_first: 에이전트 실행 전에 정적 HTML에서 먼저 연락처를 찾을지 여부
+        text_first: 비전 에이전트 전에 텍스트 모드 에이전트(페이지 텍스트 + 링크)를 먼저 시도할지 여부
+        workers: 동시에 실행할 에이전트(워커 스레드) 수
+        requests_per_minute: 모든 워커가 공유하는 분당 Gemini 요청 한도
+        tokens_per_minute: 모든 워커가 공유하는 분당 Gemini 토큰 한도 (None이면 제한 없음)
+        browsers_per_worker: 워커별 브라우저 풀 크기 (실행 동안 재사용)
+        max_tasks_per_browser: 브라우저 재시작 전 최대 처리 업체 수
+        store_path: 결과 저장소(SQLite) 경로 - 재개/중복 제거의 기준
+        cache_path: 도메인 연락처 캐시 경로 (None이면 캐시 사용 안 함)
+        cache_ttl_days: 캐시 항목 유효 기간(일)
+        cache_max_entries: 캐시 최대 항목 수 (LRU)
+        trace_path: 에이전트 턴별 추적 이벤트(JSONL) 경로 (None이면 기록 안 함)
+        work_queue: True면 결과 저장소 파일의 작업 큐(WorkQueue)로 업체를 임대받아 처리 -
+            같은 store_path로 여러 프로세스를 실행해도 업체마다 한 번만 처리됩니다.
+        lease_seconds: 작업 큐 임대 유효 시간(초) - 처리 중에는 자동 연장, 워커가 죽으면 만료 후 회수
+        max_attempts: 작업 큐 모드에서 업체별 최대 시도 횟수
+        shard: (번호, 개수) - 작업 큐 모드에서 해시로 나눈 업체 중 이 번호만 처리 (호스트별 분할)
     """
+    import pandas as pd
+
     # CSV 읽기
     print(f"📂 {input_csv} 파일을 읽는 중...")
     df = pd.read_csv(input_csv)
@@ -42,132 +306,152 @@ def process_exhibitors(input_csv: str = "output/gitex_exhibitors.csv",
         df_with_website = df_with_website.head(test_limit)
         print(f"🧪 테스트 모드: {test_limit}개 업체만 처리합니다.")
 
-    # 기존 CSV 파일이 있으면 읽기, 없으면 새로 생성
-    if os.path.exists(output_csv):
-        result_df = pd.read_csv(output_csv)
-        results = result_df.to_dict('records')
-        print(f"📂 기존 결과 파일 발견: {len(results)}개 업체 데이터 로드")
+    # 결과 저장소 열기 - 처음이면 기존 결과 CSV를 가져와서 이어서 처리
+    store = ResultStore(store_path)
+    if len(store) == 0 and os.path.exists(output_csv):
+        imported = store.import_csv(output_csv)
+        print(f"📂 기존 결과 파일 가져오기: {imported}행 -> {len(store)}개 업체")
     else:
-        results = []
-        # 헤더만 있는 CSV 생성
-        pd.DataFrame(columns=['company_name', 'website', 'contact_email', 'contact_call']).to_csv(
-            output_csv, index=False, encoding='utf-8-sig'
-        )
-        print(f"📂 새로운 결과 파일 생성: {output_csv}")
+        print(f"📂 결과 저장소: {store_path} ({len(store)}개 업체)")
 
-    # Computer Use Agent 초기화 (headless=True로 백그라운드 실행)
-    print("\n🤖 Computer Use Agent를 초기화합니다...\n")
-
-    # 이미 처리된 업체 확인
-    processed_companies = {r['company_name'] for r in results} if results else set()
-
-    # 각 업체 처리
-    success_count = 0
-    fail_count = 0
-
-    for idx, row in df_with_website.iterrows():
-        company_name = row['company_name']
-        website = row['website']
+    tasks = queue.Queue()
+    jobs = None
+    if work_queue:
+        # 공유 작업 큐에 등록 (이미 등록/처리된 업체는 무시) - 다른 프로세스와 함께 임대받아 처리
+        jobs = WorkQueue(store_path, lease_seconds=lease_seconds, max_attempts=max_attempts, shard=shard)
+        added = jobs.enqueue(zip(df_with_website['company_name'], df_with_website['website']))
+        counts = jobs.counts()
+        total = counts.get('pending', 0) + counts.get('leased', 0)
+        print(f"📋 작업 큐: 새로 등록 {added}개 | {jobs.summary()}"
+              + (f" | shard {shard[0]}/{shard[1]}" if shard else ""))
+    else:
+        # 처리할 업체 목록 (이미 처리됐거나 입력에 중복된 업체 제외)
+        queued_keys = set()
+        skip_count = 0
+        for _, row in df_with_website.iterrows():
+            company_name = row['company_name']
+            website = row['website']
+            key = (normalize_company(company_name), normalize_website(website))
+            if key in queued_keys or store.is_done(company_name, website):
+                skip_count += 1
+                continue
+            queued_keys.add(key)
+            tasks.put((company_name, website))
+        if skip_count:
+            print(f"⏭️ 스킵 (이미 처리됨/중복): {skip_count}개")
+        total = tasks.qsize()
 
-        # 이미 처리된 업체는 스킵
-        if company_name in processed_companies:
-            print(f"⏭️ 스킵 (이미 처리됨): {company_name}")
-            continue
+    # 처리할 업체가 없으면(모두 처리됨) 워커/브라우저를 만들지 않음
+    workers = max(1, min(workers, total)) if total else 0
+    print(f"\n🤖 Computer Use Agent 워커 {workers}개로 {total}개 업체를 처리합니다...\n")
 
-        print(f"\n{'='*80}")
-        print(f"[{len(results)+1}/{len(df_with_website)}] 처리 중: {company_name}")
-        print(f"Website: {website}")
-        print(f"{'='*80}\n")
+    progress = ProgressTracker(total)
+    cache = DomainContactCache(cache_path, ttl_days=cache_ttl_days,
+                               max_entries=cache_max_entries) if cache_path else None
+    rate_limiter = RateLimiter(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute)
+    trace_events = []
+    tracer = TurnTracer(trace_path, hook=trace_events.append) if trace_path else None
+    # 중단 요청 - 워커는 새 업체를 가져가지 않음. 작업 큐 모드에서는 처리 중인 작업을 반납
+    stop = threading.Event()
+    in_flight = {}  # 워커 번호 -> 임대한 작업
 
+    def worker(worker_id: int):
+        """큐가 빌 때까지 업체를 꺼내 처리 (Playwright는 스레드별로 생성)"""
+        contact_worker = ContactWorker(store, rate_limiter, cache=cache, static_first=static_first,
+                                       browsers_per_worker=browsers_per_worker,
+                                       max_tasks_per_browser=max_tasks_per_browser, tracer=tracer,
+                                       text_first=text_first)
         try:
-            # Agent 생성 (매번 새로 생성)
-            agent = ComputerUseAgent(headless=True)
-
-            # 작업 실행
-            task = f"{website} 페이지에서 회사 파트너십 문의 이메일로 판단할 수 있는 이메일(contact_email) 1개와 대표 전화번호(contact_call) 1개를 찾아서 json 형식으로 주세요"
+            if jobs is not None:
+                lease_owner = default_worker_id(str(worker_id))
+                while not stop.is_set():
+                    job = jobs.lease(lease_owner)
+                    if job is None:
+                        break
+                    in_flight[worker_id] = job
+                    try:
+                        status = contact_worker.process_job(job, jobs, label=f"워커 {worker_id}")
+                    finally:
+                        in_flight.pop(worker_id, None)
+                    if status not in (None, 'retry'):
+                        progress.record(status, job['company_name'])
+                return
+            while not stop.is_set():
+                try:
+                    company_name, website = tasks.get_nowait()
+                except queue.Empty:
+                    break
+                status = contact_worker.process(company_name, website, label=f"워커 {worker_id}")
+                progress.record(status, company_name)
+        finally:
+            contact_worker.close()
 
-            result = agent.run_task(task=task, url=website, max_turns=15)
+    # 데몬 스레드 - Ctrl+C 후에는 처리 중인 업체를 기다리지 않고 종료 (결과는 업체마다 이미 저장됨)
+    threads = [threading.Thread(target=worker, args=(i + 1,), name=f"exhibitor-worker-{i + 1}", daemon=True)
+               for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        stop.set()
+        print("\n🛑 중단 요청 - 지금까지의 결과를 저장합니다 (재실행 시 이어서 처리)")
+        if jobs is not None:
+            # 다른 프로세스가 임대 만료를 기다리지 않고 바로 가져가도록 반납 (시도 횟수는 되돌림)
+            released = list(in_flight.values())
+            for job in released:
+                jobs.release(job)
+            if released:
+                print(f"↩️ 처리 중이던 작업 {len(released)}개를 작업 큐에 반납했습니다")
+    finally:
+        # 중단되더라도 지금까지의 결과를 CSV로 내보냄
+        exported = store.export_csv(output_csv)
+        counts = store.counts()
+        store.close()
+        if cache is not None:
+            cache.close()
+        if tracer is not None:
+            tracer.close()
+        if jobs is not None:
+            print(f"📋 작업 큐: {jobs.summary()}")
+            jobs.close()
 
-            if result and isinstance(result, dict):
-                contact_email = result.get('contact_email', '')
-                contact_call = result.get('contact_call', '')
-
-                new_record = {
-                    'company_name': company_name,
-                    'website': website,
-                    'contact_email': contact_email,
-                    'contact_call': contact_call
-                }
-
-                results.append(new_record)
-
-                print(f"✅ 성공: {company_name}")
-                print(f"   이메일: {contact_email}")
-                print(f"   전화번호: {contact_call}")
-                success_count += 1
-            else:
-                print(f"⚠️ JSON 추출 실패: {company_name}")
-                new_record = {
-                    'company_name': company_name,
-                    'website': website,
-                    'contact_email': '',
-                    'contact_call': ''
-                }
-                results.append(new_record)
-                fail_count += 1
-
-            # 즉시 CSV에 추가 (append mode)
-            pd.DataFrame([new_record]).to_csv(
-                output_csv,
-                mode='a',
-                header=False,
-                index=False,
-                encoding='utf-8-sig'
-            )
-            print(f"💾 {output_csv}에 저장 완료")
-
-            # 요청 간 대기 (API 제한 고려)
-            time.sleep(2)
-
-        except Exception as e:
-            print(f"❌ 오류 발생 ({company_name}): {str(e)}")
-            new_record = {
-                'company_name': company_name,
-                'website': website,
-                'contact_email': '',
-                'contact_call': ''
-            }
-            results.append(new_record)
-            fail_count += 1
-
-            # 오류 발생 시에도 CSV에 저장
-            pd.DataFrame([new_record]).to_csv(
-                output_csv,
-                mode='a',
-                header=False,
-                index=False,
-                encoding='utf-8-sig'
-            )
-            print(f"💾 {output_csv}에 저장 완료 (오류)")
+    elapsed = time.time() - progress.started
 
     # 최종 통계
     print(f"\n{'='*80}")
     print(f"✅ 모든 처리 완료! 결과: {output_csv}")
     print(f"📊 처리 통계:")
-    print(f"   - 총 처리: {len(results)}개 업체")
-    print(f"   - 성공: {success_count}개")
-    print(f"   - 실패: {fail_count}개")
+    print(f"   - 총 처리: {exported}개 업체 (상태별: {counts})")
+    print(f"   - 이번 실행: {progress.done}개 ({elapsed / 60:.1f}분, 워커 {workers}개)")
+    print(f"   - 성공: {progress.success_count}개")
+    print(f"   - 실패: {progress.fail_count}개")
+    print(f"   - 정적 HTML로 처리 (에이전트 생략): {progress.static_count}개")
+    if cache is not None:
+        print(f"   - 도메인 캐시 적중 (에이전트 생략): {progress.cache_count}개 "
+              f"(적중 {cache.hits} / 미스 {cache.misses})")
+    if text_first:
+        print(f"   - 텍스트 모드로 처리 (비전 에이전트 생략): {progress.text_count}개")
+    print(f"   - 절약한 비전 에이전트 세션 (정적 + 캐시 + 텍스트): "
+          f"{progress.static_count + progress.cache_count + progress.text_count}개")
+    print(f"   - Gemini 스케줄러: {rate_limiter.summary()}")
+    if elapsed > 0:
+        print(f"   - 처리량: {progress.done / elapsed * 3600:.1f}개/시간")
+    if trace_events:
+        trace = summarize_trace(trace_events)
+        print(f"   - 에이전트 턴: {trace['turns']}회 (모델 p50 {trace['phases']['model']['p50']:.1f}초 / "
+              f"p95 {trace['phases']['model']['p95']:.1f}초), "
+              f"예상 비용 ${trace['cost_total']:.4f} (업체당 ${trace['cost_per_company']:.4f}), "
+              f"루프 가드로 최대 절약 턴 {trace['max_saved_turns']}개 - {trace_path}")
     print(f"{'='*80}\n")
 
-    return pd.DataFrame(results)
+    return pd.read_csv(output_csv)
 
 if __name__ == "__main__":
     import sys
+    from cli import main
 
-    # 명령줄 인자로 start_index와 test_limit 받기
-    # 사용 예: python process_exhibitors.py 10 5  (10번 인덱스부터 5개)
-    start_idx = 100
-    test_lim = 500
-
-    print(f"📍 시작 인덱스: {start_idx}, 처리 개수: {test_lim}\n")
-    process_exhibitors(start_index=start_idx, test_limit=test_lim)
+    # python cli.py extract 와 같음 - 예: python process_exhibitors.py --start 100 --limit 500 --workers 2
+    # 작업 큐 모드 (여러 프로세스/터미널에서 동시에 실행 가능): python process_exhibitors.py --queue
+    sys.exit(main(['extract', *sys.argv[1:]]))
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Gemini 요청 스케줄러 (속도 제한 + 재시도)
+여러 워커(스레드)와 asyncio 세션이 공유하여
+- 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 토큰 버킷으로 한도 이하로 유지하고
+- 429/503 같은 일시적 오류는 지수 백오프 + 지터로 재시도하며
+- 429를 받으면 전체 요청 속도를 낮췄다가, 성공이 이어지면 설정값까지 천천히 회복합니다.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# 재시도할 HTTP 상태 코드 (google.genai.errors.APIError.code)
+RETRYABLE_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# APIError 상세의 RetryInfo.retryDelay (예: "37s", "1.5s")
+RETRY_DELAY_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)s$')
+
+
+def error_code(error: BaseException) -> Optional[int]:
+    """예외의 HTTP 상태 코드 (google.genai APIError.code, 없으면 None)"""
+    code = getattr(error, 'code', None)
+    return code if isinstance(code, int) else None
+
+
+def is_transport_error(error: BaseException) -> bool:
+    """연결/타임아웃 오류 여부 (httpx는 google-genai가 사용 - import하지 않고 클래스 이름으로 확인)"""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    return any(cls.__module__.startswith('httpx') and cls.__name__ == 'TransportError'
+               for cls in type(error).__mro__)
+
+
+def server_retry_delay(error: BaseException) -> Optional[float]:
+    """429 응답의 RetryInfo.retryDelay(초) - 없으면 None"""
+    details = getattr(error, 'details', None)
+    if not isinstance(details, dict):
+        return None
+    items = (details.get('error') or {}).get('details') or []
+    for item in items if isinstance(items, list) else []:
+        if isinstance(item, dict) and str(item.get('@type', '')).endswith('RetryInfo'):
+            match = RETRY_DELAY_PATTERN.match(str(item.get('retryDelay', '')))
+            if match:
+                return float(match.group(1))
+    return None
+
+
+class TokenBucket:
+    """
+    분당 per_minute만큼 채워지는 토큰 버킷
+
+    잔량이 음수가 될 수 있는 예약 방식입니다. 요청은 먼저 잔량을 빼고,
+    잔량이 다시 0이 될 때까지 기다린 뒤 나갑니다 (먼저 예약한 요청이 먼저 나감).
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.per_minute = per_minute
+        self.capacity = capacity if capacity is not None else per_minute
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float, rate_factor: float = 1.0) -> float:
+        """amount만큼 예약하고 대기해야 할 시간(초) 반환 - rate_factor로 채우는 속도 조절"""
+        rate = self.per_minute * rate_factor / 60.0
+        self.level = min(self.capacity, self.level + (now - self.updated) * rate)
+        self.updated = now
+        self.level -= amount
+        return 0.0 if self.level >= 0 else -self.level / rate
+
+    def adjust(self, amount: float):
+        """예약량 정정 (실제 사용량 - 예상치, 음수면 돌려받음)"""
+        self.level = min(self.capacity, self.level - amount)
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: float = 60, tokens_per_minute: Optional[float] = None,
+                 burst: float = 1, max_retries: int = 4, base_delay: float = 2.0, max_delay: float = 60.0,
+                 slowdown: float = 0.5, min_rate_factor: float = 0.1, recover_after: int = 20):
+        """
+        Args:
+            requests_per_minute: 전체 워커 합산 분당 최대 요청 수 (0/None이면 제한 없음)
+            tokens_per_minute: 전체 워커 합산 분당 최대 토큰 수 (None이면 제한 없음)
+            burst: 쉬고 있다가 한 번에 보낼 수 있는 요청 수 (1이면 일정 간격으로만 전송)
+            max_retries: 일시적 오류(429/5xx/연결 오류) 재시도 횟수
+            base_delay / max_delay: 지수 백오프 시작/최대 대기(초) - 실제 대기는 지터 적용
+            slowdown: 429를 받을 때마다 요청 속도에 곱하는 값
+            min_rate_factor: 낮출 수 있는 최저 속도 (설정값 대비 비율)
+            recover_after: 이 횟수만큼 연속 성공하면 속도를 한 단계 회복
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.slowdown = slowdown
+        self.min_rate_factor = min_rate_factor
+        self.recover_after = recover_after
+
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(requests_per_minute, capacity=burst) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._cooldown_until = 0.0
+        self.rate_factor = 1.0
+        self._success_streak = 0
+        # 요청당 토큰 수 예상치 (실제 사용량의 지수 이동 평균)
+        self.estimated_tokens = 0.0
+
+        # 통계
+        self.request_count = 0
+        self.total_wait = 0.0
+        self.retry_count = 0
+        self.rate_limited = 0
+        self.failures = 0
+        self.tokens_used = 0
+        self.errors_by_code: Dict[str, int] = {}
+        self.slowdowns = 0
+
+    @property
+    def effective_rpm(self) -> Optional[float]:
+        """현재(감속 반영) 분당 요청 한도"""
+        return self.requests_per_minute * self.rate_factor if self.requests_per_minute else None
+
+    def reserve(self, tokens: Optional[float] = None) -> float:
+        """요청 1개 슬롯과 토큰을 예약하고 대기할 시간(초) 반환 (tokens가 None이면 평균 사용량으로 예상)"""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._cooldown_until - now)
+            if self._requests:
+                delay = max(delay, self._requests.reserve(1, now, self.rate_factor))
+            if self._tokens:
+                amount = self.estimated_tokens if tokens is None else tokens
+                delay = max(delay, self._tokens.reserve(amount, now, self.rate_factor))
+            self.request_count += 1
+            self.total_wait += delay
+        return delay
+
+    def acquire(self, tokens: Optional[float] = None) -> float:
+        """다음 요청 슬롯까지 대기 - 대기한 시간(초) 반환"""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def record_usage(self, response: Any, reserved: Optional[float] = None):
+        """성공한 응답의 실제 토큰 수 반영 + 연속 성공 시 속도 회복"""
+        usage = getattr(response, 'usage_metadata', None)
+        used = int(getattr(usage, 'total_token_count', None) or 0) if usage is not None else 0
+        with self._lock:
+            self.tokens_used += used
+            if used:
+                if self._tokens:
+                    self._tokens.adjust(used - (self.estimated_tokens if reserved is None else reserved))
+                self.estimated_tokens = used if not self.estimated_tokens else 0.8 * self.estimated_tokens + 0.2 * used
+
+            self._success_streak += 1
+            if self.rate_factor < 1.0 and self._success_streak >= self.recover_after:
+                self.rate_factor = min(1.0, self.rate_factor / self.slowdown ** 0.5)
+                self._success_streak = 0
+
+    def retry_delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """
+        오류 기록 후 재시도 전 대기 시간(초) 반환 - 재시도하지 않을 오류면 None
+
+        429면 공유 속도를 낮추고 모든 워커가 대기 시간 동안 새 요청을 보내지 않게 합니다.
+        """
+        code = error_code(error)
+        retryable = code in RETRYABLE_CODES if code is not None else is_transport_error(error)
+        with self._lock:
+            key = str(code) if code is not None else type(error).__name__
+            self.errors_by_code[key] = self.errors_by_code.get(key, 0) + 1
+            self._success_streak = 0
+            if not retryable or attempt >= self.max_retries:
+                self.failures += 1
+                return None
+
+            # 지수 백오프 + 지터 (대기 시간의 절반은 고정, 절반은 무작위)
+            backoff = min(self.max_delay, self.base_delay * 2 ** attempt)
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+            if code == 429:
+                self.rate_limited += 1
+                delay = max(delay, server_retry_delay(error) or 0.0)
+                if self.rate_factor > self.min_rate_factor:
+                    self.rate_factor = max(self.min_rate_factor, self.rate_factor * self.slowdown)
+                    self.slowdowns += 1
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+            self.retry_count += 1
+            self.total_wait += delay
+        return delay
+
+    def call(self, fn: Callable, *args, estimated_tokens: Optional[float] = None, **kwargs) -> Tuple[Any, float]:
+        """
+        속도 제한 + 재시도로 fn(*args, **kwargs) 호출 (예: client.models.generate_content)
+
+        Returns:
+            (fn 결과, 속도 제한/백오프로 대기한 총 시간(초))
+            재시도할 수 없거나 재시도 횟수를 넘긴 오류는 그대로 다시 발생합니다.
+        """
+        waited = 0.0
+        attempt = 0
+        while True:
+            waited += self.acquire(estimated_tokens)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                delay = self.retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                print(f"🔁 Gemini 요청 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {e}")
+                time.sleep(delay)
+                waited += delay
+                attempt += 1
+                continue
+            self.record_usage(result, estimated_tokens)
+            return result, waited
+
+    async def call_async(self, fn: Callable, *args, estimated_tokens: Optional[float] = None,
+                         **kwargs) -> Tuple[Any, float]:
+        """call()의 asyncio 버전 - fn은 코루틴 함수 (예: client.aio.models.generate_content)"""
+        waited = 0.0
+        attempt = 0
+        while True:
+            delay = self.reserve(estimated_tokens)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            waited += delay
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                delay = self.retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                print(f"🔁 Gemini 요청 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {e}")
+                await asyncio.sleep(delay)
+                waited += delay
+                attempt += 1
+                continue
+            self.record_usage(result, estimated_tokens)
+            return result, waited
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'requests': self.request_count,
+                'wait_seconds': self.total_wait,
+                'retries': self.retry_count,
+                'rate_limited': self.rate_limited,
+                'failures': self.failures,
+                'tokens_used': self.tokens_used,
+                'errors': dict(self.errors_by_code),
+                'slowdowns': self.slowdowns,
+                'rate_factor': self.rate_factor,
+                'effective_rpm': self.effective_rpm,
+            }
+
+    def summary(self) -> str:
+        stats = self.stats()
+        errors = ", ".join(f"{code} {count}" for code, count in sorted(stats['errors'].items()))
+        rpm = f"{stats['effective_rpm']:.0f}" if stats['effective_rpm'] else '제한 없음'
+        return (f"요청 {stats['requests']}회, 대기 {stats['wait_seconds']:.1f}초, 재시도 {stats['retries']}회 "
+                f"(429 {stats['rate_limited']}회, 감속 {stats['slowdowns']}회, 현재 {rpm}/분), "
+                f"실패 {stats['failures']}회, 토큰 {stats['tokens_used']:,}개"
+                + (f", 오류: {errors}" if errors else ""))
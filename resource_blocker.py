@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+에이전트 브라우저 컨텍스트의 리소스 차단 정책
+동영상/오디오, 알려진 분석·광고·채팅 위젯 호스트, (선택) 웹 폰트 요청을 막아
+액션마다의 로드 대기와 메모리를 줄입니다.
+비전 모델이 화면을 읽는 데 필요한 문서, 이미지, CSS는 차단하지 않습니다.
+
+주의: Playwright는 라우팅을 켠 컨텍스트에서 HTTP 캐시를 사용하지 않습니다.
+(작업마다 새 컨텍스트를 쓰므로 실제 손실은 거의 없음)
+"""
+
+import threading
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+# 분석/광고/태그 매니저/채팅 위젯 호스트 (하위 도메인 포함)
+DEFAULT_TRACKER_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com',
+    'googleadservices.com', 'adservice.google.com', 'connect.facebook.net', 'facebook.net',
+    'hotjar.com', 'hotjar.io', 'clarity.ms', 'segment.com', 'segment.io', 'mixpanel.com',
+    'amplitude.com', 'fullstory.com', 'mouseflow.com', 'crazyegg.com', 'quantserve.com',
+    'scorecardresearch.com', 'criteo.com', 'criteo.net', 'taboola.com', 'outbrain.com',
+    'adnxs.com', 'ads-twitter.com', 'analytics.tiktok.com', 'bat.bing.com', 'snap.licdn.com',
+    'px.ads.linkedin.com', 'mc.yandex.ru', 'nr-data.net', 'js-agent.newrelic.com',
+    'hs-analytics.net', 'hs-banner.com', 'intercom.io', 'intercomcdn.com', 'drift.com',
+    'driftt.com', 'tawk.to', 'zdassets.com', 'livechatinc.com', 'crisp.chat', 'tidio.co',
+    'olark.com', 'smartsupp.com',
+)
+
+# 항상 차단하는 리소스 종류 (Playwright request.resource_type)
+MEDIA_TYPES = ('media',)
+FONT_TYPES = ('font',)
+
+
+class BlockStats:
+    """세션(컨텍스트) 1개의 요청 차단 통계 - 라우트 핸들러에서 갱신"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.blocked = 0
+        self.by_reason: Dict[str, int] = {}
+
+    def record(self, reason: Optional[str]):
+        with self._lock:
+            if reason is None:
+                self.allowed += 1
+                return
+            self.blocked += 1
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+    def summary(self) -> str:
+        reasons = ", ".join(f"{reason} {count}" for reason, count in sorted(self.by_reason.items()))
+        return f"차단 {self.blocked}개 ({reasons or '-'}), 허용 {self.allowed}개"
+
+
+class ResourceBlockPolicy:
+    def __init__(self, block_media: bool = True, block_trackers: bool = True,
+                 block_fonts: bool = False, tracker_hosts: Iterable[str] = DEFAULT_TRACKER_HOSTS,
+                 extra_hosts: Iterable[str] = ()):
+        """
+        Args:
+            block_media: 동영상/오디오 차단
+            block_trackers: tracker_hosts(+extra_hosts) 호스트로 가는 모든 요청 차단
+            block_fonts: 웹 폰트 차단 (아이콘 폰트가 깨질 수 있어 기본값은 허용)
+            tracker_hosts: 차단할 호스트 목록 (하위 도메인 포함)
+            extra_hosts: 기본 목록에 추가로 차단할 호스트
+        """
+        self.block_media = block_media
+        self.block_trackers = block_trackers
+        self.block_fonts = block_fonts
+        self.tracker_hosts = frozenset(host.lower().strip('.') for host in (*tracker_hosts, *extra_hosts))
+
+    def is_tracker_host(self, url: str) -> bool:
+        """URL 호스트가 차단 목록의 호스트이거나 그 하위 도메인인지 확인"""
+        host = (urlsplit(url).hostname or '').lower()
+        while host:
+            if host in self.tracker_hosts:
+                return True
+            if '.' not in host:
+                return False
+            host = host.split('.', 1)[1]
+        return False
+
+    def block_reason(self, resource_type: str, url: str) -> Optional[str]:
+        """차단해야 하면 이유('media', 'font', 'tracker'), 아니면 None"""
+        if resource_type == 'document':
+            # 페이지 이동 자체는 막지 않음
+            return None
+        if self.block_media and resource_type in MEDIA_TYPES:
+            return 'media'
+        if self.block_fonts and resource_type in FONT_TYPES:
+            return 'font'
+        if self.block_trackers and self.is_tracker_host(url):
+            return 'tracker'
+        return None
+
+    def attach(self, context) -> BlockStats:
+        """sync Playwright 컨텍스트에 차단 라우트 설치 - 컨텍스트의 차단 통계 반환"""
+        stats = BlockStats()
+
+        def handle(route):
+            request = route.request
+            reason = self.block_reason(request.resource_type, request.url)
+            stats.record(reason)
+            if reason:
+                route.abort("blockedbyclient")
+            else:
+                route.continue_()
+
+        context.route("**/*", handle)
+        return stats
+
+    async def attach_async(self, context) -> BlockStats:
+        """playwright.async_api 컨텍스트용 attach()"""
+        stats = BlockStats()
+
+        async def handle(route):
+            request = route.request
+            reason = self.block_reason(request.resource_type, request.url)
+            stats.record(reason)
+            if reason:
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle)
+        return stats
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+SQLite 기반 연락처 수집 결과 저장소
+업체명 + 정규화된 웹사이트를 키로 upsert하고, 인덱스 조회로 처리 여부를 확인합니다.
+CSV는 필요할 때 export_csv()로 내보냅니다.
+"""
+
+import csv
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from url_utils import normalize_company, normalize_website
+
+OUTPUT_COLUMNS = ['company_name', 'website', 'contact_email', 'contact_call']
+
+# 처리 상태
+STATUS_FOUND = 'found'          # 이메일 또는 전화번호를 찾음
+STATUS_NOT_FOUND = 'not_found'  # 정상 처리됐지만 연락처 없음
+STATUS_ERROR = 'error'          # 처리 중 오류
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    company_key   TEXT NOT NULL,
+    website_key   TEXT NOT NULL,
+    company_name  TEXT NOT NULL,
+    website       TEXT NOT NULL DEFAULT '',
+    contact_email TEXT NOT NULL DEFAULT '',
+    contact_call  TEXT NOT NULL DEFAULT '',
+    status        TEXT NOT NULL,
+    source        TEXT NOT NULL DEFAULT '',
+    error         TEXT NOT NULL DEFAULT '',
+    attempts      INTEGER NOT NULL DEFAULT 1,
+    updated_at    REAL NOT NULL,
+    PRIMARY KEY (company_key, website_key)
+);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results (status);
+CREATE INDEX IF NOT EXISTS idx_results_website ON results (website_key);
+"""
+
+# 새 값이 비어 있으면 기존에 찾은 연락처를 유지
+UPSERT_SQL = """
+INSERT INTO results (company_key, website_key, company_name, website, contact_email,
+                     contact_call, status, source, error, attempts, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?)
+ON CONFLICT (company_key, website_key) DO UPDATE SET
+    company_name  = excluded.company_name,
+    website       = excluded.website,
+    contact_email = CASE WHEN excluded.contact_email != '' THEN excluded.contact_email ELSE results.contact_email END,
+    contact_call  = CASE WHEN excluded.contact_call != '' THEN excluded.contact_call ELSE results.contact_call END,
+    status        = CASE WHEN results.status = 'found' AND excluded.status != 'found' THEN results.status ELSE excluded.status END,
+    source        = CASE WHEN excluded.status = 'found' OR results.status != 'found' THEN excluded.source ELSE results.source END,
+    error         = excluded.error,
+    attempts      = results.attempts + 1,
+    updated_at    = excluded.updated_at
+"""
+
+
+def _text(value) -> str:
+    """NaN/None을 빈 문자열로 변환"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return str(value).strip()
+
+
+def upsert_params(company_name: str, website: str, contact_email: str = '',
+                  contact_call: str = '', status: Optional[str] = None,
+                  source: str = '', error: str = '') -> tuple:
+    """UPSERT_SQL 파라미터 (status가 None이면 연락처 유무로 결정)"""
+    contact_email = _text(contact_email)
+    contact_call = _text(contact_call)
+    if status is None:
+        status = STATUS_FOUND if (contact_email or contact_call) else STATUS_NOT_FOUND
+    return (
+        normalize_company(company_name), normalize_website(website),
+        _text(company_name), _text(website), contact_email, contact_call,
+        status, source, error, time.time()
+    )
+
+
+class ResultStore:
+    def __init__(self, db_path: str = "output/gitex_results.db"):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (여러 스레드에서 공유 가능)
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def upsert(self, company_name: str, website: str, contact_email: str = '',
+               contact_call: str = '', status: Optional[str] = None,
+               source: str = '', error: str = ''):
+        """결과 1건 저장 (같은 업체+웹사이트면 갱신)"""
+        params = upsert_params(company_name, website, contact_email, contact_call, status, source, error)
+        with self._lock:
+            self.conn.execute(UPSERT_SQL, params)
+            self.conn.commit()
+
+    def is_done(self, company_name: str, website: str) -> bool:
+        """이미 처리된 업체인지 확인 (기본 키 인덱스 조회) - 오류로 끝난 업체는 재개 시 다시 처리"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM results WHERE company_key = ? AND website_key = ? AND status != 'error'",
+                (normalize_company(company_name), normalize_website(website))
+            ).fetchone()
+        return row is not None
+
+    def get(self, company_name: str, website: str) -> Optional[Dict]:
+        """저장된 결과 1건 조회"""
+        with self._lock:
+            cursor = self.conn.execute(
+                "SELECT * FROM results WHERE company_key = ? AND website_key = ?",
+                (normalize_company(company_name), normalize_website(website))
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return dict(zip([column[0] for column in cursor.description], row))
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 건수"""
+        with self._lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM results GROUP BY status").fetchall()
+        return dict(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def import_csv(self, csv_path: str) -> int:
+        """기존 결과 CSV를 가져오기 (중복 행은 upsert로 합쳐짐)"""
+        count = 0
+        with open(csv_path, newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                if not _text(row.get('company_name')):
+                    continue
+                self.upsert(row['company_name'], row.get('website', ''),
+                            row.get('contact_email', ''), row.get('contact_call', ''),
+                            source='csv_import')
+                count += 1
+        return count
+
+    def export_csv(self, csv_path: str) -> int:
+        """저장된 결과를 CSV로 내보내기 (행 단위 스트리밍)"""
+        count = 0
+        # 같은 파일을 내보내는 다른 프로세스(작업 큐 워커)와 임시 파일이 겹치지 않도록 PID 사용
+        tmp_path = f"{csv_path}.{os.getpid()}.tmp"
+        with self._lock:
+            cursor = self.conn.execute(
+                "SELECT company_name, website, contact_email, contact_call FROM results "
+                "ORDER BY company_key, website_key"
+            )
+            with open(tmp_path, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
+                writer.writerow(OUTPUT_COLUMNS)
+                for row in cursor:
+                    writer.writerow(row)
+                    count += 1
+        os.replace(tmp_path, csv_path)
+        return count
@@ -0,0 +1,31 @@
+"""loop_guard.LoopGuard 중단 조건"""
+
+from loop_guard import LoopGuard, REPEAT_RESULT
+
+CLICK = [('click_at', {'success': True})]
+BLOCKED = [('click_at', REPEAT_RESULT)]
+
+
+def test_alternating_blocked_and_changed_turns_do_not_stop():
+    guard = LoopGuard()
+    for _ in range(10):
+        guard.after_turn(BLOCKED, False, None, 'https://acme-tech.ae/')
+        guard.after_turn(CLICK, True, None, 'https://acme-tech.ae/')
+    assert guard.stop_reason is None
+
+
+def test_consecutive_blocked_turns_stop_as_stuck():
+    guard = LoopGuard()
+    guard.after_turn(BLOCKED, False, None, 'https://acme-tech.ae/')
+    guard.after_turn(BLOCKED, False, None, 'https://acme-tech.ae/')
+    assert guard.stop_reason == 'stuck'
+
+
+def test_ignoring_finalize_request_stops():
+    guard = LoopGuard()
+    dom = {'text': 'Contact: info@acme-tech.ae', 'links': []}
+    assert guard.after_turn(CLICK, True, dom, 'https://acme-tech.ae/')
+    guard.after_turn(CLICK, True, dom, 'https://acme-tech.ae/')
+    assert guard.stop_reason is None
+    guard.after_turn(CLICK, True, dom, 'https://acme-tech.ae/')
+    assert guard.stop_reason == 'ignored_finalize'
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+텍스트(DOM) 모드 연락처 에이전트
+스크린샷 대신 페이지의 보이는 텍스트와 번호를 붙인 링크 목록(크기 제한)을
+저렴한 텍스트 모델에 보내고, 모델은 링크 번호로 이동하거나 최종 연락처를 답합니다.
+
+연락처 정보는 대부분 텍스트(푸터, 문의 페이지, mailto: 링크)에 있으므로
+비전 모델(ComputerUseAgent)은 텍스트 모드가 답을 내지 못한 경우에만 사용합니다.
+결과 형식은 ComputerUseAgent.run_task와 같은 {'contact_email', 'contact_call'} 입니다.
+"""
+
+import json
+import os
+import re
+import time
+from typing import Optional, Dict, Any, List
+from urllib.parse import unquote
+
+from dotenv import load_dotenv
+from google import genai
+from google.genai import types
+from playwright.sync_api import sync_playwright
+
+from agent_trace import usage_tokens
+from contact_extractor import CONTACT_KEYWORDS, EMAIL_PATTERN
+from resource_blocker import ResourceBlockPolicy
+
+load_dotenv()
+
+# 보이는 텍스트, 제목, 링크(텍스트 + 절대 URL) 수집
+PAGE_SNAPSHOT_SCRIPT = """
+(maxChars) => {
+    const links = [];
+    const seen = new Set();
+    for (const a of document.querySelectorAll('a[href]')) {
+        const href = a.href;
+        if (!href || seen.has(href) || !/^(https?:|mailto:|tel:)/i.test(href)) continue;
+        seen.add(href);
+        const text = (a.innerText || a.getAttribute('aria-label') || a.title || '').replace(/\\s+/g, ' ').trim();
+        links.push([text.slice(0, 80), href]);
+    }
+    return {
+        title: document.title || '',
+        url: location.href,
+        text: (document.body ? document.body.innerText : '').replace(/\\n\\s*\\n+/g, '\\n').slice(0, maxChars),
+        links: links,
+    };
+}
+"""
+
+# 모델 응답 형식 (JSON 모드)
+ACTION_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        'action': types.Schema(type=types.Type.STRING, enum=['open_link', 'go_back', 'finish', 'give_up']),
+        'link_index': types.Schema(type=types.Type.INTEGER, nullable=True),
+        'contact_email': types.Schema(type=types.Type.STRING, nullable=True),
+        'contact_call': types.Schema(type=types.Type.STRING, nullable=True),
+        'reason': types.Schema(type=types.Type.STRING, nullable=True),
+    },
+    required=['action'],
+)
+
+SYSTEM_PROMPT = """당신은 회사 웹사이트에서 연락처를 찾는 에이전트입니다.
+매 턴마다 현재 페이지의 텍스트와 번호가 붙은 링크 목록을 받습니다.
+
+목표: {task}
+
+다음 중 하나를 JSON으로 답하세요.
+- {{"action": "open_link", "link_index": 번호}}: 연락처가 있을 만한 링크(Contact, About, 문의 등)로 이동
+- {{"action": "go_back"}}: 이전 페이지로 돌아가기
+- {{"action": "finish", "contact_email": "...", "contact_call": "..."}}: 페이지 텍스트에 실제로 보이는 값만 사용 (없으면 빈 문자열)
+- {{"action": "give_up", "reason": "..."}}: 텍스트만으로는 찾을 수 없음 (이미지 속 연락처, 폼만 있는 경우 등)
+
+파트너십/영업 문의 이메일을 우선하고, 개인정보 보호/채용/지원 이메일은 피하세요."""
+
+
+# 전화번호 표기에 쓰이는 문자 (페이지와 답의 숫자만 비교하기 위해 제거)
+PHONE_FORMAT_CHARS = re.compile(r'[\s\-.()/+\u00a0]')
+
+
+def grounded_answer(result: Dict[str, str], snapshot: Dict[str, Any]) -> str:
+    """
+    답의 연락처가 현재 페이지에 실제로 있는지 확인 - 없는 값이 있으면 그 필드 이름, 모두 있으면 ''
+
+    이메일은 페이지 텍스트나 mailto: 링크에, 전화번호는 숫자만 비교해 텍스트나 tel: 링크에 있어야 합니다.
+    """
+    hrefs = [unquote(href) for _, href in snapshot.get('links') or []]
+    page = "\n".join([snapshot.get('text') or ''] + hrefs)
+    email = result['contact_email'].lower()
+    if email and email not in page.lower():
+        return 'contact_email'
+    digits = re.sub(r'\D', '', result['contact_call'])
+    if digits and digits not in PHONE_FORMAT_CHARS.sub('', page):
+        return 'contact_call'
+    return ''
+
+
+class TextContactAgent:
+    def __init__(self, api_key: Optional[str] = None, headless: bool = True,
+                 browser_pool=None, rate_limiter=None, tracer=None,
+                 model_name: str = 'gemini-2.5-flash-lite',
+                 max_text_chars: int = 6000, max_links: int = 60,
+                 block_resources: bool = True, page_timeout: float = 20.0):
+        """
+        텍스트 모드 에이전트 초기화
+
+        Args:
+            api_key: Gemini API 키 (없으면 GEMINI_API_KEY 환경 변수 사용)
+            headless: headless 모드 여부 (browser_pool 사용 시 풀 설정을 따름)
+            browser_pool: BrowserPool - 비전 에이전트와 같은 풀을 공유할 수 있음
+            rate_limiter: RateLimiter - 공유 Gemini 요청 스케줄러 (속도 제한 + 재시도)
+            tracer: TurnTracer - 턴별 시간/토큰 이벤트 기록기 (mode='text'로 기록)
+            model_name: 텍스트 모델 (Computer Use 모델보다 저렴한 모델)
+            max_text_chars: 턴마다 보낼 페이지 텍스트 최대 길이
+            max_links: 턴마다 보낼 링크 최대 개수 (문의/회사 소개 링크 우선)
+            block_resources: 동영상/추적·광고 호스트 요청 차단 여부
+            page_timeout: 페이지 이동 제한 시간(초)
+        """
+        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        if not self.api_key:
+            raise ValueError("GEMINI_API_KEY 설정되지 않았습니다.")
+        self.client = genai.Client(api_key=self.api_key)
+        self.model_name = model_name
+
+        self.headless = headless
+        self.browser_pool = browser_pool
+        self.rate_limiter = rate_limiter
+        self.tracer = tracer
+        self.max_text_chars = max_text_chars
+        self.max_links = max_links
+        self.resource_policy = ResourceBlockPolicy() if block_resources else None
+        self.block_stats = None
+        self.page_timeout = page_timeout
+
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self._pool_lease = None
+        self.last_usage = usage_tokens(None)
+        self.last_rate_wait = 0.0
+
+    def start_browser(self):
+        """브라우저 시작 (풀이 있으면 새 컨텍스트만 생성)"""
+        if self.browser_pool:
+            self._pool_lease = self.browser_pool.page()
+            self.context, self.page = self._pool_lease.__enter__()
+        else:
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(headless=self.headless)
+            self.context = self.browser.new_context()
+            self.page = self.context.new_page()
+        self.block_stats = self.resource_policy.attach(self.context) if self.resource_policy else None
+
+    def close_browser(self):
+        """브라우저 닫기"""
+        if self._pool_lease:
+            lease, self._pool_lease = self._pool_lease, None
+            lease.__exit__(None, None, None)
+        else:
+            if self.browser:
+                self.browser.close()
+                self.browser = None
+            if self.playwright:
+                self.playwright.stop()
+                self.playwright = None
+        self.context = None
+        self.page = None
+
+    def goto(self, url: str):
+        """페이지 이동 - 느린 리소스를 기다리지 않도록 DOMContentLoaded까지만 대기"""
+        self.page.goto(url, wait_until="domcontentloaded", timeout=self.page_timeout * 1000)
+        try:
+            self.page.wait_for_load_state("load", timeout=3000)
+        except Exception:
+            pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 페이지의 텍스트/링크 스냅샷"""
+        return self.page.evaluate(PAGE_SNAPSHOT_SCRIPT, self.max_text_chars)
+
+    def select_links(self, links: List[List[str]]) -> List[List[str]]:
+        """링크 개수 제한 - mailto:/tel:과 문의/회사 소개 링크를 먼저 남김"""
+        def priority(link):
+            text, href = link
+            lowered = f"{text} {href}".lower()
+            if href.lower().startswith(('mailto:', 'tel:')):
+                return 0
+            if any(keyword in lowered for keyword in CONTACT_KEYWORDS):
+                return 1
+            return 2
+
+        ranked = sorted(enumerate(links), key=lambda item: (priority(item[1]), item[0]))
+        return [link for _, link in ranked[:self.max_links]]
+
+    def render_page(self, snapshot: Dict[str, Any], links: List[List[str]], visited: List[str],
+                    note: str = '') -> str:
+        """모델에 보낼 페이지 설명 (텍스트 + 번호 붙인 링크 목록)"""
+        lines = [f"현재 페이지: {snapshot.get('title', '')} ({snapshot.get('url', '')})"]
+        if visited:
+            lines.append("방문한 페이지: " + ", ".join(visited[-5:]))
+        if note:
+            lines.append(f"직전 행동 결과: {note}")
+        lines.append("\n[페이지 텍스트]")
+        lines.append(snapshot.get('text', '') or '(텍스트 없음)')
+        lines.append("\n[링크]")
+        for i, (text, href) in enumerate(links):
+            lines.append(f"[{i}] {text or '(텍스트 없음)'} -> {href}")
+        return "\n".join(lines)
+
+    def ask_model(self, task: str, page_text: str) -> Dict[str, Any]:
+        """JSON 모드로 다음 행동 요청 (대화 기록 없이 현재 페이지만 전송)"""
+        request = dict(
+            model=self.model_name,
+            contents=[types.Content(role="user", parts=[types.Part(text=page_text)])],
+            config=types.GenerateContentConfig(
+                system_instruction=SYSTEM_PROMPT.format(task=task),
+                response_mime_type="application/json",
+                response_schema=ACTION_SCHEMA,
+                temperature=0.0,
+            ),
+        )
+        if self.rate_limiter:
+            response, self.last_rate_wait = self.rate_limiter.call(self.client.models.generate_content, **request)
+        else:
+            response, self.last_rate_wait = self.client.models.generate_content(**request), 0.0
+        self.last_usage = usage_tokens(response)
+        try:
+            decision = json.loads(response.text or '{}')
+        except json.JSONDecodeError:
+            return {'action': 'give_up', 'reason': 'JSON이 아닌 응답'}
+        if not isinstance(decision, dict):
+            return {'action': 'give_up', 'reason': 'JSON 객체가 아닌 응답'}
+        return decision
+
+    def _trace(self, event: Dict[str, Any]):
+        if not self.tracer:
+            return
+        try:
+            self.tracer.emit(event)
+        except Exception as e:
+            print(f"⚠️ 추적 이벤트 기록 실패: {e}")
+
+    def run_task(self, task: str, url: str, max_turns: int = 6) -> Optional[Dict]:
+        """
+        텍스트 모드로 연락처 찾기
+
+        Returns:
+            {'contact_email', 'contact_call'} 또는 None (포기/턴 초과/페이지 오류 - 비전 에이전트로 넘길 것)
+
+        브라우저 실행 실패와 Gemini 요청 오류(스케줄러 재시도 소진)는 다시 발생시킵니다 -
+        비전 에이전트도 같은 이유로 실패하므로 호출자가 오류로 기록하고 나중에 다시 시도합니다.
+        """
+        task_id = self.tracer.new_task_id() if self.tracer else None
+        task_started = time.perf_counter()
+        outcome = 'no_answer'
+        turns_used = 0
+        history: List[str] = []
+        note = ''
+        launched = False
+        calling_model = False
+
+        try:
+            self.start_browser()
+            launched = True
+            self.goto(url)
+            print(f"📝 텍스트 모드 시작: {url}")
+
+            for turn in range(max_turns):
+                turns_used = turn + 1
+                started = time.perf_counter()
+                snapshot = self.snapshot()
+                links = self.select_links(snapshot.get('links') or [])
+                page_text = self.render_page(snapshot, links, history, note)
+                note = ''
+                snapshot_s = time.perf_counter() - started
+
+                queued = time.perf_counter()
+                calling_model = True
+                decision = self.ask_model(task, page_text)
+                calling_model = False
+                model_s = time.perf_counter() - queued - self.last_rate_wait
+                action = decision.get('action')
+                print(f"  📝 턴 {turn + 1}: {action} {decision.get('link_index', '') if action == 'open_link' else ''}")
+
+                trace = {'type': 'turn', 'mode': 'text', 'task_id': task_id, 'url': url, 'turn': turn + 1,
+                         'rate_wait_s': self.last_rate_wait, 'model_s': model_s, 'action_s': 0.0, 'settle_s': 0.0,
+                         'screenshot_s': snapshot_s, 'actions': [action], 'screenshot_bytes': 0,
+                         'screenshot_sent': False, 'page_bytes': len(page_text.encode('utf-8')), **self.last_usage}
+
+                if action == 'finish':
+                    self._trace(dict(trace, final=True))
+                    result = {'contact_email': (decision.get('contact_email') or '').strip(),
+                              'contact_call': (decision.get('contact_call') or '').strip()}
+                    if result['contact_email'].lower().startswith('mailto:'):
+                        result['contact_email'] = result['contact_email'][7:].split('?', 1)[0]
+                    if result['contact_email'] and not EMAIL_PATTERN.fullmatch(result['contact_email']):
+                        result['contact_email'] = ''
+                    # 페이지에 없는 값을 지어낸 답은 받지 않음 (비전 에이전트로 넘김)
+                    missing = grounded_answer(result, snapshot)
+                    if missing:
+                        outcome = 'ungrounded'
+                        print(f"  ⚠️ 텍스트 모드 답의 {missing}이(가) 페이지에 없습니다 - 비전 에이전트로 전환: {result}")
+                        return None
+                    if result['contact_email'] or result['contact_call']:
+                        outcome = 'found'
+                        print(f"  ✅ 텍스트 모드 성공: {result}")
+                        return result
+                    outcome = 'empty'
+                    return None
+
+                if action == 'give_up':
+                    self._trace(dict(trace, final=True))
+                    outcome = 'give_up'
+                    print(f"  ⚠️ 텍스트 모드 포기: {decision.get('reason', '')}")
+                    return None
+
+                action_started = time.perf_counter()
+                try:
+                    if action == 'open_link':
+                        index = decision.get('link_index')
+                        if index is None or not 0 <= index < len(links):
+                            raise ValueError(f"잘못된 링크 번호: {index}")
+                        href = links[index][1]
+                        if href.lower().startswith(('mailto:', 'tel:')):
+                            raise ValueError("mailto:/tel: 링크는 이동할 수 없습니다 - 값을 그대로 사용하세요")
+                        history.append(snapshot.get('url', ''))
+                        self.goto(href)
+                    elif action == 'go_back':
+                        self.page.go_back(wait_until="domcontentloaded", timeout=self.page_timeout * 1000)
+                except Exception as e:
+                    print(f"  ❌ 텍스트 모드 액션 오류: {e}")
+                    note = f"오류 - {e}"
+                trace['action_s'] = time.perf_counter() - action_started
+                self._trace(trace)
+
+            print("  ⚠️ 텍스트 모드 최대 턴 수 도달")
+            return None
+
+        except Exception as e:
+            outcome = 'error'
+            if calling_model or not launched:
+                print(f"❌ 텍스트 모드 오류: {e}")
+                raise
+            print(f"❌ 텍스트 모드 페이지 오류 - 비전 에이전트로 전환: {e}")
+            return None
+        finally:
+            if self.block_stats:
+                print(f"  🚫 리소스 차단: {self.block_stats.summary()}")
+            if task_id:
+                self._trace({'type': 'task', 'mode': 'text', 'task_id': task_id, 'url': url, 'turns': turns_used,
+                             'seconds': time.perf_counter() - task_started, 'result': outcome,
+                             'blocked_requests': self.block_stats.blocked if self.block_stats else 0})
+            self.close_browser()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+업체명/웹사이트 정규화 유틸리티
+중복 제거와 조회 키로 사용할 일관된 값을 만듭니다.
+"""
+
+import re
+from urllib.parse import urlparse
+
+
+def normalize_company(name) -> str:
+    """업체명 정규화 (대소문자/공백 차이 무시)"""
+    if not isinstance(name, str):
+        return ''
+    return re.sub(r'\s+', ' ', name).strip().lower()
+
+
+def normalize_website(url) -> str:
+    """
+    웹사이트 URL 정규화
+
+    스킴, www., 기본 포트, 끝 슬래시, 쿼리/프래그먼트를 제거합니다.
+    예: "https://www.Alpha.ae/" -> "alpha.ae", "http://x.com/en/?a=1" -> "x.com/en"
+    """
+    if not isinstance(url, str) or not url.strip():
+        return ''
+    # "https://https:www.x.com"처럼 스킴이 중복된 입력도 처리
+    url = 'http://' + re.sub(r'^(?:https?:/*)+', '', url.strip(), flags=re.IGNORECASE)
+    parsed = urlparse(url)
+    host = (parsed.hostname or '').lower().rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    path = parsed.path.rstrip('/')
+    return host + path
+
+
+# 국가 도메인 아래에서 2단계 공개 접미사로 쓰이는 라벨 (예: co.uk, com.sa, ac.ae)
+SECOND_LEVEL_LABELS = {'co', 'com', 'net', 'org', 'gov', 'ac', 'edu', 'or', 'ne', 'go', 'gob', 'mil', 'ltd', 'plc'}
+
+
+def registrable_domain(url) -> str:
+    """
+    등록 가능 도메인 추출 (서브도메인 제거)
+
+    예: "https://shop.eu.acme.com/x" -> "acme.com", "www.acme.co.uk" -> "acme.co.uk"
+    공개 접미사 목록 없이 국가 도메인의 2단계 접미사만 근사 처리합니다.
+    """
+    host = normalize_website(url).split('/')[0].split(':')[0]
+    if not host or re.fullmatch(r'[\d.]+', host):
+        return host
+    labels = host.split('.')
+    if len(labels) <= 2:
+        return host
+    if len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
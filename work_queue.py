@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+SQLite 기반 연락처 수집 작업 큐 (여러 프로세스/호스트 분할 처리)
+
+업체마다 작업 행을 하나 만들고, 워커가 제한 시간이 있는 임대(lease)로 가져갑니다.
+- 임대는 BEGIN IMMEDIATE 트랜잭션으로 가져가므로 같은 업체를 두 워커가 동시에 받지 않습니다.
+- 처리 중에는 keep_alive()가 임대를 주기적으로 연장하고, 워커가 죽어 연장이 멈추면
+  만료된 임대를 다른 워커가 다시 가져갑니다.
+- 결과는 결과 저장소(results 테이블, 같은 SQLite 파일)에 임대 확인과 같은 트랜잭션으로 기록합니다.
+  임대를 잃은(다른 워커가 회수한) 워커의 결과는 기록되지 않으므로 업체마다 결과는 정확히 한 번 저장됩니다.
+
+같은 파일을 여러 프로세스가 열어 함께 처리할 수 있습니다. SQLite 잠금이 보장되지 않는 네트워크 파일 시스템
+대신, 여러 호스트에서는 shard=(번호, 개수)로 업체를 겹치지 않게 나눠 호스트마다 자기 파일을 쓰세요.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional, Tuple
+
+from result_store import SCHEMA as RESULTS_SCHEMA, UPSERT_SQL, STATUS_ERROR, upsert_params
+from url_utils import normalize_company, normalize_website
+
+# 작업 상태
+STATE_PENDING = 'pending'  # 처리 대기 (임대 가능)
+STATE_LEASED = 'leased'    # 워커가 처리 중 (lease_until까지)
+STATE_DONE = 'done'        # 결과 저장 완료
+STATE_FAILED = 'failed'    # 최대 시도 횟수 초과
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    company_key   TEXT NOT NULL,
+    website_key   TEXT NOT NULL,
+    company_name  TEXT NOT NULL,
+    website       TEXT NOT NULL,
+    shard         INTEGER NOT NULL,
+    state         TEXT NOT NULL DEFAULT 'pending',
+    owner         TEXT NOT NULL DEFAULT '',
+    lease_until   REAL NOT NULL DEFAULT 0,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    error         TEXT NOT NULL DEFAULT '',
+    updated_at    REAL NOT NULL,
+    PRIMARY KEY (company_key, website_key)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state, lease_until);
+"""
+
+# 이미 결과가 있는 업체는 바로 완료 처리 (오류 결과는 제외 - 다시 처리)
+MARK_DONE_SQL = """
+UPDATE jobs SET state = 'done', updated_at = ?
+WHERE state = 'pending' AND EXISTS (
+    SELECT 1 FROM results r WHERE r.company_key = jobs.company_key AND r.website_key = jobs.website_key
+      AND r.status != 'error'
+)
+"""
+
+# 대기 중이거나 임대가 만료된 작업 중 가장 먼저 등록된 것
+NEXT_JOB_SQL = """
+SELECT rowid, company_key, website_key, company_name, website, attempts, state FROM jobs
+WHERE (state = 'pending' OR (state = 'leased' AND lease_until < ?))
+  AND shard % ? = ?
+ORDER BY rowid LIMIT 1
+"""
+
+
+def default_worker_id(suffix: str = '') -> str:
+    """호스트:프로세스[:스레드] 워커 식별자"""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    return f"{worker_id}:{suffix}" if suffix else worker_id
+
+
+def shard_of(company_key: str, website_key: str) -> int:
+    """업체 키의 고정 해시 (프로세스/호스트와 무관하게 같은 값)"""
+    return zlib.crc32(f"{company_key}|{website_key}".encode('utf-8')) & 0x7fffffff
+
+
+class WorkQueue:
+    def __init__(self, db_path: str = "output/gitex_results.db", lease_seconds: float = 900,
+                 max_attempts: int = 3, shard: Optional[Tuple[int, int]] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로 - 결과 저장소(ResultStore)와 같은 파일을 씁니다.
+            lease_seconds: 임대 유효 시간(초) - keep_alive()가 1/3마다 연장
+            max_attempts: 업체별 최대 시도 횟수 (오류/임대 만료 포함)
+            shard: (번호, 개수) - 해시가 번호에 해당하는 업체만 임대 (None이면 전체)
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.shard_index, self.shard_count = shard or (0, 1)
+        if not 0 <= self.shard_index < self.shard_count:
+            raise ValueError(f"잘못된 shard 설정: {shard}")
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # 트랜잭션을 직접 관리 (BEGIN IMMEDIATE로 다른 프로세스와 쓰기 잠금 경쟁)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(RESULTS_SCHEMA)
+        self.conn.executescript(SCHEMA)
+
+        # 통계 (이 프로세스)
+        self.leased = 0
+        self.reclaimed = 0
+        self.completed = 0
+        self.lost = 0
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (다른 프로세스와 직렬화)"""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def enqueue(self, rows: Iterable[Tuple[str, str]]) -> int:
+        """
+        (업체명, 웹사이트) 목록 등록 - 이미 있는 업체는 무시하므로 여러 워커가 같은 목록을 넣어도 안전합니다.
+
+        Returns:
+            새로 등록한 작업 수
+        """
+        now = time.time()
+        params = []
+        for company_name, website in rows:
+            company_key, website_key = normalize_company(company_name), normalize_website(website)
+            params.append((company_key, website_key, company_name, website,
+                           shard_of(company_key, website_key), now))
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (company_key, website_key, company_name, website, shard, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", params
+            )
+            added = conn.total_changes - before
+            conn.execute(MARK_DONE_SQL, (now,))
+        return added
+
+    def lease(self, worker_id: str, wait: bool = True, poll_interval: float = 5.0) -> Optional[Dict]:
+        """
+        다음 작업 1개 임대 (만료된 임대도 회수) - 남은 작업이 없으면 None
+
+        wait=True면 대기 작업은 없지만 다른 워커가 임대 중인 작업이 있을 때 그 임대가 끝나거나
+        만료될 때까지 기다립니다 (죽은 워커의 작업을 회수하기 위해).
+        반환한 작업 dict의 owner/attempts는 complete()/fail()에서 임대 확인에 사용됩니다.
+        """
+        while True:
+            now = time.time()
+            job = None
+            next_expiry = None
+            with self._transaction() as conn:
+                row = conn.execute(NEXT_JOB_SQL, (now, self.shard_count, self.shard_index)).fetchone()
+                if row is None:
+                    next_expiry = conn.execute(
+                        "SELECT MIN(lease_until) FROM jobs WHERE state = ? AND shard % ? = ?",
+                        (STATE_LEASED, self.shard_count, self.shard_index)
+                    ).fetchone()[0]
+                else:
+                    rowid, company_key, website_key, company_name, website, attempts, state = row
+                    if attempts >= self.max_attempts:
+                        # 임대 중 죽은 워커가 남긴 마지막 시도 - 더 시도하지 않음
+                        conn.execute("UPDATE jobs SET state = ?, error = ?, updated_at = ? WHERE rowid = ?",
+                                     (STATE_FAILED, '임대 만료 (최대 시도 횟수 초과)', now, rowid))
+                        conn.execute(UPSERT_SQL, upsert_params(company_name, website, status=STATUS_ERROR,
+                                                               source='error', error='임대 만료'))
+                    else:
+                        conn.execute(
+                            "UPDATE jobs SET state = ?, owner = ?, lease_until = ?, attempts = attempts + 1, "
+                            "updated_at = ? WHERE rowid = ?",
+                            (STATE_LEASED, worker_id, now + self.lease_seconds, now, rowid)
+                        )
+                        job = {'company_key': company_key, 'website_key': website_key,
+                               'company_name': company_name, 'website': website,
+                               'owner': worker_id, 'attempts': attempts + 1}
+
+            if job is not None:
+                self.leased += 1
+                if state == STATE_LEASED:
+                    self.reclaimed += 1
+                    print(f"♻️ 만료된 임대 회수: {company_name} (시도 {job['attempts']}/{self.max_attempts})")
+                return job
+            if row is None:
+                if not wait or next_expiry is None:
+                    return None
+                time.sleep(min(max(next_expiry - time.time(), 0.0) + 0.05, poll_interval))
+
+    def _owns(self, conn, job: Dict) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM jobs WHERE company_key = ? AND website_key = ? AND state = ? AND owner = ? AND attempts = ?",
+            (job['company_key'], job['website_key'], STATE_LEASED, job['owner'], job['attempts'])
+        ).fetchone()
+        return row is not None
+
+    def renew(self, job: Dict) -> bool:
+        """임대 연장 - 이미 다른 워커가 회수했으면 False"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_until = ?, updated_at = ? "
+                "WHERE company_key = ? AND website_key = ? AND state = ? AND owner = ? AND attempts = ?",
+                (now + self.lease_seconds, now, job['company_key'], job['website_key'],
+                 STATE_LEASED, job['owner'], job['attempts'])
+            )
+            return cursor.rowcount == 1
+
+    @contextmanager
+    def keep_alive(self, job: Dict):
+        """블록을 실행하는 동안 lease_seconds/3마다 임대를 연장하는 스레드 실행"""
+        stop = threading.Event()
+
+        def renew_loop():
+            while not stop.wait(self.lease_seconds / 3):
+                try:
+                    if not self.renew(job):
+                        print(f"⚠️ 임대를 잃었습니다: {job['company_name']}")
+                        return
+                except sqlite3.Error as e:
+                    print(f"⚠️ 임대 연장 실패 (다음 주기에 재시도): {e}")
+
+        thread = threading.Thread(target=renew_loop, name=f"lease-{job['company_key'][:20]}", daemon=True)
+        thread.start()
+        try:
+            yield job
+        finally:
+            stop.set()
+            thread.join()
+
+    def complete(self, job: Dict, contact_email: str = '', contact_call: str = '',
+                 source: str = '', status: Optional[str] = None) -> bool:
+        """
+        임대를 아직 가지고 있으면 결과 저장 + 작업 완료 (한 트랜잭션)
+
+        Returns:
+            저장했으면 True, 임대를 잃어 결과를 버렸으면 False
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            if not self._owns(conn, job):
+                self.lost += 1
+                return False
+            conn.execute(UPSERT_SQL, upsert_params(job['company_name'], job['website'],
+                                                   contact_email, contact_call, status, source))
+            conn.execute(
+                "UPDATE jobs SET state = ?, lease_until = 0, error = '', updated_at = ? "
+                "WHERE company_key = ? AND website_key = ?",
+                (STATE_DONE, now, job['company_key'], job['website_key'])
+            )
+        self.completed += 1
+        return True
+
+    def fail(self, job: Dict, error: str) -> Optional[str]:
+        """
+        처리 오류 - 시도 횟수가 남았으면 대기 상태로 되돌리고, 아니면 오류 결과를 저장하고 실패 처리
+
+        Returns:
+            작업의 새 상태 - 다시 시도할 예정이면 STATE_PENDING, 시도 횟수를 다 썼으면 STATE_FAILED,
+            임대를 잃어 아무것도 바꾸지 않았으면 None (작업은 다른 워커가 가지고 있음)
+        """
+        now = time.time()
+        retry = job['attempts'] < self.max_attempts
+        with self._transaction() as conn:
+            if not self._owns(conn, job):
+                self.lost += 1
+                return None
+            if not retry:
+                conn.execute(UPSERT_SQL, upsert_params(job['company_name'], job['website'],
+                                                       status=STATUS_ERROR, source='error', error=error))
+            conn.execute(
+                "UPDATE jobs SET state = ?, owner = '', lease_until = 0, error = ?, updated_at = ? "
+                "WHERE company_key = ? AND website_key = ?",
+                (STATE_PENDING if retry else STATE_FAILED, error, now, job['company_key'], job['website_key'])
+            )
+        return STATE_PENDING if retry else STATE_FAILED
+
+    def release(self, job: Dict):
+        """처리하지 않고 반납 (중단 시) - 시도 횟수는 되돌림"""
+        with self._transaction() as conn:
+            if self._owns(conn, job):
+                conn.execute(
+                    "UPDATE jobs SET state = ?, owner = '', lease_until = 0, attempts = attempts - 1, updated_at = ? "
+                    "WHERE company_key = ? AND website_key = ?",
+                    (STATE_PENDING, time.time(), job['company_key'], job['website_key'])
+                )
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수 (이 워커의 shard 기준)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT state, COUNT(*) FROM jobs WHERE shard % ? = ? GROUP BY state",
+                (self.shard_count, self.shard_index)
+            ).fetchall()
+        return dict(rows)
+
+    def summary(self) -> str:
+        counts = self.counts()
+        states = ", ".join(f"{state} {counts.get(state, 0)}"
+                           for state in (STATE_PENDING, STATE_LEASED, STATE_DONE, STATE_FAILED))
+        return (f"{states} | 이 프로세스: 임대 {self.leased}, 회수 {self.reclaimed}, "
+                f"완료 {self.completed}, 임대 잃음 {self.lost}")